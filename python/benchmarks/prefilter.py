@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Rejection rate benchmark for the pair-sum prefilter.
+
+Builds ``PairSumFilter`` over random values spread far wider than the input
+is long, so almost no target has a pair, and queries random targets between
+the filter's bounds. Reports which layer backs the filter, the share of
+queries it rejected on its own and the time per query next to the exact
+search alone. Sizes on both sides of ``DEFAULT_MAX_SUMS`` show the Bloom
+layer giving way to residue masks, which reject almost nothing here.
+
+Usage:
+    uv run python benchmarks/prefilter.py [--sizes 1000,2896,2897,100000] [--queries N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fp_gym import two_sum_fast  # noqa: E402
+from fp_gym.prefilter import PairSumFilter  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: [int(size) for size in text.split(",")],
+        default=[1_000, 2_896, 2_897, 100_000],
+        help="comma-separated input lengths",
+    )
+    parser.add_argument("--queries", type=int, default=200, help="targets queried per size")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    args = parser.parse_args()
+
+    print(
+        f"{'n':>9}{'kind':>10}{'build ms':>11}{'rejected':>10}{'false pos':>11}"
+        f"{'filter us':>11}{'exact us':>10}"
+    )
+    for n in args.sizes:
+        rng = random.Random(args.seed)
+        nums = [rng.randrange(1 << 40) for _ in range(n)]
+
+        start = time.perf_counter()
+        f = PairSumFilter(nums)
+        build = time.perf_counter() - start
+
+        low, high = f.bounds
+        targets = [rng.randint(low, high) for _ in range(args.queries)]
+        start = time.perf_counter()
+        for target in targets:
+            f.first_pair(target)
+        filtered = (time.perf_counter() - start) / len(targets)
+        start = time.perf_counter()
+        for target in targets:
+            two_sum_fast(nums, target)
+        exact = (time.perf_counter() - start) / len(targets)
+
+        stats = f.stats
+        print(
+            f"{n:>9,}{f.kind:>10}{build * 1e3:>11.1f}{stats.avoided_rate:>10.1%}"
+            f"{stats.false_positives:>11}{filtered * 1e6:>11.1f}{exact * 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
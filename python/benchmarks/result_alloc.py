@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Allocation benchmark for TwoSumResult.
+
+Compares the original dict-backed result class with the slotted class, with
+and without the lazy-values fast path of ``two_sum_generator``. Reports the
+bytes retained per result (via tracemalloc) and pairs produced per second on a
+pair-dense input where every element completes a pair, both when each result
+is dropped as soon as it is seen and when all of them are kept in a list.
+
+Variants run in turns within each repetition, so drift in machine load hits
+them alike. One run on a single core (CPython 3.11, 1M elements, 9 repeats):
+
+    variant                 bytes/result  dropped/sec     kept/sec
+    dict (before)                  228.0    1,395,974      524,828
+    slots                          196.0    1,940,459      604,768
+    slots + lazy values            140.0    2,303,389      700,099
+
+Lazy values save one tuple per result: 29% less memory than eager slots,
+and 19% (dropped) and 16% (kept) more pairs per second; across runs the
+throughput gain over eager slots stayed between 10% and 35%.
+
+Usage:
+    uv run python benchmarks/result_alloc.py [--size N] [--repeat R]
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable, Generator, Iterable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fp_gym.solver import two_sum_generator  # noqa: E402
+
+
+class DictTwoSumResult:
+    """The result class as it was before slots: one ``__dict__`` and two tuples."""
+
+    def __init__(self, indices: tuple[int, int], values: tuple[int, int]) -> None:
+        self.indices = indices
+        self.values = values
+
+
+def dict_generator(nums: list[int], target: int) -> Generator[DictTwoSumResult]:
+    """The original generator loop producing dict-backed results."""
+    seen: dict[int, int] = {}
+    for i, num in enumerate(nums):
+        complement = target - num
+        if complement in seen:
+            j = seen[complement]
+            yield DictTwoSumResult(indices=(j, i), values=(complement, num))
+        seen[num] = i
+
+
+def slotted_eager(nums: list[int], target: int) -> Iterable[object]:
+    return two_sum_generator(nums, target)
+
+
+def slotted_lazy(nums: list[int], target: int) -> Iterable[object]:
+    return two_sum_generator(nums, target, lazy_values=True)
+
+
+VARIANTS: dict[str, Callable[[list[int], int], Iterable[object]]] = {
+    "dict (before)": dict_generator,
+    "slots": slotted_eager,
+    "slots + lazy values": slotted_lazy,
+}
+
+
+def bytes_per_result(
+    produce: Callable[[list[int], int], Iterable[object]], nums: list[int]
+) -> float:
+    """Memory retained by a list of results, per result."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    results = list(produce(nums, 0))
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list's own pointer array
+    return (after - before - sys.getsizeof(results)) / len(results)
+
+
+def drain_seconds(
+    produce: Callable[[list[int], int], Iterable[object]], nums: list[int], keep: bool
+) -> float:
+    """Time to drain the generator, optionally keeping every result."""
+    gc.collect()
+    start = time.perf_counter()
+    if keep:
+        results = list(produce(nums, 0))
+    else:
+        for _ in produce(nums, 0):
+            pass
+    seconds = time.perf_counter() - start
+    if keep:
+        del results
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000, help="input length")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repetitions")
+    args = parser.parse_args()
+
+    # Every element after the first completes a pair with its predecessor
+    nums = [0] * args.size
+
+    best = {(name, keep): float("inf") for name in VARIANTS for keep in (False, True)}
+    for _ in range(args.repeat):
+        for (name, keep), seconds in best.items():
+            best[name, keep] = min(seconds, drain_seconds(VARIANTS[name], nums, keep))
+
+    pairs = args.size - 1
+    print(f"{'variant':<22}{'bytes/result':>14}{'dropped/sec':>13}{'kept/sec':>13}")
+    for name, produce in VARIANTS.items():
+        size = bytes_per_result(produce, nums)
+        dropped, kept = pairs / best[name, False], pairs / best[name, True]
+        print(f"{name:<22}{size:>14.1f}{dropped:>13,.0f}{kept:>13,.0f}")
+
+
+if __name__ == "__main__":
+    main()
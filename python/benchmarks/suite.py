@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for fp_gym with JSON baselines and regression gating.
+
+Every case runs the public entry points (``two_sum``, ``two_sum_generator``,
+each ``TwoSumSolver`` method per backend, the k-sum methods and the
+``find_missing_repeating`` variants) over several input sizes and value distributions, and reports
+elements processed per second (median over trials).
+
+Baselines are machine specific and are not committed: record one on the
+machine that gates, then compare later runs against it.
+
+Usage:
+    uv run python benchmarks/suite.py --save .benchmarks/baseline.json
+    uv run python benchmarks/suite.py --compare .benchmarks/baseline.json --threshold 0.1
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fp_gym import TwoSumSolver, two_sum, two_sum_generator  # noqa: E402
+from fp_gym.arrays.find_missing_repeating import (  # noqa: E402
+    find_missing_repeating,
+    find_missing_repeating_chunked,
+    find_missing_repeating_optimal,
+    find_missing_repeating_threaded,
+    find_missing_repeating_vectorized,
+)
+from fp_gym.solver import Backend  # noqa: E402
+from fp_gym.threaded import gil_enabled  # noqa: E402
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    HAVE_NUMPY = False
+else:
+    HAVE_NUMPY = True
+
+DEFAULT_SIZES = (1_000, 100_000)
+TWO_SUM_DISTRIBUTIONS = ("uniform", "dense", "sorted", "no-pair")
+
+
+def two_sum_input(distribution: str, n: int, rng: random.Random) -> tuple[list[int], int]:
+    """An input list and target for one value distribution."""
+    if distribution == "uniform":
+        return [rng.randrange(10 * n) for _ in range(n)], 10 * n
+    if distribution == "dense":
+        return [rng.randrange(64) for _ in range(n)], 64
+    if distribution == "sorted":
+        return sorted(rng.randrange(10 * n) for _ in range(n)), 10 * n
+    if distribution == "no-pair":
+        # Even values and an odd target: every first-pair search scans everything
+        return [2 * rng.randrange(10 * n) for _ in range(n)], 1
+    raise ValueError(f"unknown distribution {distribution!r}")
+
+
+def missing_repeating_input(n: int, rng: random.Random) -> list[int]:
+    """A shuffled permutation of ``1..n`` with one value replaced by another."""
+    values = list(range(1, n + 1))
+    missing, repeating = rng.sample(values, 2)
+    values[missing - 1] = repeating
+    rng.shuffle(values)
+    return values
+
+
+def k_sum_input(spread: int, n: int, rng: random.Random) -> list[int]:
+    """Values in ``-spread..spread``, so combinations summing to 0 are plentiful."""
+    return [rng.randint(-spread, spread) for _ in range(n)]
+
+
+def drain(items: Iterable[Any]) -> None:
+    for _ in items:
+        pass
+
+
+def drain_method(
+    method: Callable[[list[int], int], Iterable[Any]], nums: list[int], target: int
+) -> None:
+    drain(method(nums, target))
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmarked callable; ``run`` receives ``(nums, target)``."""
+
+    name: str
+    run: Callable[[list[int], int], Any]
+    needs_numpy: bool = False
+    # Enumerating every pair is quadratic on inputs with many duplicates
+    exhaustive: bool = False
+
+
+def two_sum_cases() -> list[Case]:
+    cases = [
+        Case("two_sum", two_sum),
+        Case("two_sum_generator", lambda nums, t: drain(two_sum_generator(nums, t))),
+        Case(
+            "two_sum_generator[lazy]",
+            lambda nums, t: drain(two_sum_generator(nums, t, lazy_values=True)),
+        ),
+    ]
+    backends: tuple[Backend, ...] = ("python", "numpy", "auto")
+    for backend in backends:
+        solver = TwoSumSolver(backend)
+        needs_numpy = backend == "numpy"
+        prefix = f"TwoSumSolver[{backend}]"
+        cases += [
+            Case(f"{prefix}.find_all_pairs", solver.find_all_pairs, needs_numpy),
+            Case(f"{prefix}.find_first_pair", solver.find_first_pair, needs_numpy),
+            Case(f"{prefix}.find_first_pair_fast", solver.find_first_pair_fast, needs_numpy),
+            Case(f"{prefix}.count_pairs", solver.count_pairs, needs_numpy),
+            Case(
+                f"{prefix}.solve_with_stack_safety",
+                partial(drain_method, solver.solve_with_stack_safety),
+                needs_numpy,
+            ),
+        ]
+    # Threads run in parallel only on a free-threaded build (see benchmarks/threads.py)
+    thread = TwoSumSolver("thread")
+    cases += [
+        Case("TwoSumSolver[thread].find_all_pairs", thread.find_all_pairs),
+        Case("TwoSumSolver[thread].count_pairs", thread.count_pairs),
+    ]
+    solver = TwoSumSolver()
+    cases += [
+        Case("TwoSumSolver.find_all_pairs_arrays", solver.find_all_pairs_arrays, True),
+        Case("TwoSumSolver.build_index", lambda nums, t: solver.build_index(nums)),
+        Case(
+            "TwoSumSolver.build_index+query",
+            lambda nums, t: solver.build_index(nums).query_fast(t),
+        ),
+        Case(
+            "TwoSumSolver.count_pairs[exhaustive]",
+            lambda nums, t: solver.count_pairs(nums, t, exhaustive=True),
+        ),
+        Case(
+            "TwoSumSolver.iter_pair_chunks",
+            lambda nums, t: drain(solver.iter_pair_chunks(nums, t)),
+            exhaustive=True,
+        ),
+    ]
+    return cases
+
+
+MISSING_REPEATING_CASES = [
+    Case("find_missing_repeating", lambda arr, _: find_missing_repeating(arr)),
+    # The optimal variant marks visits in place, so it gets a copy
+    Case(
+        "find_missing_repeating_optimal",
+        lambda arr, _: find_missing_repeating_optimal(list(arr)),
+    ),
+    Case("find_missing_repeating_chunked", lambda arr, _: find_missing_repeating_chunked([arr])),
+    Case("find_missing_repeating_threaded", lambda arr, _: find_missing_repeating_threaded(arr)),
+    Case(
+        "find_missing_repeating_vectorized",
+        lambda arr, _: find_missing_repeating_vectorized(arr),
+        needs_numpy=True,
+    ),
+]
+
+
+# Spread of the wide k-sum case per input element: values are mostly distinct, so
+# the quadratic search itself dominates rather than the size of the output
+WIDE_SPREAD = 100
+
+# (case, value spread); 4-sums use a narrower spread to keep the output size in check,
+# and ``None`` stands for ``WIDE_SPREAD`` times the input size
+K_SUM_CASES: list[tuple[Case, int | None]] = [
+    (
+        Case("TwoSumSolver.find_k_sums[k=3]", partial(drain_method, TwoSumSolver().find_k_sums)),
+        1000,
+    ),
+    (
+        Case(
+            "TwoSumSolver.find_k_sums[k=4]",
+            lambda nums, t: drain(TwoSumSolver().find_k_sums(nums, t, k=4)),
+        ),
+        50,
+    ),
+    (Case("TwoSumSolver.closest_k_sum[k=3]", TwoSumSolver().closest_k_sum), 1000),
+    (
+        Case("TwoSumSolver.find_k_sums[k=3]", partial(drain_method, TwoSumSolver().find_k_sums)),
+        None,
+    ),
+]
+
+
+def measure(run: Callable[[], Any], trials: int, min_time: float) -> float:
+    """Median seconds per call over ``trials`` timed batches, GC disabled."""
+    run()  # warm up caches and lazy imports
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        if time.perf_counter() - start >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+
+    samples = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(trials):
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            samples.append((time.perf_counter() - start) / number)
+    finally:
+        gc.enable()
+    return statistics.median(samples)
+
+
+def run_suite(
+    sizes: Iterable[int], trials: int, min_time: float, pattern: str | None, seed: int
+) -> dict[str, dict[str, float]]:
+    """Run every selected case; keys are ``name/distribution/size``."""
+    jobs: list[tuple[Case, str, list[int], int]] = []
+    for n in sizes:
+        for distribution in TWO_SUM_DISTRIBUTIONS:
+            nums, target = two_sum_input(distribution, n, random.Random(seed))
+            for case in two_sum_cases():
+                if not (case.exhaustive and distribution == "dense"):
+                    jobs.append((case, distribution, nums, target))
+        arr = missing_repeating_input(n, random.Random(seed))
+        jobs += [(case, "permutation", arr, 0) for case in MISSING_REPEATING_CASES]
+        for case, spread in K_SUM_CASES:
+            label = f"spread{spread}" if spread is not None else f"spread{WIDE_SPREAD}n"
+            nums = k_sum_input(spread or WIDE_SPREAD * n, n, random.Random(seed))
+            jobs.append((case, label, nums, 0))
+
+    results: dict[str, dict[str, float]] = {}
+    for case, distribution, nums, target in jobs:
+        key = f"{case.name}/{distribution}/{len(nums)}"
+        if (pattern and pattern not in key) or (case.needs_numpy and not HAVE_NUMPY):
+            continue
+        seconds = measure(partial(case.run, nums, target), trials, min_time)
+        results[key] = {"seconds": seconds, "throughput": len(nums) / seconds}
+        print(f"{key:<70}{seconds * 1e3:>12.3f} ms{len(nums) / seconds:>16,.0f} /s")
+    return results
+
+
+def compare(
+    current: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float
+) -> list[str]:
+    """Keys whose throughput fell more than ``threshold`` below the baseline."""
+    regressions = []
+    print(f"\n{'case':<70}{'baseline':>16}{'current':>16}{'change':>10}")
+    for key, result in current.items():
+        if key not in baseline:
+            print(f"{key:<70}{'(new)':>16}")
+            continue
+        before, after = baseline[key]["throughput"], result["throughput"]
+        change = after / before - 1
+        flag = ""
+        if change < -threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<70}{before:>16,.0f}{after:>16,.0f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=lambda text: [int(size) for size in text.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="comma-separated input lengths",
+    )
+    parser.add_argument("--trials", type=int, default=5, help="timed trials per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="seconds per trial")
+    parser.add_argument("-k", dest="pattern", help="only run cases whose key contains this")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to gate against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="allowed throughput drop (fraction)"
+    )
+    args = parser.parse_args()
+
+    results = run_suite(args.sizes, args.trials, args.min_time, args.pattern, args.seed)
+
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        meta = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "numpy": HAVE_NUMPY,
+            "gil": gil_enabled(),
+        }
+        args.save.write_text(json.dumps({"meta": meta, "results": results}, indent=2) + "\n")
+        print(f"\nBaseline written to {args.save}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+            return 1
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
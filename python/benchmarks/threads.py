@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Thread scaling benchmark for the thread backend.
+
+Times ``TwoSumSolver("thread")`` (all pairs and counting) and
+``find_missing_repeating_threaded`` at increasing thread counts, reporting
+the median time and the speedup over one thread. Run it under both the
+default and the free-threaded interpreter to compare: with the GIL the
+threads only take turns, so speedups stay at or below 1; without it they
+should approach the number of cores.
+
+Usage:
+    uv run --python 3.13 python benchmarks/threads.py [--size N] [--threads 1,2,4,8]
+    uv run --python 3.13t python benchmarks/threads.py [--size N] [--threads 1,2,4,8]
+"""
+
+import argparse
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from fp_gym.arrays.find_missing_repeating import find_missing_repeating_threaded  # noqa: E402
+from fp_gym.threaded import count_pairs_threaded, gil_enabled, two_sum_threaded  # noqa: E402
+
+
+def median_seconds(run: Callable[[], Any], trials: int) -> float:
+    run()  # warm up
+    samples = []
+    for _ in range(trials):
+        start = time.perf_counter()
+        run()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size", type=int, default=1_000_000, help="input length")
+    parser.add_argument(
+        "--threads",
+        type=lambda text: [int(count) for count in text.split(",")],
+        default=[1, 2, 4, 8],
+        help="comma-separated thread counts",
+    )
+    parser.add_argument("--trials", type=int, default=3, help="timed trials per case")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    n = args.size
+    nums = [rng.randrange(10 * n) for _ in range(n)]
+    permutation = list(range(1, n + 1))
+    permutation[0] = 2
+    rng.shuffle(permutation)
+
+    print(
+        f"{platform.python_implementation()} {platform.python_version()}, "
+        f"GIL {'enabled' if gil_enabled() else 'disabled'}, {os.cpu_count()} CPUs, n={n:,}"
+    )
+    print(f"{'case':<34}{'threads':>8}{'ms':>12}{'speedup':>10}")
+    cases: dict[str, Callable[[int, ThreadPoolExecutor], Any]] = {
+        "find_all_pairs": lambda workers, pool: two_sum_threaded(
+            nums, 10 * n, workers, executor=pool
+        ),
+        "count_pairs": lambda workers, pool: count_pairs_threaded(
+            nums, 10 * n, workers, executor=pool
+        ),
+        "find_missing_repeating": lambda workers, pool: find_missing_repeating_threaded(
+            permutation, workers, executor=pool
+        ),
+    }
+    for name, case in cases.items():
+        baseline = None
+        for workers in args.threads:
+            # One pool per thread count, so pool start-up is not timed
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                seconds = median_seconds(partial(case, workers, pool), args.trials)
+            baseline = baseline or seconds
+            print(f"{name:<34}{workers:>8}{seconds * 1e3:>12.1f}{baseline / seconds:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
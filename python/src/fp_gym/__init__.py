@@ -1,5 +1,16 @@
 """Two Sum module with generator-based implementation."""
 
-from .solver import TwoSumSolver, two_sum, two_sum_generator
+from .incremental import IncrementalTwoSumIndex
+from .index import TwoSumIndex
+from .snapshot import MappedTwoSumIndex
+from .solver import TwoSumSolver, two_sum, two_sum_fast, two_sum_generator
 
-__all__ = ["TwoSumSolver", "two_sum", "two_sum_generator"]
+__all__ = [
+    "IncrementalTwoSumIndex",
+    "MappedTwoSumIndex",
+    "TwoSumIndex",
+    "TwoSumSolver",
+    "two_sum",
+    "two_sum_fast",
+    "two_sum_generator",
+]
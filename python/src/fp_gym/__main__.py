@@ -0,0 +1,7 @@
+"""``python -m fp_gym``: run the command line interface."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
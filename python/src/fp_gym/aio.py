@@ -0,0 +1,252 @@
+"""
+Asyncio front-end for serving many two sum requests concurrently.
+
+``AsyncTwoSumSolver`` collects requests arriving on the event loop into
+micro-batches (up to ``max_batch`` requests, or whatever arrived within
+``max_delay`` seconds of the first one) and solves each batch in an executor,
+so the loop itself never runs CPU-bound work.
+
+Backpressure comes from a bounded request queue: once ``max_pending`` requests
+are waiting, further ``solve`` calls wait for room instead of piling up, and
+at most ``max_inflight`` batches occupy the executor at a time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from .solver import Backend, TwoSumResult, TwoSumSolver, _maybe
+
+if TYPE_CHECKING:
+    from returns.maybe import Maybe
+
+    from .dispatch import Thresholds
+
+Job = tuple[Sequence[int], int]
+
+
+@dataclass
+class BatchStats:
+    """Counters describing how requests were batched."""
+
+    requests: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+
+
+def _solve_batch(solver: TwoSumSolver, jobs: list[Job]) -> list[TwoSumResult | None]:
+    """Thread executor entry point."""
+    return [solver.find_first_pair_fast(nums, target) for nums, target in jobs]
+
+
+def _solve_batch_remote(
+    backend: Backend, workers: int | None, thresholds: Thresholds | None, jobs: list[Job]
+) -> list[TwoSumResult | None]:
+    """Process pool entry point: rebuilds the solver from picklable settings."""
+    from .dispatch import Dispatcher
+
+    dispatcher = None if thresholds is None else Dispatcher(thresholds)
+    return _solve_batch(TwoSumSolver(backend, workers, dispatcher), jobs)
+
+
+class AsyncTwoSumSolver:
+    """
+    Micro-batching async wrapper around a TwoSumSolver.
+
+    Example:
+        >>> async with AsyncTwoSumSolver() as solver:
+        ...     result = await solver.solve([2, 7, 11, 15], 9)
+    """
+
+    def __init__(
+        self,
+        solver: TwoSumSolver | None = None,
+        *,
+        executor: Executor | None = None,
+        max_batch: int = 64,
+        max_delay: float = 0.001,
+        max_pending: int = 1024,
+        max_inflight: int = 4,
+    ) -> None:
+        """
+        Configure the front-end; nothing starts until first use.
+
+        Args:
+            solver: Solver run for every request (defaults to ``TwoSumSolver()``)
+            executor: Where batches run; None uses the loop's default thread
+                pool. Pass a ``ProcessPoolExecutor`` for CPU parallelism:
+                workers then rebuild the solver from its backend, ``workers``
+                and dispatcher thresholds, and its cache, stats callback and
+                dense tables stay unused in this process.
+            max_batch: Most requests solved in one executor call
+            max_delay: Seconds to wait for more requests after the first one
+            max_pending: Requests queued before ``solve`` starts waiting
+            max_inflight: Batches allowed in the executor at the same time
+        """
+        if max_batch < 1 or max_pending < 1 or max_inflight < 1:
+            raise ValueError("max_batch, max_pending and max_inflight must be positive")
+        if max_delay < 0:
+            raise ValueError("max_delay must not be negative")
+        self.solver = solver or TwoSumSolver()
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_pending = max_pending
+        self.max_inflight = max_inflight
+        self.stats = BatchStats()
+        self._queue: asyncio.Queue[tuple[Job, asyncio.Future[TwoSumResult | None]]] | None = None
+        self._batcher: asyncio.Task[None] | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._slots: asyncio.Semaphore | None = None
+
+    def _batch_runner(self) -> Callable[[list[Job]], list[TwoSumResult | None]]:
+        """What the executor runs per batch; process pools get picklable settings only."""
+        solver = self.solver
+        if isinstance(self.executor, ProcessPoolExecutor):
+            dispatcher = solver._dispatcher
+            thresholds = None if dispatcher is None else dispatcher.thresholds
+            return partial(_solve_batch_remote, solver.backend, solver.workers, thresholds)
+        return partial(_solve_batch, solver)
+
+    async def __aenter__(self) -> Self:
+        self._start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def _start(self) -> None:
+        if self._batcher is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._slots = asyncio.Semaphore(self.max_inflight)
+            self._batcher = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop batching, cancel requests not yet dispatched and wait for running batches."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            await asyncio.gather(self._batcher, return_exceptions=True)
+            self._batcher = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                future.cancel()
+
+    @property
+    def pending(self) -> int:
+        """Requests queued but not yet picked up by a batch."""
+        return 0 if self._queue is None else self._queue.qsize()
+
+    async def solve_fast(self, nums: Sequence[int], target: int) -> TwoSumResult | None:
+        """
+        Find the first pair without blocking the event loop.
+
+        Args:
+            nums: List of integers to search
+            target: Target sum value
+
+        Returns:
+            The first TwoSumResult, or None if not found
+        """
+        self._start()
+        assert self._queue is not None
+        future: asyncio.Future[TwoSumResult | None] = asyncio.get_running_loop().create_future()
+        await self._queue.put(((nums, target), future))
+        self.stats.requests += 1
+        return await future
+
+    async def solve(self, nums: Sequence[int], target: int) -> Maybe[TwoSumResult]:
+        """
+        Find the first pair without blocking the event loop.
+
+        Args:
+            nums: List of integers to search
+            target: Target sum value
+
+        Returns:
+            Maybe[TwoSumResult]: Some(result) if found, Nothing if not found
+        """
+        return _maybe(await self.solve_fast(nums, target))
+
+    async def solve_many(self, jobs: Iterable[Job]) -> list[Maybe[TwoSumResult]]:
+        """
+        Solve several ``(nums, target)`` jobs concurrently.
+
+        Args:
+            jobs: Pairs of input list and target
+
+        Returns:
+            One Maybe[TwoSumResult] per job, in the same order
+        """
+        return list(await asyncio.gather(*(self.solve(nums, target) for nums, target in jobs)))
+
+    async def _run(self) -> None:
+        """Batcher loop: gather a micro-batch, then hand it to the executor."""
+        assert self._queue is not None and self._slots is not None
+        queue, loop = self._queue, asyncio.get_running_loop()
+        run = self._batch_runner()
+        batch: list[tuple[Job, asyncio.Future[TwoSumResult | None]]] = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_batch:
+                    if queue.empty():
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        try:
+                            batch.append(await asyncio.wait_for(queue.get(), remaining))
+                        except TimeoutError:
+                            break
+                    else:
+                        batch.append(queue.get_nowait())
+
+                await self._slots.acquire()
+                task = loop.create_task(self._dispatch(run, batch))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+                batch = []
+        finally:
+            # Requests taken off the queue but not yet dispatched (``close``)
+            for _, future in batch:
+                future.cancel()
+
+    async def _dispatch(
+        self,
+        run: Callable[[list[Job]], list[TwoSumResult | None]],
+        batch: list[tuple[Job, asyncio.Future[TwoSumResult | None]]],
+    ) -> None:
+        assert self._slots is not None
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+        jobs = [job for job, _ in batch]
+        try:
+            loop = asyncio.get_running_loop()
+            results = await loop.run_in_executor(self.executor, run, jobs)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+        else:
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            # Only left unresolved when this task itself was cancelled
+            for _, future in batch:
+                future.cancel()
+            self._slots.release()
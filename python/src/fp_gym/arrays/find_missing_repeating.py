@@ -15,12 +15,53 @@ Output: 1, 5
 Explanation: 5 is missing and 1 is repeating.
 """
 
+from __future__ import annotations
 
-def find_missing_repeating(arr: list[int]) -> tuple[int, int]:
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
+from concurrent.futures import Executor
+from functools import partial
+from operator import mul
+from typing import TYPE_CHECKING, Any
+
+from ..buffers import int_sequence
+
+if TYPE_CHECKING:
+    from ..profiling import SolveStats
+
+# Modular sums are exact while 2 * n**2 stays below 2**63, i.e. n <= 2**31
+_WORD = 1 << 64
+_MODULAR_LIMIT = 1 << 31
+
+# Elements summed per task by the threaded variant
+_THREAD_CHUNK = 1 << 16
+
+
+def _recorded(
+    stats: SolveStats,
+    operation: str,
+    run: Callable[[], tuple[int, int]],
+    scanned: int = 0,
+    table: int = 0,
+) -> tuple[int, int]:
+    """Run one variant under ``fp_gym.profiling.timed``, naming the outermost call."""
+    from ..profiling import timed
+
+    stats.operation = stats.operation or operation
+    result: tuple[int, int] = timed(stats, run, scanned, table=table)
+    return result
+
+
+def find_missing_repeating(
+    arr: Sequence[int], *, stats: SolveStats | None = None
+) -> tuple[int, int]:
+    if stats is not None:
+        # The set ends up holding every value but the repeated one
+        run = partial(find_missing_repeating, arr)
+        return _recorded(stats, "find_missing_repeating", run, len(arr), max(len(arr) - 1, 0))
     seen = set()
     duplicate = -1
 
-    for num in arr:
+    for num in int_sequence(arr):
         if num in seen:
             duplicate = num
         else:
@@ -33,7 +74,20 @@ def find_missing_repeating(arr: list[int]) -> tuple[int, int]:
     return (missing, duplicate)
 
 
-def find_missing_repeating_optimal(arr: list[int]) -> tuple[int, int]:
+def find_missing_repeating_optimal(
+    arr: MutableSequence[int], *, stats: SolveStats | None = None
+) -> tuple[int, int]:
+    """
+    Mark visited values by negating their slot, in place.
+
+    ``arr`` is modified: a list, an ``array('q')`` or any writable signed
+    integer buffer (a NumPy int64 array, say), whose own memory is marked.
+    """
+    if stats is not None:
+        run = partial(find_missing_repeating_optimal, arr)
+        return _recorded(stats, "find_missing_repeating_optimal", run, len(arr))
+    if type(arr) is not list:
+        arr = int_sequence(arr)  # type: ignore[assignment]
     n: int = len(arr)
     repeating_element: int = -1
 
@@ -57,3 +111,167 @@ def find_missing_repeating_optimal(arr: list[int]) -> tuple[int, int]:
             break
 
     return (missing_element, repeating_element)
+
+
+def find_missing_repeating_chunked(
+    chunks: Iterable[Sequence[int]], *, stats: SolveStats | None = None
+) -> tuple[int, int]:
+    """
+    Streaming variant over consecutive chunks of the array.
+
+    Only the running sum and sum of squares are kept, so memory does not grow
+    with the input and nothing is mutated. With ``d = repeating - missing``
+    and ``s = repeating + missing``, the sums exceed those of ``1..n`` by ``d``
+    and ``d * s`` respectively.
+
+    With ``stats``, elements are counted as chunks arrive and the call is timed
+    (see ``fp_gym.profiling``).
+    """
+    if stats is not None:
+        from ..profiling import counted
+
+        run = partial(find_missing_repeating_chunked, counted(chunks, stats))
+        return _recorded(stats, "find_missing_repeating_chunked", run)
+    return _from_totals(map(_totals, map(int_sequence, chunks)))
+
+
+def find_missing_repeating_threaded(
+    arr: Sequence[int],
+    workers: int | None = None,
+    *,
+    executor: Executor | None = None,
+    stats: SolveStats | None = None,
+) -> tuple[int, int]:
+    """
+    ``find_missing_repeating_chunked`` with the chunks summed on a thread pool.
+
+    Threads only run in parallel on free-threaded builds, so without
+    ``workers`` the sums stay on the calling thread while the GIL is enabled
+    (see ``fp_gym.threaded``). Chunks are sliced as each thread reaches them,
+    keeping at most one chunk per thread in memory for lists.
+
+    Args:
+        arr: The array, or any integer buffer; not mutated
+        workers: Threads to use, at least 1 (defaults to ``default_workers()``)
+        executor: Existing thread pool to reuse instead of starting one
+        stats: Record timings here (see ``fp_gym.profiling``)
+
+    Raises:
+        ValueError: If ``workers`` is below 1
+    """
+    if stats is not None:
+        run = partial(find_missing_repeating_threaded, arr, workers, executor=executor)
+        return _recorded(stats, "find_missing_repeating_threaded", run, len(arr))
+    from ..threaded import chunk_bounds, resolve_workers, thread_pool
+
+    nums = int_sequence(arr)
+    workers = resolve_workers(workers)
+    if workers < 2:
+        return _from_totals([_totals(nums)])
+    parts = max(workers, -(-len(nums) // _THREAD_CHUNK))
+    with thread_pool(workers, executor) as pool:
+        return _from_totals(
+            pool.map(
+                lambda bounds: _totals(nums[bounds[0] : bounds[1]]),
+                chunk_bounds(len(nums), parts),
+            )
+        )
+
+
+def _totals(chunk: Sequence[int]) -> tuple[int, int, int]:
+    """Length, sum and sum of squares of one chunk."""
+    return (len(chunk), sum(chunk), sum(map(mul, chunk, chunk)))
+
+
+def _from_totals(totals: Iterable[tuple[int, int, int]]) -> tuple[int, int]:
+    """Combine chunk totals and recover the pair from the excess over ``1..n``."""
+    n = 0
+    total = 0
+    squares = 0
+    for size, chunk_total, chunk_squares in totals:
+        n += size
+        total += chunk_total
+        squares += chunk_squares
+
+    difference = total - n * (n + 1) // 2
+    return _from_differences(difference, squares - n * (n + 1) * (2 * n + 1) // 6)
+
+
+def _from_differences(difference: int, square_difference: int) -> tuple[int, int]:
+    """Recover the pair from ``repeating - missing`` and the square-sum excess."""
+    if difference == 0:
+        raise ValueError("input has no repeating element")
+    both = square_difference // difference
+    repeating = (both + difference) // 2
+    return (repeating - difference, repeating)
+
+
+def _signed(word: int) -> int:
+    """Interpret an unsigned 64-bit residue as a signed value."""
+    return word - _WORD if word >= _WORD >> 1 else word
+
+
+def _chunk_sums(chunk: Any) -> tuple[int, int, int]:
+    """Length, sum and sum of squares of one chunk, modulo 2**64."""
+    import numpy as np
+
+    values = np.asarray(chunk).reshape(-1)
+    if values.size == 0:
+        return (0, 0, 0)
+    if values.dtype.kind not in "iu":
+        raise TypeError(f"expected integer data, got dtype {values.dtype}")
+    # Reinterpreting int64 as uint64 is free; the wrapped sums stay exact mod 2**64
+    words = values.view(np.uint64) if values.dtype.itemsize == 8 else values.astype(np.uint64)
+    return (values.size, int(words.sum(dtype=np.uint64)), int(np.dot(words, words)))
+
+
+def find_missing_repeating_vectorized_chunked(
+    chunks: Iterable[Any], *, stats: SolveStats | None = None
+) -> tuple[int, int]:
+    """
+    NumPy variant of ``find_missing_repeating_chunked``.
+
+    Chunks may be NumPy arrays, ``memoryview`` or ``array.array`` buffers, or
+    lists. Sums are accumulated modulo 2**64 in ``uint64``; the true
+    differences are below 2**63 in magnitude for ``n <= 2**31``, so they are
+    recovered exactly. Int64 buffers are read in place, so beyond the chunks
+    themselves only O(1) memory is used and nothing is mutated. ``stats`` is
+    filled in as for ``find_missing_repeating_chunked``.
+
+    Raises:
+        OverflowError: If the input holds more than 2**31 elements
+        TypeError: If a chunk does not hold integers
+    """
+    if stats is not None:
+        from ..profiling import counted
+
+        run = partial(find_missing_repeating_vectorized_chunked, counted(chunks, stats))
+        return _recorded(stats, "find_missing_repeating_vectorized_chunked", run)
+    n = 0
+    total = 0
+    squares = 0
+    for chunk in chunks:
+        size, chunk_total, chunk_squares = _chunk_sums(chunk)
+        n += size
+        total += chunk_total
+        squares += chunk_squares
+
+    if n > _MODULAR_LIMIT:
+        raise OverflowError("input too long for 64-bit sums, use the chunked variant")
+    difference = _signed((total - n * (n + 1) // 2) % _WORD)
+    square_difference = _signed((squares - n * (n + 1) * (2 * n + 1) // 6) % _WORD)
+    return _from_differences(difference, square_difference)
+
+
+def find_missing_repeating_vectorized(
+    arr: Any, *, stats: SolveStats | None = None
+) -> tuple[int, int]:
+    """
+    NumPy variant for a whole array (or any integer buffer) at once.
+
+    An int64 array, ``memoryview`` or ``array('q')`` is processed without a
+    copy; see ``find_missing_repeating_vectorized_chunked``.
+    """
+    if stats is not None:
+        stats.operation = stats.operation or "find_missing_repeating_vectorized"
+    return find_missing_repeating_vectorized_chunked([arr], stats=stats)
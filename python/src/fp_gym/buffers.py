@@ -0,0 +1,68 @@
+"""
+Zero-copy integer inputs.
+
+The solvers accept any ``Sequence[int]`` and any object exporting the buffer
+protocol: ``array.array``, ``memoryview``, ``bytes``/``bytearray``, ``mmap``
+or NumPy arrays. ``int_sequence`` turns the latter into a one-dimensional
+``memoryview`` over the same memory, so pure-Python loops index and iterate
+the raw buffer and get plain ``int`` elements, without first building a
+``list`` (or NumPy scalars, which hash and compare several times slower).
+
+Lists, tuples and ranges are returned as they are, and so is anything that is
+not an integer buffer, so callers can normalize unconditionally.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, cast, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    IntegerInput = Sequence[int] | Buffer
+
+# Native integer formats of the struct module, as reported by memoryview
+_INTEGER_FORMATS = frozenset("bBhHiIlLqQnN")
+
+
+@overload
+def int_sequence(nums: IntegerInput) -> Sequence[int]: ...
+
+
+@overload
+def int_sequence(nums: Iterable[int]) -> Iterable[int]: ...
+
+
+def int_sequence(nums: Iterable[int] | IntegerInput) -> Iterable[int]:
+    """
+    View ``nums`` as a flat sequence of ints without copying.
+
+    Args:
+        nums: A sequence of ints or any integer buffer; multi-dimensional
+            buffers must be C-contiguous. Other iterables are accepted too.
+
+    Returns:
+        ``nums`` itself for lists, tuples, ranges and ``array.array``,
+        otherwise a ``memoryview`` of its native integer elements; inputs
+        that are neither are returned unchanged
+    """
+    unchanged = cast("Iterable[int]", nums)
+    if type(nums) is list or isinstance(nums, tuple | range | array):
+        return unchanged
+    try:
+        view = memoryview(nums)  # type: ignore[arg-type]
+    except TypeError:
+        return unchanged
+    code = view.format.lstrip("@")
+    if code not in _INTEGER_FORMATS or view.ndim == 0:
+        # Floats, structs and byte-swapped data keep their own element access
+        view.release()
+        return unchanged
+    if view.ndim > 1:
+        if not view.c_contiguous:
+            view.release()
+            return unchanged
+        view = view.cast("B").cast(code)  # type: ignore[call-overload]
+    return view
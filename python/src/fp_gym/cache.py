@@ -0,0 +1,222 @@
+"""
+Memoization of solver results keyed by input content.
+
+``fingerprint`` hashes the contents of ``nums`` (128-bit xxh3 when the
+optional ``xxhash`` package is installed, BLAKE2b otherwise). Buffers such as
+NumPy arrays, ``array('q')`` and ``memoryview`` are hashed in place; lists
+are packed into an ``array('q')`` first.
+
+``ResultCache`` maps ``(operation, fingerprint, target)`` to a result with a
+bounded LRU, an optional TTL and hit/miss counters. All operations take a
+lock, so one cache can be shared between threads, and so can a solver
+holding it: the solver's engines keep no per-call state of their own (each
+``dense`` call borrows its own table, see ``fp_gym.dense``), only
+``last_choice`` is shared and reflects whichever call dispatched last.
+Results are computed outside the lock: two threads missing on the same key
+may both compute it, and the last one stored wins.
+
+With ``trust_identity=True`` the fingerprint itself is memoized per object
+identity, so re-submitting the very same list skips hashing. That is only
+valid if inputs are not mutated between calls.
+"""
+
+import hashlib
+import pickle
+import threading
+import time
+import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+T = TypeVar("T")
+
+Fingerprint = tuple[int, str, bytes]
+
+_MISSING = object()
+
+
+def _digest(data: Any) -> bytes:
+    if xxhash is not None:
+        digest: bytes = xxhash.xxh3_128_digest(data)
+        return digest
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _kind(view: memoryview) -> str:
+    """Element type independent of the platform's format letter (``l`` vs ``q``)."""
+    code = view.format.lstrip("@=<>!")
+    if code in ("b", "h", "i", "l", "q", "n"):
+        return f"i{view.itemsize}"
+    if code in ("B", "H", "I", "L", "Q", "N"):
+        return f"u{view.itemsize}"
+    return view.format
+
+
+def fingerprint(nums: Sequence[int] | Any) -> Fingerprint:
+    """
+    Content fingerprint of ``nums``: length, element format and a 128-bit digest.
+
+    Args:
+        nums: A sequence of ints or any C-contiguous integer buffer
+
+    Returns:
+        A hashable fingerprint; equal contents of the same integer width
+        give equal fingerprints
+    """
+    try:
+        view = memoryview(nums)  # type: ignore[arg-type]
+    except TypeError:
+        try:
+            view = memoryview(array("q", nums))
+        except (OverflowError, TypeError):
+            # Values beyond int64 (or not ints at all): hash a serialization
+            return (len(nums), "pickle", _digest(pickle.dumps(list(nums), protocol=5)))
+    data = view if view.c_contiguous else view.tobytes()
+    return (len(view), _kind(view), _digest(data))
+
+
+@dataclass
+class CacheStats:
+    """Counters updated by a ResultCache."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Thread-safe LRU/TTL cache of solver results.
+
+    Example:
+        >>> solver = TwoSumSolver(cache=ResultCache(maxsize=1024, ttl=60))
+        >>> solver.find_first_pair(nums, 9)  # computed
+        >>> solver.find_first_pair(nums, 9)  # served from the cache
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float | None = None,
+        *,
+        trust_identity: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Configure the cache.
+
+        Args:
+            maxsize: Most results kept; the least recently used goes first
+            ttl: Seconds a result stays valid (None: until evicted)
+            trust_identity: Memoize fingerprints per input object; inputs
+                must then not be mutated between calls
+            clock: Time source for ``ttl``
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.trust_identity = trust_identity
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._identities: OrderedDict[int, tuple[Any, Fingerprint]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._identities.clear()
+
+    def fingerprint(self, nums: Sequence[int] | Any) -> Fingerprint:
+        """``fingerprint(nums)``, memoized per object when ``trust_identity`` is set."""
+        if not self.trust_identity:
+            return fingerprint(nums)
+        key = id(nums)
+        with self._lock:
+            entry = self._identities.get(key)
+            if entry is not None:
+                ref, known = entry
+                if (ref() if isinstance(ref, weakref.ref) else ref) is nums:
+                    self._identities.move_to_end(key)
+                    return known
+        computed = fingerprint(nums)
+        try:
+            ref = weakref.ref(nums)
+        except TypeError:
+            # Lists and tuples cannot be weakly referenced; holding them keeps
+            # the id from being reused while the entry lives
+            ref = nums
+        with self._lock:
+            self._identities[key] = (ref, computed)
+            if len(self._identities) > self.maxsize:
+                self._identities.popitem(last=False)
+        return computed
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live entry for ``key`` (counting a hit or miss), else ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored = entry
+                if self.ttl is not None and self.clock() - stored > self.ttl:
+                    del self._entries[key]
+                    self.stats.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+            self.stats.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = (value, self.clock())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def lookup(
+        self, operation: Hashable, nums: Sequence[int] | Any, target: int, compute: Callable[[], T]
+    ) -> T:
+        """
+        Return the cached result of ``operation`` on ``(nums, target)``, computing it on a miss.
+
+        Args:
+            operation: Distinguishes methods (and options) sharing the cache
+            nums: Input, identified by content
+            target: Target sum value
+            compute: Produces the result on a miss
+
+        Returns:
+            The cached or freshly computed result
+        """
+        key = (operation, self.fingerprint(nums), target)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        result: T = value
+        return result
@@ -0,0 +1,376 @@
+"""
+Command line interface: ``fp-gym two-sum`` and ``fp-gym missing-repeating``.
+
+Inputs are files (``-`` for stdin) holding integer streams:
+
+* ``text``: integers separated by any mix of whitespace, commas and
+  newlines, i.e. one-per-line and CSV alike. With ``--rows`` every line is a
+  separate array.
+* ``binary``: native-endian int64 words, raw or ``.npy`` (detected by its
+  magic bytes).
+
+Each array is one job for ``missing-repeating``. For ``two-sum`` each array
+is paired with every ``--target`` (or, with ``--target-first``, with the first
+integer of its row), so one invocation can solve many jobs. Results are
+written in input order as JSON lines or as fixed-size int64 records, and
+``--jobs N`` solves jobs in N worker processes.
+
+Text is parsed in bulk (one read, one split, ``int`` over the tokens) and
+binary input is copied into ``array('q')`` with a single ``frombytes``.
+Only ``argparse`` and the lightweight core modules are imported at startup;
+solver engines, NumPy, ``json`` and the process pool are imported when first
+needed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cache
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
+
+if TYPE_CHECKING:
+    from array import array
+
+# Binary record layouts, one int64 per field
+RECORD_FIELDS = {
+    "first": ("job", "left", "right"),
+    "all": ("job", "left", "right"),
+    "count": ("job", "count"),
+    "missing-repeating": ("job", "missing", "repeating"),
+}
+
+# Jobs handed to each worker at a time when solving in parallel
+_POOL_CHUNK = 16
+
+
+class Job(NamedTuple):
+    """One array (and target) to solve, with where it came from."""
+
+    number: int
+    source: str
+    row: int | None
+    nums: Sequence[int]
+    target: int | None = None
+
+
+def _read_bytes(path: str) -> bytes:
+    if path == "-":
+        return sys.stdin.buffer.read()
+    with open(path, "rb") as handle:
+        return handle.read()
+
+
+def parse_text(data: bytes) -> list[int]:
+    """Integers separated by whitespace and/or commas."""
+    return list(map(int, data.replace(b",", b" ").split()))
+
+
+def parse_binary(data: bytes, source: str = "<stdin>") -> array[int]:
+    """Native-endian int64 words, optionally behind a ``.npy`` header."""
+    from array import array
+
+    from .mapped import NPY_MAGIC, _npy_data_offset
+
+    offset = 0
+    if data[: len(NPY_MAGIC)] == NPY_MAGIC:
+        from pathlib import Path
+
+        offset = _npy_data_offset(data[:65536], Path(source))
+    if (len(data) - offset) % 8:
+        raise ValueError(f"{source}: size is not a whole number of int64 words")
+    words = array("q")
+    words.frombytes(memoryview(data)[offset:])
+    return words
+
+
+def _detect_format(path: str, requested: str) -> str:
+    if requested != "auto":
+        return requested
+    if path.endswith((".npy", ".bin", ".i64")):
+        return "binary"
+    return "text"
+
+
+def read_arrays(
+    paths: Sequence[str], input_format: str, rows: bool
+) -> Iterator[tuple[str, int | None, Sequence[int]]]:
+    """
+    Yield ``(source, row, nums)`` for every array in the inputs.
+
+    Args:
+        paths: Files to read, ``-`` meaning stdin
+        input_format: ``auto``, ``text`` or ``binary``
+        rows: Treat each non-blank text line as its own array
+
+    Yields:
+        The source name, the 0-based row (None for whole-file arrays) and
+        the integers
+    """
+    for path in paths:
+        source = "<stdin>" if path == "-" else path
+        data = _read_bytes(path)
+        if _detect_format(path, input_format) == "binary":
+            yield source, None, parse_binary(data, source)
+        elif rows:
+            for row, line in enumerate(data.splitlines()):
+                nums = parse_text(line)
+                if nums:
+                    yield source, row, nums
+        else:
+            yield source, None, parse_text(data)
+
+
+def two_sum_jobs(
+    arrays: Iterable[tuple[str, int | None, Sequence[int]]],
+    targets: Sequence[int],
+    target_first: bool,
+) -> Iterator[Job]:
+    """Pair every array with its targets, numbering jobs in order."""
+    number = 0
+    for source, row, nums in arrays:
+        if target_first:
+            if len(nums) == 0:
+                raise ValueError(f"{source}: row {row} has no target")
+            pairs: Iterable[tuple[Sequence[int], int]] = [(nums[1:], nums[0])]
+        else:
+            pairs = ((nums, target) for target in targets)
+        for job_nums, target in pairs:
+            yield Job(number, source, row, job_nums, target)
+            number += 1
+
+
+@cache
+def _solver(backend: str) -> Any:
+    from .solver import TwoSumSolver
+
+    return TwoSumSolver(backend)  # type: ignore[arg-type]
+
+
+def solve_two_sum(job: Job, mode: str, backend: str) -> dict[str, Any]:
+    """Solve one two sum job; the result is a JSON-ready dict."""
+    solver = _solver(backend)
+    assert job.target is not None
+    record: dict[str, Any] = {"job": job.number, "source": job.source}
+    if job.row is not None:
+        record["row"] = job.row
+    record["target"] = job.target
+    if mode == "first":
+        result = solver.find_first_pair_fast(job.nums, job.target)
+        record["indices"] = None if result is None else [int(i) for i in result.indices]
+        record["values"] = None if result is None else [int(v) for v in result.values]
+    elif mode == "all":
+        pairs = solver.find_all_pairs(job.nums, job.target)
+        record["pairs"] = [[int(j), int(i)] for j, i in (r.indices for r in pairs)]
+    else:
+        record["count"] = solver.count_pairs(job.nums, job.target)
+    return record
+
+
+def solve_missing_repeating(job: Job) -> dict[str, Any]:
+    """Solve one missing/repeating job; invalid inputs produce an ``error`` field."""
+    from .arrays.find_missing_repeating import (
+        find_missing_repeating_chunked,
+        find_missing_repeating_vectorized,
+    )
+    from .dispatch import _have_numpy
+
+    record: dict[str, Any] = {"job": job.number, "source": job.source}
+    if job.row is not None:
+        record["row"] = job.row
+    try:
+        if _have_numpy():
+            missing, repeating = find_missing_repeating_vectorized(job.nums)
+        else:
+            missing, repeating = find_missing_repeating_chunked([job.nums])
+    except (ValueError, OverflowError) as error:
+        record["error"] = str(error)
+    else:
+        record["missing"], record["repeating"] = missing, repeating
+    return record
+
+
+def solve_all(jobs: Iterable[Job], solve: Any, workers: int) -> Iterator[dict[str, Any]]:
+    """Results of ``solve`` over ``jobs`` in order, in ``workers`` processes if above 1."""
+    if workers <= 1:
+        return map(solve, jobs)
+    return _solve_in_pool(jobs, solve, workers)
+
+
+def _solve_in_pool(jobs: Iterable[Job], solve: Any, workers: int) -> Iterator[dict[str, Any]]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(solve, jobs, chunksize=_POOL_CHUNK)
+
+
+def write_jsonl(records: Iterable[dict[str, Any]], out: BinaryIO) -> int:
+    """Write one JSON object per line; returns the number written."""
+    import json
+
+    count = 0
+    encode = json.JSONEncoder(separators=(",", ":")).encode
+    for record in records:
+        out.write(encode(record).encode())
+        out.write(b"\n")
+        count += 1
+    return count
+
+
+def binary_rows(record: dict[str, Any], mode: str) -> list[tuple[int, ...]]:
+    """
+    The int64 records for one result, per ``RECORD_FIELDS[mode]``.
+
+    ``first`` writes ``(-1, -1)`` when there is no pair, ``all`` one record per
+    pair, and ``missing-repeating`` ``(0, 0)`` for invalid input.
+    """
+    job = record["job"]
+    if mode == "first":
+        left, right = record["indices"] or (-1, -1)
+        return [(job, left, right)]
+    if mode == "all":
+        return [(job, left, right) for left, right in record["pairs"]]
+    if mode == "count":
+        return [(job, record["count"])]
+    return [(job, record.get("missing", 0), record.get("repeating", 0))]
+
+
+def write_binary(records: Iterable[dict[str, Any]], out: BinaryIO, mode: str) -> int:
+    """Write native-endian int64 records; returns the number of results written."""
+    from array import array
+
+    count = 0
+    buffer = array("q")
+    for record in records:
+        for fields in binary_rows(record, mode):
+            buffer.extend(fields)
+        count += 1
+        if len(buffer) >= 1 << 16:
+            buffer.tofile(out)
+            del buffer[:]
+    buffer.tofile(out)
+    return count
+
+
+def _add_io_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "inputs", nargs="*", default=["-"], metavar="FILE", help="input files (default: stdin)"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("auto", "text", "binary"),
+        default="auto",
+        help="input format; auto picks binary for .npy/.bin/.i64 files",
+    )
+    parser.add_argument(
+        "--rows", action="store_true", help="each line of a text input is a separate array"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", metavar="FILE", help="output file (default: stdout)"
+    )
+    parser.add_argument(
+        "-O",
+        "--output-format",
+        choices=("jsonl", "binary"),
+        default="jsonl",
+        help="JSON lines, or int64 records (fields per RECORD_FIELDS)",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=1, metavar="N", help="worker processes (default: 1)"
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="fp-gym", description="Batch solvers for the fp_gym problems."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    two_sum = commands.add_parser("two-sum", help="find pairs summing to a target")
+    _add_io_arguments(two_sum)
+    two_sum.add_argument(
+        "-t",
+        "--target",
+        type=int,
+        action="append",
+        default=[],
+        help="target sum; repeat to solve each array for several targets",
+    )
+    two_sum.add_argument(
+        "--target-first",
+        action="store_true",
+        help="the first integer of each array (or row) is its target",
+    )
+    two_sum.add_argument(
+        "-m",
+        "--mode",
+        choices=("first", "all", "count"),
+        default="first",
+        help="first pair, every pair, or the number of pairs (default: first)",
+    )
+    two_sum.add_argument(
+        "-b", "--backend", default="auto", help="TwoSumSolver backend (default: auto)"
+    )
+
+    missing = commands.add_parser(
+        "missing-repeating", help="find the missing and repeated value of 1..n"
+    )
+    _add_io_arguments(missing)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the CLI.
+
+    Args:
+        argv: Arguments without the program name (defaults to ``sys.argv[1:]``)
+
+    Returns:
+        Process exit status
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    arrays = read_arrays(args.inputs, args.format, args.rows)
+    if args.command == "two-sum":
+        if not args.target and not args.target_first:
+            parser.error("two-sum needs --target or --target-first")
+        from functools import partial
+
+        from .solver import BACKENDS
+
+        if args.backend not in BACKENDS:
+            parser.error(f"unknown backend {args.backend!r}, expected one of {BACKENDS}")
+        mode = args.mode
+        jobs = two_sum_jobs(arrays, args.target, args.target_first)
+        solve: Any = partial(solve_two_sum, mode=mode, backend=args.backend)
+    else:
+        mode = "missing-repeating"
+        jobs = (Job(n, source, row, nums) for n, (source, row, nums) in enumerate(arrays))
+        solve = solve_missing_repeating
+
+    out = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    try:
+        records = solve_all(jobs, solve, args.jobs)
+        if args.output_format == "jsonl":
+            write_jsonl(records, out)
+        else:
+            write_binary(records, out, mode)
+    except (OSError, ValueError) as error:
+        print(f"fp-gym: error: {error}", file=sys.stderr)
+        return 1
+    finally:
+        if out is not sys.stdout.buffer:
+            out.close()
+        else:
+            out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
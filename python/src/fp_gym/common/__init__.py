@@ -0,0 +1,14 @@
+"""Timing and comparison helpers shared by the exercises."""
+
+from .comparer import Comparison, SolutionComparer, compare_algorithms, scaling_report
+from .timer import Timing, measure, time_it
+
+__all__ = [
+    "Comparison",
+    "SolutionComparer",
+    "Timing",
+    "compare_algorithms",
+    "measure",
+    "scaling_report",
+    "time_it",
+]
@@ -0,0 +1,191 @@
+"""
+Multi-implementation comparison, the Python counterpart of the Scala
+``common.SolutionComparer``.
+
+``SolutionComparer`` runs any number of implementations of the same problem
+on the same input through ``measure``, checks that they agree, and reports
+median, p95 and allocation peak per implementation. ``scaling`` repeats the
+comparison over a range of input sizes to show how each one grows.
+
+Example:
+    >>> comparer = SolutionComparer(
+    ...     {"set": find_missing_repeating, "optimal": find_missing_repeating_optimal},
+    ...     setup=list,
+    ... )
+    >>> print(comparer.compare([4, 3, 6, 2, 1, 1]).report())
+"""
+
+import operator
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .timer import Timing, measure
+
+
+def _format_ns(ns: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if ns >= scale:
+            return f"{ns / scale:.2f} {unit}"
+    return f"{ns:.0f} ns"
+
+
+def _format_bytes(size: int | None) -> str:
+    if size is None:
+        return "-"
+    for unit, scale in (("MiB", 1 << 20), ("KiB", 1 << 10)):
+        if size >= scale:
+            return f"{size / scale:.1f} {unit}"
+    return f"{size} B"
+
+
+@dataclass
+class Comparison:
+    """Timings of every implementation on one input."""
+
+    size: int | None
+    timings: dict[str, Timing]
+    results: dict[str, Any] = field(repr=False)
+    mismatches: list[str]
+
+    @property
+    def agree(self) -> bool:
+        """True when every implementation returned the reference result."""
+        return not self.mismatches
+
+    @property
+    def fastest(self) -> str:
+        return min(self.timings, key=lambda name: self.timings[name].median_ns)
+
+    def report(self) -> str:
+        """Human readable table, fastest first, with speedups over the slowest."""
+        ranked = sorted(self.timings.values(), key=lambda timing: timing.median_ns)
+        slowest = ranked[-1].median_ns
+        width = max(len(timing.name) for timing in ranked)
+        lines = [f"Input size: {self.size}" if self.size is not None else "Input"]
+        lines.append(f"{'':<{width}}{'median':>12}{'p95':>12}{'peak mem':>12}{'speedup':>10}")
+        for timing in ranked:
+            lines.append(
+                f"{timing.name:<{width}}"
+                f"{_format_ns(timing.median_ns):>12}"
+                f"{_format_ns(timing.p95_ns):>12}"
+                f"{_format_bytes(timing.peak_bytes):>12}"
+                f"{slowest / max(timing.median_ns, 1):>9.2f}x"
+            )
+        if self.agree:
+            lines.append("✓ Results match")
+        else:
+            lines.append("✗ Results differ: " + ", ".join(self.mismatches))
+            for name, result in self.results.items():
+                lines.append(f"  {name}: {result!r}")
+        return "\n".join(lines)
+
+
+class SolutionComparer:
+    """
+    Time several implementations of one problem against each other.
+
+    The first implementation is the reference that the others must agree
+    with (per ``equal``).
+    """
+
+    def __init__(
+        self,
+        implementations: Mapping[str, Callable[[Any], Any]],
+        *,
+        setup: Callable[[Any], Any] | None = None,
+        equal: Callable[[Any, Any], bool] = operator.eq,
+        warmup: int = 1,
+        trials: int = 7,
+        disable_gc: bool = True,
+        trace_memory: bool = True,
+    ) -> None:
+        """
+        Configure the comparison.
+
+        Args:
+            implementations: Name to function, reference first
+            setup: Untimed per-call copy or conversion of the input; pass
+                ``list`` when an implementation mutates its argument
+            equal: How results are checked against the reference
+            warmup: Untimed calls per implementation
+            trials: Timed calls per implementation
+            disable_gc: Suspend the garbage collector while timing
+            trace_memory: Record each implementation's allocation peak
+        """
+        if not implementations:
+            raise ValueError("at least one implementation is required")
+        self.implementations = dict(implementations)
+        self.setup = setup
+        self.equal = equal
+        self.warmup = warmup
+        self.trials = trials
+        self.disable_gc = disable_gc
+        self.trace_memory = trace_memory
+
+    def compare(self, arg: Any) -> Comparison:
+        """Run every implementation on ``arg``."""
+        timings: dict[str, Timing] = {}
+        results: dict[str, Any] = {}
+        for name, operation in self.implementations.items():
+            results[name], timings[name] = measure(
+                operation,
+                arg,
+                name=name,
+                setup=self.setup,
+                warmup=self.warmup,
+                trials=self.trials,
+                disable_gc=self.disable_gc,
+                trace_memory=self.trace_memory,
+            )
+
+        reference, *others = results
+        mismatches = [name for name in others if not self.equal(results[reference], results[name])]
+        size = len(arg) if hasattr(arg, "__len__") else None
+        return Comparison(size, timings, results, mismatches)
+
+    def scaling(self, make_input: Callable[[int], Any], sizes: Iterable[int]) -> list[Comparison]:
+        """
+        Compare at every input size.
+
+        Args:
+            make_input: Builds an input of the given size
+            sizes: Input sizes, typically growing geometrically
+
+        Returns:
+            One Comparison per size
+        """
+        return [self.compare(make_input(size)) for size in sizes]
+
+
+def scaling_report(comparisons: list[Comparison]) -> str:
+    """Median time per implementation (columns) at each input size (rows)."""
+    names = list(comparisons[0].timings) if comparisons else []
+    widths = [max(12, len(name) + 2) for name in names]
+    header = f"{'size':>12}" + "".join(
+        f"{name:>{width}}" for name, width in zip(names, widths, strict=True)
+    )
+    lines = [header]
+    for comparison in comparisons:
+        lines.append(
+            f"{comparison.size!s:>12}"
+            + "".join(
+                f"{_format_ns(comparison.timings[name].median_ns):>{width}}"
+                for name, width in zip(names, widths, strict=True)
+            )
+        )
+    return "\n".join(lines)
+
+
+def compare_algorithms(
+    arg: Any,
+    alg1: Callable[[Any], Any],
+    alg2: Callable[[Any], Any],
+    name1: str = "Algorithm 1",
+    name2: str = "Algorithm 2",
+) -> Comparison:
+    """Compare two implementations and print the report, like the Scala helper."""
+    comparison = SolutionComparer({name1: alg1, name2: alg2}).compare(arg)
+    print(comparison.report())
+    print("-" * 50)
+    return comparison
@@ -0,0 +1,117 @@
+"""
+Timing primitives, the Python counterpart of the Scala ``common.Timer``.
+
+``time_it`` times a single call. ``measure`` adds what a fair comparison
+needs: warmup calls, repeated trials, optional GC suppression, untimed
+per-call setup, and a separate ``tracemalloc`` pass for the allocation peak
+(tracing slows execution, so it never overlaps the timed trials).
+"""
+
+import gc
+import math
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+def time_it(operation: Callable[[], Any]) -> tuple[Any, int]:
+    """
+    Run ``operation`` once.
+
+    Returns:
+        The result and the elapsed time in nanoseconds
+    """
+    start = time.perf_counter_ns()
+    result = operation()
+    return result, time.perf_counter_ns() - start
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Per-trial samples of one implementation on one input."""
+
+    name: str
+    samples_ns: tuple[int, ...]
+    peak_bytes: int | None = None
+
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns)
+
+    @property
+    def p95_ns(self) -> int:
+        """95th percentile by nearest rank."""
+        ordered = sorted(self.samples_ns)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    @property
+    def min_ns(self) -> int:
+        return min(self.samples_ns)
+
+
+def measure(
+    operation: Callable[[Any], Any],
+    arg: Any,
+    *,
+    name: str = "",
+    setup: Callable[[Any], Any] | None = None,
+    warmup: int = 1,
+    trials: int = 7,
+    disable_gc: bool = True,
+    trace_memory: bool = True,
+) -> tuple[Any, Timing]:
+    """
+    Time ``operation(arg)`` over repeated trials.
+
+    Args:
+        operation: Function under test
+        arg: Its input
+        name: Label stored in the Timing
+        setup: Untimed transform applied to ``arg`` before every call, e.g.
+            ``list`` for implementations that mutate their input
+        warmup: Untimed calls before the trials
+        trials: Timed calls
+        disable_gc: Suspend the cyclic garbage collector while timing
+        trace_memory: Measure the allocation peak in one extra traced call
+
+    Returns:
+        The result of the last call and its Timing
+    """
+    if trials < 1:
+        raise ValueError("trials must be positive")
+
+    def prepared() -> Any:
+        return setup(arg) if setup is not None else arg
+
+    for _ in range(warmup):
+        operation(prepared())
+
+    samples = []
+    gc.collect()
+    was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.disable()
+    try:
+        for _ in range(trials):
+            value = prepared()
+            start = time.perf_counter_ns()
+            result = operation(value)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        if was_enabled:
+            gc.enable()
+
+    peak = None
+    if trace_memory:
+        value = prepared()
+        tracemalloc.start()
+        try:
+            operation(value)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return result, Timing(name, tuple(samples), peak)
@@ -0,0 +1,302 @@
+"""
+Direct-address engines for inputs whose values span a small range.
+
+When ``high - low`` is small (IDs in ``0..2**20``, say) a flat table indexed
+by ``value - low`` replaces the ``seen`` dict: no hashing, no resizing and
+no per-entry objects.
+
+``DenseTable`` owns one preallocated ``array('q')`` and is meant to be reused
+across calls. Instead of clearing it, every call claims a fresh block of
+stamps: an entry is valid only if it is at least the call's base stamp, so
+leftovers from earlier calls are ignored and reuse costs O(1).
+
+Inputs whose range exceeds the table's capacity fall back to the hashing
+engines (``two_sum_generator`` / ``find_missing_repeating_chunked``) with the
+same results; ``fits`` tells callers in advance.
+
+A table is not thread-safe, and a pair generator must be exhausted (or
+discarded) before the same table is used again. ``DenseTablePool`` lends a
+table to each call instead, so one pool can serve many threads and any
+number of live generators.
+"""
+
+import threading
+from array import array
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from contextlib import contextmanager
+
+from .arrays.find_missing_repeating import find_missing_repeating_chunked
+from .buffers import int_sequence
+from .solver import TwoSumResult, two_sum_fast, two_sum_generator
+
+DEFAULT_CAPACITY = 1 << 20
+_STAMP_LIMIT = (1 << 63) - 1
+
+
+def _bounds(nums: Sequence[int]) -> tuple[int, int]:
+    """Smallest and largest value; NumPy arrays use their own reductions."""
+    if getattr(nums, "dtype", None) is not None:
+        return int(nums.min()), int(nums.max())  # type: ignore[attr-defined]
+    return min(nums), max(nums)
+
+
+class DenseTable:
+    """
+    Reusable value-indexed table for two sum and missing/repeating.
+
+    Example:
+        >>> table = DenseTable()
+        >>> for nums in batches:
+        ...     pairs = list(table.pairs(nums, target))
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Allocate the table.
+
+        Args:
+            capacity: Largest value range (``high - low + 1``) handled
+                directly; 8 bytes per slot
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._table = array("q", bytes(8 * capacity))
+        self._base = 1
+
+    def fits(self, low: int, high: int) -> bool:
+        """Whether values in ``[low, high]`` can be addressed directly."""
+        return high - low < self.capacity
+
+    def _claim(self, count: int) -> int:
+        """Reserve ``count`` stamps above everything stored so far."""
+        base = self._base
+        if base + count > _STAMP_LIMIT:
+            # Practically unreachable; start over with a zeroed table
+            self._table = array("q", bytes(8 * self.capacity))
+            base = 1
+        self._base = base + count
+        return base
+
+    def pairs(self, nums: Sequence[int], target: int) -> Generator[TwoSumResult]:
+        """
+        Yield the same pairs as ``two_sum_generator``.
+
+        Args:
+            nums: Integers to search
+            target: Target sum value
+
+        Yields:
+            TwoSumResult: One pair per element whose complement appears earlier
+        """
+        if len(nums) == 0:
+            return
+        low, high = _bounds(nums)
+        if not self.fits(low, high):
+            yield from two_sum_generator(nums, target)
+            return
+
+        table, size = self._table, high - low + 1
+        base = self._claim(len(nums))
+        shift = target - low
+        for i, num in enumerate(int_sequence(nums)):
+            k = shift - num
+            if 0 <= k < size:
+                j = table[k] - base
+                if j >= 0:
+                    yield TwoSumResult((j, i), (target - num, num))
+            table[num - low] = base + i
+
+    def first(self, nums: Sequence[int], target: int) -> TwoSumResult | None:
+        """Return the first pair, as ``two_sum_fast`` would, or None."""
+        if len(nums) == 0:
+            return None
+        low, high = _bounds(nums)
+        if not self.fits(low, high):
+            return two_sum_fast(nums, target)
+
+        table, size = self._table, high - low + 1
+        base = self._claim(len(nums))
+        shift = target - low
+        for i, num in enumerate(int_sequence(nums)):
+            k = shift - num
+            if 0 <= k < size:
+                j = table[k] - base
+                if j >= 0:
+                    return TwoSumResult((j, i), (target - num, num))
+            table[num - low] = base + i
+        return None
+
+    def count(self, nums: Sequence[int], target: int) -> int:
+        """Number of pairs ``pairs`` would yield, without building results."""
+        if len(nums) == 0:
+            return 0
+        low, high = _bounds(nums)
+        if not self.fits(low, high):
+            return sum(1 for _ in two_sum_generator(nums, target, lazy_values=True))
+
+        table, size = self._table, high - low + 1
+        base = self._claim(len(nums))
+        shift = target - low
+        count = 0
+        for i, num in enumerate(int_sequence(nums)):
+            k = shift - num
+            if 0 <= k < size and table[k] >= base:
+                count += 1
+            table[num - low] = base + i
+        return count
+
+    def find_missing_repeating(self, arr: Sequence[int]) -> tuple[int, int]:
+        """
+        Missing/repeating by marking each value's slot with this call's stamp.
+
+        The input is not mutated. Uses NumPy for the marking pass when
+        available (the table is viewed, not copied).
+
+        Args:
+            arr: A permutation of ``1..n`` with one value replaced by a duplicate
+
+        Returns:
+            ``(missing, repeating)``
+
+        Raises:
+            ValueError: If a value is outside ``1..n`` or nothing repeats
+        """
+        n = len(arr)
+        if n == 0 or n > self.capacity:
+            return find_missing_repeating_chunked([arr])
+        low, high = _bounds(arr)
+        if low < 1 or high > n:
+            raise ValueError(f"values must lie in 1..{n}")
+        stamp = self._claim(1)
+
+        try:
+            import numpy as np
+        except ImportError:
+            table = self._table
+            repeating = 0
+            for value in int_sequence(arr):
+                if table[value - 1] == stamp:
+                    repeating = value
+                else:
+                    table[value - 1] = stamp
+            total = sum(arr)
+        else:
+            values = np.asarray(arr)
+            marks = np.frombuffer(self._table, dtype=np.int64, count=n)
+            marks[values - 1] = stamp
+            # The one unmarked slot is the missing value; the sums give the duplicate
+            unmarked = np.flatnonzero(marks != stamp)
+            total = int(values.sum(dtype=np.int64))
+            repeating = int(unmarked[0]) + 1 + total - n * (n + 1) // 2 if unmarked.size else 0
+            del marks
+
+        difference = total - n * (n + 1) // 2
+        if repeating == 0 or difference == 0:
+            raise ValueError("input has no repeating element")
+        return (repeating - difference, repeating)
+
+
+class DenseTablePool:
+    """
+    Thread-safe supply of ``DenseTable`` objects, one per call in progress.
+
+    Each call borrows a free table, allocating one only when all are in use,
+    and gives it back when done; a pair generator keeps its table until it is
+    exhausted or closed. The pool thus grows to the largest number of
+    concurrent calls and steady-state use allocates nothing.
+
+    Example:
+        >>> pool = DenseTablePool()
+        >>> pairs = list(pool.pairs(nums, target))  # from any thread
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, tables: Iterable[DenseTable] = ()) -> None:
+        """
+        Create the pool.
+
+        Args:
+            capacity: Capacity of the tables the pool allocates
+            tables: Existing tables to lend first; none may be used elsewhere
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._free = list(tables)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> DenseTable:
+        """Take a free table, or allocate one; hand it back with ``release``."""
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+        return DenseTable(self.capacity)
+
+    def release(self, table: DenseTable) -> None:
+        """Return a table taken with ``acquire``."""
+        with self._lock:
+            self._free.append(table)
+
+    @contextmanager
+    def borrow(self) -> Iterator[DenseTable]:
+        """A table for the duration of the ``with`` block."""
+        table = self.acquire()
+        try:
+            yield table
+        finally:
+            self.release(table)
+
+    def pairs(self, nums: Sequence[int], target: int) -> Generator[TwoSumResult]:
+        """``DenseTable.pairs`` on a table held until the generator finishes or is closed."""
+        with self.borrow() as table:
+            yield from table.pairs(nums, target)
+
+    def first(self, nums: Sequence[int], target: int) -> TwoSumResult | None:
+        """``DenseTable.first`` on a borrowed table."""
+        with self.borrow() as table:
+            return table.first(nums, target)
+
+    def count(self, nums: Sequence[int], target: int) -> int:
+        """``DenseTable.count`` on a borrowed table."""
+        with self.borrow() as table:
+            return table.count(nums, target)
+
+
+def dense_pairs(
+    nums: Sequence[int], target: int, table: DenseTable | None = None
+) -> Generator[TwoSumResult]:
+    """
+    Direct-address equivalent of ``two_sum_generator``.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+        table: Table to reuse; by default one sized to the input's range (at
+            most ``DEFAULT_CAPACITY``) is allocated for this call
+
+    Yields:
+        TwoSumResult: Each pair, in the generator's order
+    """
+    if table is None:
+        low, high = _bounds(nums) if len(nums) else (0, 0)
+        table = DenseTable(min(high - low + 1, DEFAULT_CAPACITY))
+    return table.pairs(nums, target)
+
+
+def find_missing_repeating_dense(
+    arr: Sequence[int], table: DenseTable | None = None
+) -> tuple[int, int]:
+    """
+    Direct-address missing/repeating; see ``DenseTable.find_missing_repeating``.
+
+    Args:
+        arr: A permutation of ``1..n`` with one value replaced by a duplicate
+        table: Table to reuse; by default one of size ``n`` (at most
+            ``DEFAULT_CAPACITY``) is allocated
+
+    Returns:
+        ``(missing, repeating)``
+    """
+    if table is None:
+        table = DenseTable(min(max(len(arr), 1), DEFAULT_CAPACITY))
+    return table.find_missing_repeating(arr)
@@ -0,0 +1,272 @@
+"""
+Adaptive engine selection for ``TwoSumSolver(backend="auto")``.
+
+Every engine returns exactly the same pairs, so the choice only affects
+speed. It is made from cheap statistics of the input (``InputStats``):
+
+* tiny inputs use the nested loop (``fp_gym.nested``)
+* ascending input uses the two-pointer sweep (``fp_gym.presorted``); a
+  sampled check screens candidates and a full C-speed check confirms them
+* first-pair searches otherwise use the early-exit dict scan
+* all-pairs work on large inputs goes to NumPy, or to worker processes
+  above ``process_min``, when the values fit in int64
+* otherwise, large inputs go to threads above ``thread_min``, on
+  free-threaded builds only (``fp_gym.threaded``)
+* otherwise, inputs whose values are dense in a small range use a
+  direct-address table (``fp_gym.dense``)
+
+The size cut-offs live in ``Thresholds``; the defaults are conservative and
+``Dispatcher.calibrate`` re-tunes them on the host machine. The last choice
+is kept on the solver (``last_choice``) for logging.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    from .solver import Engine
+
+Operation = Literal["first", "all"]
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+@cache
+def _have_numpy() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+class InputStats:
+    """
+    Lazily computed statistics of an input sequence.
+
+    ``size``, ``dtype`` and the sortedness sample are O(1) or O(sample);
+    ``low``/``high`` scan the input once, on first access only.
+    """
+
+    def __init__(self, nums: Sequence[int] | Any, sample: int = 32) -> None:
+        self.nums = nums
+        self.size = len(nums)
+        dtype = getattr(nums, "dtype", None)
+        self.dtype: str | None = None if dtype is None else str(dtype)
+        self.sample = sample
+
+    @cached_property
+    def low(self) -> int:
+        return int(min(self.nums))
+
+    @cached_property
+    def high(self) -> int:
+        return int(max(self.nums))
+
+    @property
+    def value_range(self) -> int:
+        """Number of distinct values the input could hold, ``high - low + 1``."""
+        return self.high - self.low + 1
+
+    @property
+    def fits_int64(self) -> bool:
+        if self.dtype is not None:
+            return self.dtype.startswith("int") or self.dtype in ("uint8", "uint16", "uint32")
+        return INT64_MIN <= self.low and self.high <= INT64_MAX
+
+    @cached_property
+    def sorted_sample(self) -> bool:
+        """Whether ``sample`` evenly spaced adjacent pairs are non-decreasing."""
+        nums, n = self.nums, self.size
+        if n < 2:
+            return True
+        step = max(1, (n - 1) // self.sample)
+        return all(nums[i] <= nums[i + 1] for i in range(0, n - 1, step))
+
+    @cached_property
+    def is_sorted(self) -> bool:
+        """Whether the whole input is non-decreasing; O(n), checked after the sample."""
+        from .presorted import is_sorted
+
+        return self.sorted_sample and is_sorted(self.nums)
+
+    def __repr__(self) -> str:
+        known = {
+            name: self.__dict__[name]
+            for name in ("low", "high", "sorted_sample", "is_sorted")
+            if name in self.__dict__
+        }
+        extra = "".join(f", {name}={value}" for name, value in known.items())
+        return f"InputStats(size={self.size}, dtype={self.dtype}{extra})"
+
+
+def _repeated(run: Callable[[list[int]], Any], reps: int) -> Callable[[list[int]], None]:
+    def repeat(nums: list[int]) -> None:
+        for _ in range(reps):
+            run(nums)
+
+    return repeat
+
+
+@dataclass
+class Thresholds:
+    """Size cut-offs between engines."""
+
+    # Largest input solved with the nested loop
+    nested_max: int = 4
+    # Smallest input whose all-pairs work goes to NumPy
+    numpy_min: int = 2048
+    # Smallest input whose all-pairs work goes to worker processes (None: never)
+    process_min: int | None = None
+    # Smallest input whose all-pairs work goes to threads when the GIL is disabled
+    thread_min: int | None = 1 << 16
+    # Largest value range addressed directly, and at most this many slots per element
+    dense_max_range: int = 1 << 20
+    dense_max_spread: int = 2
+
+
+@dataclass(frozen=True)
+class Choice:
+    """An engine picked for one call, with the statistics behind it."""
+
+    engine: Engine
+    operation: Operation
+    reason: str
+    stats: InputStats = field(repr=False)
+
+
+class Dispatcher:
+    """Pick an engine per call from input statistics and thresholds."""
+
+    def __init__(self, thresholds: Thresholds | None = None) -> None:
+        self.thresholds = thresholds or Thresholds()
+
+    def choose(self, nums: Sequence[int] | Any, operation: Operation) -> Choice:
+        """
+        Select the engine for ``operation`` on ``nums``.
+
+        Args:
+            nums: The input about to be solved
+            operation: ``"first"`` for a first-pair search, ``"all"`` for
+                work over every pair (listing or counting)
+
+        Returns:
+            The Choice, naming the engine and why it was picked
+        """
+        stats = InputStats(nums)
+        limits = self.thresholds
+        if stats.size <= limits.nested_max:
+            return Choice("nested", operation, f"size <= {limits.nested_max}", stats)
+        if operation == "first":
+            if stats.is_sorted:
+                return Choice("sorted", operation, "ascending input", stats)
+            return Choice("python", operation, "early-exit scan", stats)
+        if stats.size >= limits.numpy_min and _have_numpy() and stats.fits_int64:
+            if limits.process_min is not None and stats.size >= limits.process_min:
+                return Choice("process", operation, f"size >= {limits.process_min}", stats)
+            return Choice("numpy", operation, f"size >= {limits.numpy_min}", stats)
+        if stats.is_sorted:
+            return Choice("sorted", operation, "ascending input", stats)
+        if limits.thread_min is not None and stats.size >= limits.thread_min:
+            from .threaded import gil_enabled
+
+            if not gil_enabled():
+                return Choice(
+                    "thread", operation, f"free-threaded, size >= {limits.thread_min}", stats
+                )
+        dense_limit = min(limits.dense_max_range, limits.dense_max_spread * stats.size)
+        if stats.value_range <= dense_limit:
+            return Choice("dense", operation, f"value range <= {dense_limit}", stats)
+        return Choice("python", operation, "sparse values", stats)
+
+    def calibrate(
+        self,
+        *,
+        nested_sizes: Sequence[int] = (2, 4, 8, 16, 32, 64),
+        numpy_sizes: Sequence[int] = (256, 1024, 4096, 16384, 65536),
+        process_sizes: Sequence[int] = (),
+        trials: int = 5,
+        seed: int = 0,
+    ) -> Thresholds:
+        """
+        Time the engines against each other on this machine and update thresholds.
+
+        Each cut-off becomes the first size at which the larger-input engine
+        wins. Worker processes are only calibrated when ``process_sizes`` is
+        given, since every trial starts a pool.
+
+        Args:
+            nested_sizes: Sizes for nested loop vs dict scan (no-pair inputs)
+            numpy_sizes: Sizes for dict scan vs NumPy (all pairs, random input)
+            process_sizes: Sizes for NumPy vs worker processes
+            trials: Timed trials per engine and size
+            seed: Seed for the generated inputs
+
+        Returns:
+            The new thresholds, also stored on the dispatcher
+        """
+        from .common import measure
+        from .nested import nested_first
+        from .solver import TwoSumSolver, two_sum_fast
+
+        rng = random.Random(seed)
+
+        def crossover(
+            sizes: Sequence[int],
+            make_input: Callable[[int], list[int]],
+            small: Callable[[list[int]], Any],
+            large: Callable[[list[int]], Any],
+        ) -> int | None:
+            for size in sizes:
+                nums = make_input(size)
+                # Repeat small calls so each trial is long enough to time reliably
+                reps = max(1, 4096 // size)
+                small_timing, large_timing = (
+                    measure(_repeated(run, reps), nums, trials=trials, trace_memory=False)[1]
+                    for run in (small, large)
+                )
+                if large_timing.median_ns < small_timing.median_ns:
+                    return size
+            return None
+
+        def no_pair(size: int) -> list[int]:
+            return [2 * rng.randrange(1 << 20) for _ in range(size)]
+
+        def spread(size: int) -> list[int]:
+            return [rng.randrange(10 * size) for _ in range(size)]
+
+        limits = Thresholds(**vars(self.thresholds))
+        beats_nested = crossover(
+            nested_sizes,
+            no_pair,
+            lambda nums: nested_first(nums, 1),
+            lambda nums: two_sum_fast(nums, 1),
+        )
+        limits.nested_max = (beats_nested or nested_sizes[-1] * 2) - 1
+
+        if _have_numpy():
+            python, numpy = TwoSumSolver("python"), TwoSumSolver("numpy")
+            target = 10 * max(numpy_sizes)
+            beats_python = crossover(
+                numpy_sizes,
+                spread,
+                lambda nums: python.count_pairs(nums, target),
+                lambda nums: numpy.count_pairs(nums, target),
+            )
+            limits.numpy_min = beats_python or sys.maxsize
+
+            if process_sizes:
+                process = TwoSumSolver("process")
+                limits.process_min = crossover(
+                    process_sizes,
+                    spread,
+                    lambda nums: numpy.count_pairs(nums, target),
+                    lambda nums: process.count_pairs(nums, target),
+                )
+
+        self.thresholds = limits
+        return limits
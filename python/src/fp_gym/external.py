@@ -0,0 +1,293 @@
+"""
+Out-of-core two sum for inputs larger than memory.
+
+``two_sum_external`` finds the pairs ``two_sum_generator`` finds while holding
+only a bounded part of the input in memory:
+
+1. The input is read in blocks sized by ``memory``. Each block is sorted
+   twice, by value and by complement ``target - value`` (ties by index), and
+   both orders are spilled to ``temp_dir`` as runs of int64
+   ``(key, index)`` records.
+2. The value runs and the complement runs are each k-way merged into one
+   sorted stream, in extra passes of at most ``MAX_FAN_IN`` runs when there
+   are more.
+3. Two pointers sweep the two streams in step. Where a value ``x`` meets the
+   elements whose complement is ``x``, both sides list their indices in
+   ascending order, so one pass pairs each element with the latest earlier
+   index holding its complement, in O(1) memory.
+
+The sweep finds pairs grouped by value. With ``ordered=True`` (the default)
+they are spilled and merged once more so they come out ordered by the later
+index, exactly as ``two_sum_generator`` yields them. Inputs that fit in a
+single block never touch the disk.
+
+Runs take 16 bytes per element for each sort order (and 24 bytes per pair
+when ordered) and are deleted once the generator finishes or is closed.
+Values and their complements must fit in int64.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import heapq
+import os
+import tempfile
+from array import array
+from collections.abc import Generator, Iterable, Iterator
+from dataclasses import dataclass
+from itertools import chain, islice
+from typing import Any
+
+from .dispatch import INT64_MAX, INT64_MIN, _have_numpy
+from .solver import TwoSumResult, two_sum_generator
+
+DEFAULT_MEMORY = 256 << 20
+
+# Most runs merged at once; more runs are merged in several passes
+MAX_FAN_IN = 64
+
+# Peak bytes per element while a block is sorted, and per buffered record
+_BYTES_PER_ELEMENT = 128
+_BYTES_PER_RECORD = 96
+_MIN_BLOCK = 16
+
+
+@dataclass
+class ExternalStats:
+    """What one external two sum read, spilled and merged."""
+
+    elements: int = 0
+    runs: int = 0
+    merge_passes: int = 0
+    bytes_spilled: int = 0
+    pairs: int = 0
+
+
+class _Runs:
+    """Sorted run files of fixed-width int64 records in one directory."""
+
+    def __init__(self, directory: str, width: int, memory: int, stats: ExternalStats) -> None:
+        self.directory = directory
+        self.width = width
+        self.memory = memory
+        self.stats = stats
+        self.paths: list[str] = []
+
+    def _create(self) -> tuple[str, Any]:
+        handle, path = tempfile.mkstemp(suffix=".run", dir=self.directory)
+        return path, os.fdopen(handle, "wb")
+
+    def _written(self, path: str) -> None:
+        self.paths.append(path)
+        self.stats.runs += 1
+        self.stats.bytes_spilled += os.path.getsize(path)
+
+    def spill(self, records: Any) -> None:
+        """Write one sorted run from a flat int64 ``array`` or NumPy array."""
+        path, out = self._create()
+        with out:
+            records.tofile(out)
+        self._written(path)
+
+    def _read(self, path: str, records: int) -> Iterator[tuple[int, ...]]:
+        width = self.width
+        try:
+            with open(path, "rb") as handle:
+                while True:
+                    block = array("q")
+                    try:
+                        block.fromfile(handle, records * width)
+                    except EOFError:
+                        pass  # Short final block, still filled
+                    if not block:
+                        return
+                    words = iter(block.tolist())
+                    yield from zip(*[words] * width, strict=True)
+        finally:
+            # Already gone when the whole directory was removed first
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+
+    def _merge(self, paths: list[str]) -> Iterator[tuple[int, ...]]:
+        records = max(256, self.memory // (_BYTES_PER_RECORD * self.width * max(1, len(paths))))
+        readers = [self._read(path, records) for path in paths]
+        if len(readers) == 1:
+            return readers[0]
+        return heapq.merge(*readers)
+
+    def merged(self) -> Iterator[tuple[int, ...]]:
+        """Every record in sorted order; the runs are deleted as they are consumed."""
+        paths, self.paths = self.paths, []
+        while len(paths) > MAX_FAN_IN:
+            self.stats.merge_passes += 1
+            for start in range(0, len(paths), MAX_FAN_IN):
+                path, out = self._create()
+                buffer = array("q")
+                with out:
+                    for record in self._merge(paths[start : start + MAX_FAN_IN]):
+                        buffer.extend(record)
+                        if len(buffer) >= 1 << 16:
+                            buffer.tofile(out)
+                            del buffer[:]
+                    buffer.tofile(out)
+                self._written(path)
+            paths, self.paths = self.paths, []
+        if len(paths) > 1:
+            self.stats.merge_passes += 1
+        return self._merge(paths)
+
+
+def _blocks(nums: Iterable[int], size: int) -> Iterator[Any]:
+    """Consecutive blocks of at most ``size`` elements, sliced when possible."""
+    chunks = getattr(nums, "chunks", None)
+    if chunks is not None:
+        # MappedInt64: zero-copy slices of the mapping
+        yield from chunks(size)
+    elif hasattr(nums, "__len__") and hasattr(nums, "__getitem__"):
+        sliced: Any = nums
+        for start in range(0, len(sliced), size):
+            yield sliced[start : start + size]
+    else:
+        items = iter(nums)
+        while block := list(islice(items, size)):
+            yield block
+
+
+def _sort_python(block: Any, base: int, target: int) -> tuple[array[int], array[int]]:
+    runs = []
+    for keys in (list(block), [target - num for num in block]):
+        order = sorted(range(len(keys)), key=keys.__getitem__)
+        run = array("q", bytes(16 * len(keys)))
+        run[0::2] = array("q", [keys[k] for k in order])
+        run[1::2] = array("q", [base + k for k in order])
+        runs.append(run)
+    return runs[0], runs[1]
+
+
+def _sort_numpy(block: Any, base: int, target: int) -> tuple[Any, Any]:
+    import numpy as np
+
+    values = np.asarray(block, dtype=np.int64)
+    if not INT64_MIN <= target <= INT64_MAX:
+        return _sort_python(values.tolist(), base, target)
+    if values.size and not (
+        INT64_MIN <= target - int(values.max()) and target - int(values.min()) <= INT64_MAX
+    ):
+        raise OverflowError("complements do not fit in int64")
+    runs = []
+    for keys in (values, target - values):
+        order = np.argsort(keys, kind="stable")
+        run = np.empty((keys.size, 2), dtype=np.int64)
+        run[:, 0] = keys[order]
+        run[:, 1] = order + base
+        runs.append(run.ravel())
+    return runs[0], runs[1]
+
+
+def _sweep(
+    values: Iterator[tuple[int, ...]], complements: Iterator[tuple[int, ...]]
+) -> Generator[tuple[int, int, int]]:
+    """
+    Join the value stream with the complement stream.
+
+    Yields ``(i, j, x)`` for each element ``i`` whose complement ``x`` is held
+    at an earlier index, ``j`` being the latest such index.
+    """
+    current = next(values, None)
+    key: int | None = None
+    last = -1
+    for complement, i in complements:
+        if complement != key:
+            key, last = complement, -1
+            while current is not None and current[0] < complement:
+                current = next(values, None)
+        while current is not None and current[0] == complement and current[1] < i:
+            last = current[1]
+            current = next(values, None)
+        if last >= 0:
+            yield i, last, complement
+
+
+def _by_index(
+    pairs: Iterable[tuple[int, ...]], runs: _Runs, size: int
+) -> Generator[tuple[int, ...]]:
+    """Reorder ``(i, j, x)`` pairs by ``i``, spilling when they exceed ``size``."""
+    buffer: list[tuple[int, ...]] = []
+    for pair in pairs:
+        buffer.append(pair)
+        if len(buffer) >= size:
+            buffer.sort()
+            runs.spill(array("q", chain.from_iterable(buffer)))
+            buffer = []
+    buffer.sort()
+    if not runs.paths:
+        yield from buffer
+        return
+    if buffer:
+        runs.spill(array("q", chain.from_iterable(buffer)))
+    yield from runs.merged()
+
+
+def two_sum_external(
+    nums: Iterable[int],
+    target: int,
+    *,
+    memory: int = DEFAULT_MEMORY,
+    temp_dir: str | os.PathLike[str] | None = None,
+    ordered: bool = True,
+    stats: ExternalStats | None = None,
+) -> Generator[TwoSumResult]:
+    """
+    Yield the pairs of ``two_sum_generator`` using bounded memory and local disk.
+
+    Args:
+        nums: Integers to search: any iterable, sliced in blocks when it is a
+            sequence, buffer or NumPy array, or a ``MappedInt64``
+        target: Target sum value
+        memory: Approximate memory budget in bytes
+        temp_dir: Where sorted runs are spilled (defaults to the system temp dir)
+        ordered: Order pairs by the later index; ``False`` skips the extra
+            external sort and yields them grouped by value instead
+        stats: Counters to update with what was spilled and merged
+
+    Yields:
+        TwoSumResult: One pair per element whose complement appears earlier
+
+    Raises:
+        OverflowError: If a value or its complement does not fit in int64
+    """
+    if memory < 1:
+        raise ValueError("memory must be positive")
+    stats = stats if stats is not None else ExternalStats()
+    size = max(_MIN_BLOCK, memory // _BYTES_PER_ELEMENT)
+    blocks = _blocks(nums, size)
+    first = next(blocks, None)
+    if first is None:
+        return
+    second = next(blocks, None)
+    if second is None:
+        stats.elements += len(first)
+        for result in two_sum_generator(list(first), target):
+            stats.pairs += 1
+            yield result
+        return
+
+    sort = _sort_numpy if _have_numpy() else _sort_python
+    with tempfile.TemporaryDirectory(prefix="fp_gym-", dir=temp_dir) as directory:
+        share = memory // 3
+        values = _Runs(directory, 2, share, stats)
+        complements = _Runs(directory, 2, share, stats)
+        base = 0
+        for block in chain((first, second), blocks):
+            by_value, by_complement = sort(block, base, target)
+            values.spill(by_value)
+            complements.spill(by_complement)
+            base += len(block)
+        stats.elements += base
+
+        pairs: Iterable[tuple[int, ...]] = _sweep(values.merged(), complements.merged())
+        if ordered:
+            pairs = _by_index(pairs, _Runs(directory, 3, share, stats), size)
+        for i, j, complement in pairs:
+            stats.pairs += 1
+            yield TwoSumResult((j, i), (complement, target - complement))
@@ -0,0 +1,199 @@
+"""
+Two sum over a live collection that grows and shrinks.
+
+``IncrementalTwoSumIndex`` keeps a value to index multiset up to date as
+numbers are added and removed, so an update costs amortized O(1) no matter
+how large the collection is. Indices are handles: ``add`` hands out
+increasing indices and ``remove`` retires one without renumbering the rest.
+
+``has_pair`` answers by scanning the distinct values. Targets asked about
+after every update can be ``watch``-ed instead: the index then keeps the
+number of pairs summing to each watched target current on every update
+(O(watched targets) per update) and answers ``has_pair`` for it in O(1).
+"""
+
+from collections.abc import Generator, Iterable
+
+from .solver import TwoSumResult
+
+
+class IncrementalTwoSumIndex:
+    """
+    Mutable multiset of integers answering two sum queries between updates.
+
+    ``pairs`` yields what ``two_sum_generator`` would for the live values in
+    index order, reporting handle indices.
+
+    Example:
+        >>> index = IncrementalTwoSumIndex()
+        >>> a, b = index.add(2), index.add(7)
+        >>> index.has_pair(9)
+        True
+        >>> index.remove(a)
+        >>> index.has_pair(9)
+        False
+    """
+
+    def __init__(self, nums: Iterable[int] = (), watch: Iterable[int] = ()) -> None:
+        """
+        Build the index.
+
+        Args:
+            nums: Initial values, indexed ``0, 1, ...``
+            watch: Targets whose pair counts are maintained on every update
+        """
+        self._values: dict[int, int] = {}
+        # value -> live indices holding it; dicts keep them ordered and remove in O(1)
+        self._positions: dict[int, dict[int, None]] = {}
+        self._watched: dict[int, int] = {}
+        self._next = 0
+        for target in watch:
+            self.watch(target)
+        self.extend(nums)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._positions
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct live values."""
+        return len(self._positions)
+
+    def count(self, value: int) -> int:
+        """Number of live elements equal to ``value``."""
+        return len(self._positions.get(value, ()))
+
+    def add(self, value: int) -> int:
+        """
+        Insert ``value``.
+
+        Args:
+            value: Integer to add
+
+        Returns:
+            The index assigned to it
+        """
+        positions = self._positions
+        for target in self._watched:
+            bucket = positions.get(target - value)
+            if bucket:
+                self._watched[target] += len(bucket)
+        index = self._next
+        self._next += 1
+        self._values[index] = value
+        bucket = positions.get(value)
+        if bucket is None:
+            positions[value] = {index: None}
+        else:
+            bucket[index] = None
+        return index
+
+    def extend(self, values: Iterable[int]) -> list[int]:
+        """Insert each of ``values``, returning their indices."""
+        return [self.add(value) for value in values]
+
+    def remove(self, index: int) -> int:
+        """
+        Delete the element at ``index``.
+
+        Args:
+            index: An index returned by ``add``
+
+        Returns:
+            The value that was stored there
+
+        Raises:
+            KeyError: If ``index`` is not live
+        """
+        value = self._values.pop(index)
+        bucket = self._positions[value]
+        del bucket[index]
+        if not bucket:
+            del self._positions[value]
+        positions = self._positions
+        for target in self._watched:
+            other = positions.get(target - value)
+            if other:
+                self._watched[target] -= len(other)
+        return value
+
+    def watch(self, target: int) -> None:
+        """Maintain the pair count of ``target`` from now on (O(distinct) once)."""
+        if target not in self._watched:
+            self._watched[target] = self._count_all(target)
+
+    def unwatch(self, target: int) -> None:
+        """Stop maintaining ``target``; unknown targets are ignored."""
+        self._watched.pop(target, None)
+
+    def _count_all(self, target: int) -> int:
+        """Number of pairs ``j < i`` summing to ``target``."""
+        positions = self._positions
+        twice = 0
+        for value, bucket in positions.items():
+            complement = target - value
+            if complement == value:
+                twice += len(bucket) * (len(bucket) - 1)
+            else:
+                other = positions.get(complement)
+                if other:
+                    twice += len(bucket) * len(other)
+        return twice // 2
+
+    def pair_count(self, target: int) -> int:
+        """
+        Number of pairs ``j < i`` summing to ``target``, as ``count_all_pairs``.
+
+        O(1) for watched targets, O(distinct values) otherwise.
+        """
+        watched = self._watched.get(target)
+        return self._count_all(target) if watched is None else watched
+
+    def has_pair(self, target: int) -> bool:
+        """
+        Whether two live elements sum to ``target``.
+
+        O(1) for watched targets, otherwise O(distinct values) with an early exit.
+        """
+        watched = self._watched.get(target)
+        if watched is not None:
+            return watched > 0
+        positions = self._positions
+        for value, bucket in positions.items():
+            complement = target - value
+            if complement == value:
+                if len(bucket) > 1:
+                    return True
+            elif complement in positions:
+                return True
+        return False
+
+    def pairs(self, target: int) -> Generator[TwoSumResult]:
+        """
+        Yield the pairs ``two_sum_generator`` finds over the live values.
+
+        Each element is paired with the latest earlier live index of its
+        complement. A full scan, O(len(self)); ``has_pair`` is cheaper when
+        only existence matters.
+
+        Args:
+            target: Target sum value
+
+        Yields:
+            TwoSumResult: Pairs of live indices, ordered by the later index
+        """
+        if not self.has_pair(target):
+            return
+        seen: dict[int, int] = {}
+        for index, num in list(self._values.items()):
+            complement = target - num
+            j = seen.get(complement)
+            if j is not None:
+                yield TwoSumResult((j, index), (complement, num))
+            seen[num] = index
@@ -0,0 +1,273 @@
+"""
+Prebuilt two sum index for answering many targets against the same input.
+
+``two_sum`` rebuilds its ``seen`` dictionary on every call. When the same
+``nums`` is queried with thousands of targets, it is cheaper to group the
+indices by value once and answer each target by looking only at the distinct
+values.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .buffers import int_sequence
+from .solver import TwoSumResult, _maybe
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import numpy as np
+    import numpy.typing as npt
+    from returns.maybe import Maybe
+
+# Upper bound on (targets x distinct values) cells evaluated per vectorized block
+_BLOCK_CELLS = 1 << 21
+
+
+class TwoSumIndex:
+    """
+    Value to sorted index list mapping built once from ``nums``.
+
+    Queries return exactly what ``two_sum(nums, target)`` would: the pair
+    completed earliest while scanning left to right, paired with the latest
+    earlier index of its complement.
+
+    Example:
+        >>> index = TwoSumIndex([2, 7, 11, 15])
+        >>> index.query(9).unwrap().indices
+        (0, 1)
+        >>> index.query(26).unwrap().indices
+        (2, 3)
+    """
+
+    def __init__(self, nums: Sequence[int]) -> None:
+        """
+        Build the index.
+
+        Args:
+            nums: Integers to index; later changes to the sequence are not seen
+        """
+        positions: dict[int, list[int]] = {}
+        for i, num in enumerate(int_sequence(nums)):
+            bucket = positions.get(num)
+            if bucket is None:
+                positions[num] = [i]
+            else:
+                bucket.append(i)
+        # Insertion order of ``positions`` is the order of first occurrence
+        self._positions = positions
+        self._size = len(nums)
+        self._arrays: tuple[Any, ...] | None = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def distinct(self) -> int:
+        """Number of distinct values in the index."""
+        return len(self._positions)
+
+    def positions(self, value: int) -> tuple[int, ...]:
+        """Return the ascending indices holding ``value``."""
+        return tuple(self._positions.get(value, ()))
+
+    def _groups(self) -> Iterator[tuple[int, Sequence[int]]]:
+        """Each distinct value with its ascending indices, in order of first occurrence."""
+        return iter(self._positions.items())
+
+    def save(self, path: str | Path) -> None:
+        """
+        Write a snapshot that ``MappedTwoSumIndex`` maps back without rebuilding.
+
+        See ``fp_gym.snapshot`` for the format.
+
+        Args:
+            path: Destination file, replaced atomically
+
+        Raises:
+            OverflowError: If a value does not fit in int64
+        """
+        from .snapshot import write_snapshot
+
+        write_snapshot(self, path)
+
+    def _first_completion(self, target: int) -> tuple[int, int]:
+        """
+        Smallest index that completes a pair and the value stored there.
+
+        Returns:
+            ``(index, value)``, or ``(-1, 0)`` when no pair exists
+        """
+        positions = self._positions
+        best, finishing = -1, 0
+        for value, indices in positions.items():
+            first = indices[0]
+            if best != -1 and first >= best:
+                # Every later value occurs first at or after ``best``
+                break
+            complement = target - value
+            if complement == value:
+                if len(indices) < 2:
+                    continue
+                candidate, candidate_value = indices[1], value
+            else:
+                other = positions.get(complement)
+                if other is None:
+                    continue
+                if other[0] > first:
+                    candidate, candidate_value = other[0], complement
+                else:
+                    candidate, candidate_value = first, value
+            if best == -1 or candidate < best:
+                best, finishing = candidate, candidate_value
+        return best, finishing
+
+    def _result_at(self, right: int, target: int, value: int) -> TwoSumResult:
+        """Pair ``right`` (holding ``value``) with the latest earlier complement."""
+        complement = target - value
+        indices = self._positions[complement]
+        left = indices[bisect_left(indices, right) - 1]
+        return TwoSumResult(indices=(left, right), values=(complement, value))
+
+    def query(self, target: int) -> Maybe[TwoSumResult]:
+        """
+        Find the first pair that sums to ``target``.
+
+        Runs in O(distinct values) without touching the original input, and
+        usually stops early because values are visited in order of first
+        occurrence.
+
+        Args:
+            target: Target sum value
+
+        Returns:
+            Maybe[TwoSumResult]: Some(result) if found, Nothing if not found
+        """
+        return _maybe(self.query_fast(target))
+
+    def query_fast(self, target: int) -> TwoSumResult | None:
+        """
+        Same as ``query`` but returns None instead of ``Nothing``.
+
+        Args:
+            target: Target sum value
+
+        Returns:
+            The first TwoSumResult, or None if there is no pair
+        """
+        right, value = self._first_completion(target)
+        if right == -1:
+            return None
+        return self._result_at(right, target, value)
+
+    def query_many(self, targets: Iterable[int]) -> list[Maybe[TwoSumResult]]:
+        """
+        Answer several targets at once.
+
+        With NumPy installed all targets are evaluated against all distinct
+        values in vectorized blocks; otherwise each target is a ``query``.
+
+        Args:
+            targets: Target sum values
+
+        Returns:
+            One Maybe[TwoSumResult] per target, in the same order
+        """
+        targets = list(targets)
+        try:
+            import numpy as np
+        except ImportError:
+            return [self.query(target) for target in targets]
+        try:
+            completions = self._first_completions(np.asarray(targets, dtype=np.int64))
+        except OverflowError:
+            return [self.query(target) for target in targets]
+
+        return [
+            _maybe(None if right == -1 else self._result_at(right, target, value))
+            for target, (right, value) in zip(targets, completions, strict=True)
+        ]
+
+    def _numpy_arrays(self) -> tuple[Any, ...]:
+        """
+        Arrays used by the vectorized queries, built on first use.
+
+        Returns:
+            Distinct values, first and second occurrences (-1 when absent) in
+            order of first occurrence, plus the distinct values sorted and the
+            first occurrence of each sorted value.
+        """
+        if self._arrays is None:
+            import numpy as np
+
+            count = self.distinct
+            values = np.fromiter(self._positions, dtype=np.int64, count=count)
+            buckets = self._positions.values()
+            firsts = np.fromiter((b[0] for b in buckets), dtype=np.int64, count=count)
+            seconds = np.fromiter(
+                (b[1] if len(b) > 1 else -1 for b in buckets), dtype=np.int64, count=count
+            )
+            order = np.argsort(values)
+            self._arrays = (values, firsts, seconds, values[order], firsts[order])
+        return self._arrays
+
+    def _first_completions(self, targets: npt.NDArray[np.int64]) -> list[tuple[int, int]]:
+        """
+        Vectorized ``_first_completion`` over many targets.
+
+        Distinct values are consumed in blocks of growing size, in order of
+        first occurrence, and a target drops out as soon as no later value can
+        improve on its best index, mirroring the early exit of the scalar loop.
+        """
+        import numpy as np
+
+        never = np.iinfo(np.int64).max
+        best = np.full(targets.size, never, dtype=np.int64)
+        finishing = np.zeros(targets.size, dtype=np.int64)
+        if self.distinct == 0 or targets.size == 0:
+            return [(-1, 0)] * int(targets.size)
+
+        values, firsts, seconds, sorted_values, sorted_firsts = self._numpy_arrays()
+        lo, hi = int(sorted_values[0]), int(sorted_values[-1])
+        if int(targets.min()) - hi < -(2**63) or int(targets.max()) - lo > 2**63 - 1:
+            raise OverflowError("complements do not fit in int64")
+
+        pending = np.arange(targets.size)
+        start, width = 0, 64
+        while pending.size and start < values.size:
+            width = max(1, min(width, _BLOCK_CELLS // pending.size))
+            stop = min(start + width, values.size)
+            block_values = values[start:stop]
+            complements = targets[pending, None] - block_values[None, :]
+            slots = np.searchsorted(sorted_values, complements)
+            np.minimum(slots, sorted_values.size - 1, out=slots)
+            present = sorted_values[slots] == complements
+            same = complements == block_values[None, :]
+            other_first = sorted_firsts[slots]
+            own_first = firsts[None, start:stop]
+            completes_here = same | (own_first > other_first)
+            candidates = np.where(
+                same,
+                np.where(seconds[start:stop] >= 0, seconds[start:stop], never)[None, :],
+                np.maximum(own_first, other_first),
+            )
+            candidates[~present] = never
+            rows = np.arange(pending.size)
+            column = candidates.argmin(axis=1)
+            block_best = candidates[rows, column]
+            improved = block_best < best[pending]
+            chosen = pending[improved]
+            best[chosen] = block_best[improved]
+            finishing[chosen] = np.where(
+                completes_here[rows, column], block_values[column], complements[rows, column]
+            )[improved]
+
+            start, width = stop, width * 2
+            if start < values.size:
+                pending = pending[best[pending] > firsts[start]]
+
+        best[best == never] = -1
+        return list(zip(best.tolist(), finishing.tolist(), strict=True))
@@ -0,0 +1,296 @@
+"""
+k-sum and closest k-sum, generalizing the two sum core.
+
+``k_sum_generator`` yields every distinct combination of ``k`` values (taken
+at distinct positions) that sums to ``target``, in lexicographic order of the
+ascending value tuple. It sorts once and then works on a *capped* array in
+which each value keeps at most ``k`` copies, since no combination can use
+more. Each of the outer ``k - 2`` levels walks distinct values and prunes
+with prefix sums: it stops once the ``k`` smallest remaining values exceed
+the target and skips values that cannot reach it even with the largest
+ones. The innermost level is the two sum lookup, O(1) per value; with NumPy
+installed it runs over the whole remaining range at once, one
+``searchsorted`` per outer value, so a 3-sum over ``d`` distinct values is
+still O(d^2) work but almost all of it happens in C.
+
+For ``k == 4`` on inputs with few enough distinct values, a meet-in-the-middle
+engine indexes every pair sum once and joins pairs with pairs, O(d^2) rather
+than O(d^3) for ``d`` distinct values.
+
+``closest_k_sum`` runs the same pruned search with a two-pointer inner level
+and returns the combination whose sum is nearest to ``target``.
+
+Recursion depth is ``k - 1`` regardless of input size.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Generator, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from .buffers import int_sequence
+from .dispatch import INT64_MAX, _have_numpy
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+# Largest number of distinct-value pairs the k=4 meet-in-the-middle indexes
+MITM_MAX_PAIRS = 1 << 21
+
+# Shorter ranges are cheaper to scan in Python than to hand to NumPy
+VECTOR_MIN = 64
+
+
+@dataclass(frozen=True, slots=True)
+class KSumResult:
+    """One combination: values in ascending order and the positions they came from."""
+
+    indices: tuple[int, ...]
+    values: tuple[int, ...]
+
+    @property
+    def total(self) -> int:
+        return sum(self.values)
+
+
+class _Prepared:
+    """Sorted, capped view of the input shared by the k-sum searches."""
+
+    def __init__(self, nums: Iterable[int], k: int) -> None:
+        positions: dict[int, list[int]] = {}
+        for i, num in enumerate(int_sequence(nums)):
+            bucket = positions.get(num)
+            if bucket is None:
+                positions[num] = [i]
+            else:
+                bucket.append(i)
+        self.positions = positions
+        self.distinct = sorted(positions)
+        self.counts = {value: len(positions[value]) for value in self.distinct}
+        capped: list[int] = []
+        for value in self.distinct:
+            capped.extend([value] * min(len(positions[value]), k))
+        self.capped = capped
+        self.prefix = [0, *accumulate(capped)]
+        # Last position of each value in ``capped``
+        self.last = last = {value: i for i, value in enumerate(capped)}
+        # NumPy copies of ``distinct`` and of each value's last position in ``capped``
+        self.array: npt.NDArray[np.int64] | None = None
+        self.ends: npt.NDArray[np.intp] | None = None
+        self.bound = max(-capped[0], capped[-1]) if capped else 0
+        if len(capped) >= VECTOR_MIN and self.bound <= INT64_MAX and _have_numpy():
+            import numpy as np
+
+            self.array = np.array(self.distinct, dtype=np.int64)
+            self.ends = np.array([last[value] for value in self.distinct], dtype=np.intp)
+
+    def window_sum(self, start: int, count: int) -> int:
+        return self.prefix[start + count] - self.prefix[start]
+
+    def top_sum(self, count: int) -> int:
+        return self.prefix[-1] - self.prefix[len(self.capped) - count]
+
+    def result(self, values: tuple[int, ...]) -> KSumResult:
+        """Attach the earliest unused position of each value."""
+        indices = []
+        used = 0
+        for n, value in enumerate(values):
+            used = used + 1 if n and values[n - 1] == value else 0
+            indices.append(self.positions[value][used])
+        return KSumResult(tuple(indices), values)
+
+
+def _check_k(k: int) -> None:
+    if k < 2:
+        raise ValueError("k must be at least 2")
+
+
+def _two_sum_vectorized(
+    data: _Prepared,
+    distinct: npt.NDArray[np.int64],
+    ends: npt.NDArray[np.intp],
+    start: int,
+    remaining: int,
+    prefix: tuple[int, ...],
+) -> Generator[tuple[int, ...]]:
+    """The ``k == 2`` level of ``_search`` over the NumPy copies in ``data``."""
+    import numpy as np
+
+    # Distinct values with a copy in ``capped[start:]`` that are at most half of
+    # ``remaining``; each pairs with a larger complement, or with a second copy
+    lo = int(np.searchsorted(ends, start))
+    hi = int(np.searchsorted(distinct, remaining // 2, side="right"))
+    if hi <= lo:
+        return
+    values = distinct[lo:hi]
+    complements = np.int64(remaining) - values
+    found = np.searchsorted(distinct, complements)
+    np.minimum(found, distinct.size - 1, out=found)
+    hit = distinct[found] == complements
+    if 2 * int(values[-1]) == remaining:
+        end = int(ends[hi - 1])
+        hit[-1] = end > start and data.capped[end - 1] == remaining // 2
+    for value, complement in zip(values[hit].tolist(), complements[hit].tolist(), strict=True):
+        yield (*prefix, value, complement)
+
+
+def _search(
+    data: _Prepared, k: int, start: int, remaining: int, prefix: tuple[int, ...]
+) -> Generator[tuple[int, ...]]:
+    """Value tuples completing ``prefix`` with ``k`` values from ``capped[start:]``."""
+    capped, last = data.capped, data.last
+    size = len(capped)
+    if k == 2:
+        if (
+            data.array is not None
+            and data.ends is not None
+            and size - start >= VECTOR_MIN
+            and abs(remaining) + data.bound <= INT64_MAX
+        ):
+            yield from _two_sum_vectorized(data, data.array, data.ends, start, remaining, prefix)
+            return
+        for p in range(start, size - 1):
+            value = capped[p]
+            if p > start and capped[p - 1] == value:
+                continue
+            complement = remaining - value
+            if complement < value:
+                return
+            q = last.get(complement)
+            if q is not None and q > p:
+                yield (*prefix, value, complement)
+        return
+
+    for p in range(start, size - k + 1):
+        value = capped[p]
+        if p > start and capped[p - 1] == value:
+            continue
+        if data.window_sum(p, k) > remaining:
+            return
+        if value + data.top_sum(k - 1) < remaining:
+            continue
+        yield from _search(data, k - 1, p + 1, remaining - value, (*prefix, value))
+
+
+def _meet_in_the_middle(data: _Prepared, target: int) -> Generator[tuple[int, ...]]:
+    """4-sum by joining the lower pair ``(a, b)`` with upper pairs ``(c, d)``, ``b <= c``."""
+    distinct, counts = data.distinct, data.counts
+    by_sum: dict[int, list[tuple[int, int]]] = {}
+    for i, c in enumerate(distinct):
+        for d in distinct[i if counts[c] > 1 else i + 1 :]:
+            bucket = by_sum.get(c + d)
+            if bucket is None:
+                by_sum[c + d] = [(c, d)]
+            else:
+                bucket.append((c, d))
+    # Buckets are built in lexicographic order, so each is sorted by (c, d)
+
+    for i, a in enumerate(distinct):
+        for b in distinct[i if counts[a] > 1 else i + 1 :]:
+            uppers = by_sum.get(target - a - b)
+            if uppers is None:
+                continue
+            for c, d in uppers[bisect_left(uppers, (b, b)) :]:
+                if c == b:
+                    needed = (a == b) + 1 + (d == c) + 1
+                    if needed > counts[b]:
+                        continue
+                yield (a, b, c, d)
+
+
+def k_sum_generator(nums: Sequence[int], target: int, k: int = 3) -> Generator[KSumResult]:
+    """
+    Yield each distinct combination of ``k`` elements summing to ``target``.
+
+    Combinations are distinct by value; each is reported once, with values in
+    ascending order and the earliest positions holding them.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+        k: Number of elements per combination (at least 2)
+
+    Yields:
+        KSumResult: Combinations in lexicographic order of their values
+
+    Example:
+        >>> [r.values for r in k_sum_generator([-1, 0, 1, 2, -1, -4], 0)]
+        [(-1, -1, 2), (-1, 0, 1)]
+    """
+    _check_k(k)
+    data = _Prepared(nums, k)
+    if k == 4 and len(data.distinct) * (len(data.distinct) + 1) // 2 <= MITM_MAX_PAIRS:
+        combinations = _meet_in_the_middle(data, target)
+    else:
+        combinations = _search(data, k, 0, target, ())
+    for values in combinations:
+        yield data.result(values)
+
+
+def closest_k_sum(nums: Sequence[int], target: int, k: int = 3) -> KSumResult | None:
+    """
+    Find the combination of ``k`` elements whose sum is closest to ``target``.
+
+    Ties go to the smaller sum. Stops as soon as an exact match is found.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+        k: Number of elements per combination (at least 2)
+
+    Returns:
+        The closest KSumResult, or None if ``nums`` has fewer than ``k`` elements
+    """
+    _check_k(k)
+    data = _Prepared(nums, k)
+    capped = data.capped
+    size = len(capped)
+    if size < k:
+        return None
+    best: tuple[int, int, tuple[int, ...]] | None = None
+
+    def offer(total: int, values: tuple[int, ...]) -> bool:
+        """Record a candidate; True when it is exact."""
+        nonlocal best
+        key = (abs(total - target), total)
+        if best is None or key < best[:2]:
+            best = (*key, values)
+        return total == target
+
+    def search(k: int, start: int, remaining: int, prefix: tuple[int, ...]) -> bool:
+        if k == 2:
+            lo, hi = start, size - 1
+            while lo < hi:
+                total = capped[lo] + capped[hi]
+                if offer(target - remaining + total, (*prefix, capped[lo], capped[hi])):
+                    return True
+                if total < remaining:
+                    lo += 1
+                else:
+                    hi -= 1
+            return False
+
+        for p in range(start, size - k + 1):
+            value = capped[p]
+            if p > start and capped[p - 1] == value:
+                continue
+            low = data.window_sum(p, k)
+            if low >= remaining:
+                # Every later choice only grows the sum
+                return offer(target - remaining + low, (*prefix, *capped[p : p + k]))
+            high = value + data.top_sum(k - 1)
+            if high <= remaining:
+                if offer(target - remaining + high, (*prefix, value, *capped[size - k + 1 :])):
+                    return True
+                continue
+            if search(k - 1, p + 1, remaining - value, (*prefix, value)):
+                return True
+        return False
+
+    search(k, 0, target, ())
+    assert best is not None
+    return data.result(best[2])
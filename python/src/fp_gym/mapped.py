@@ -0,0 +1,213 @@
+"""
+Memory-mapped int64 inputs.
+
+Large inputs arrive as binary int64 dumps, either raw native-endian words or
+``.npy`` files. ``MappedInt64`` maps such a file read-only and exposes it as a
+``memoryview`` of format ``'q'`` (and, with NumPy, as a zero-copy ndarray), so
+solvers run over the page cache instead of a parsed ``list[int]``.
+
+Only the standard library is needed to map and iterate a file; the ``.npy``
+header is parsed here rather than through NumPy.
+"""
+
+import ast
+import mmap
+import struct
+import sys
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Self
+
+from .arrays.find_missing_repeating import (
+    find_missing_repeating_chunked,
+    find_missing_repeating_vectorized_chunked,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+    from .vectorized import TwoSumArrays
+
+NPY_MAGIC = b"\x93NUMPY"
+DEFAULT_CHUNK = 1 << 20
+
+_NATIVE_INT64 = {"<i8", "=i8", "i8"} if sys.byteorder == "little" else {">i8", "=i8", "i8"}
+
+
+def _npy_data_offset(head: bytes, path: Path) -> int:
+    """Validate a ``.npy`` header and return where the data starts."""
+    if len(head) < 12:
+        raise ValueError(f"{path}: truncated .npy header")
+    major = head[6]
+    if major == 1:
+        (length,) = struct.unpack_from("<H", head, 8)
+        start = 10
+    elif major in (2, 3):
+        (length,) = struct.unpack_from("<I", head, 8)
+        start = 12
+    else:
+        raise ValueError(f"{path}: unsupported .npy format version {major}")
+
+    try:
+        header: dict[str, Any] = ast.literal_eval(head[start : start + length].decode("latin1"))
+    except (SyntaxError, ValueError) as error:
+        raise ValueError(f"{path}: corrupt .npy header") from error
+    if not isinstance(header, dict):
+        raise ValueError(f"{path}: corrupt .npy header")
+    if header.get("descr") not in _NATIVE_INT64:
+        raise ValueError(f"{path}: expected native int64 data, got {header.get('descr')!r}")
+    if header.get("fortran_order") and len(header.get("shape", ())) > 1:
+        raise ValueError(f"{path}: Fortran-ordered arrays are not supported")
+    return start + int(length)
+
+
+class MappedInt64:
+    """
+    Read-only memory map of an int64 file.
+
+    Use as a context manager so the mapping is closed deterministically.
+    Views handed out by ``view``, ``chunks`` or ``array`` must be dropped
+    before closing.
+
+    Example:
+        >>> with MappedInt64("nums.npy") as nums:
+        ...     print(len(nums), nums[0])
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Map ``path``.
+
+        Args:
+            path: A ``.npy`` file (detected by its magic bytes) or a raw dump
+                of native-endian int64 words
+
+        Raises:
+            ValueError: If the file is truncated, or a ``.npy`` header is
+                corrupt or does not describe native int64 data
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            size = self.path.stat().st_size
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+
+        try:
+            offset = 0
+            if self._mmap is not None and self._mmap[: len(NPY_MAGIC)] == NPY_MAGIC:
+                offset = _npy_data_offset(self._mmap[:65536], self.path)
+            if offset > size or (size - offset) % 8:
+                raise ValueError(f"{self.path}: size is not a whole number of int64 words")
+        except BaseException:
+            if self._mmap is not None:
+                self._mmap.close()
+            raise
+
+        raw = memoryview(self._mmap) if self._mmap is not None else memoryview(b"")
+        self._view = raw[offset:].cast("q")
+
+    @property
+    def view(self) -> memoryview:
+        """The mapped data as a ``memoryview`` of format ``'q'``."""
+        return self._view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, index: int) -> int:
+        value: int = self._view[index]
+        return value
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._view)
+
+    def chunks(self, size: int = DEFAULT_CHUNK) -> Iterator[memoryview]:
+        """
+        Yield consecutive zero-copy slices of at most ``size`` elements.
+
+        Args:
+            size: Elements per chunk
+
+        Yields:
+            ``memoryview`` slices of format ``'q'``
+        """
+        if size < 1:
+            raise ValueError("chunk size must be positive")
+        for start in range(0, len(self._view), size):
+            yield self._view[start : start + size]
+
+    def array(self) -> "npt.NDArray[np.int64]":
+        """Zero-copy read-only NumPy view of the data (requires NumPy)."""
+        import numpy as np
+
+        return np.frombuffer(self._view, dtype=np.int64)
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def two_sum_file(path: str | Path, target: int) -> "TwoSumArrays":
+    """
+    Run the vectorized two sum engine directly over a mapped file.
+
+    The input is never parsed into Python ints; only the engine's own working
+    arrays (proportional to the input) are allocated. Requires NumPy.
+
+    Args:
+        path: ``.npy`` or raw int64 file
+        target: Target sum value
+
+    Returns:
+        TwoSumArrays with the same pairs as ``two_sum_generator``
+    """
+    from .vectorized import two_sum_arrays
+
+    with MappedInt64(path) as mapped:
+        data = mapped.array()
+        pairs = two_sum_arrays(data, target)
+        del data
+    return pairs
+
+
+def find_missing_repeating_file(
+    path: str | Path, chunk_size: int = DEFAULT_CHUNK
+) -> tuple[int, int]:
+    """
+    Solve missing/repeating over a mapped file, one chunk at a time.
+
+    Peak memory is bounded by ``chunk_size`` rather than by the file size.
+    With NumPy the chunks are summed in place by the vectorized variant;
+    otherwise they are summed in Python.
+
+    Args:
+        path: ``.npy`` or raw int64 file holding a permutation of ``1..n``
+            with one value replaced by a duplicate
+        chunk_size: Elements processed per chunk
+
+    Returns:
+        ``(missing, repeating)``
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        solve = find_missing_repeating_chunked
+    else:
+        solve = find_missing_repeating_vectorized_chunked
+
+    with MappedInt64(path) as mapped:
+        return solve(mapped.chunks(chunk_size))
@@ -0,0 +1,56 @@
+"""
+Nested-loop two sum for tiny inputs.
+
+For a handful of elements, scanning backwards from each element beats
+building a ``seen`` dict: no hashing and no allocation until a pair is found.
+Scanning from ``i - 1`` down finds the latest earlier complement, so the
+pairs are exactly those of ``two_sum_generator``. Quadratic, so only the
+dispatcher's smallest size class uses it.
+"""
+
+from collections.abc import Generator, Sequence
+
+from .buffers import int_sequence
+from .solver import TwoSumResult
+
+
+def nested_pairs(nums: Sequence[int], target: int) -> Generator[TwoSumResult]:
+    """
+    Yield the same pairs as ``two_sum_generator`` using a nested loop.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+
+    Yields:
+        TwoSumResult: One pair per element whose complement appears earlier
+    """
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    i = 0
+    for num in nums:
+        complement = target - num
+        j = i - 1
+        while j >= 0:
+            if nums[j] == complement:
+                yield TwoSumResult((j, i), (complement, num))
+                break
+            j -= 1
+        i += 1
+
+
+def nested_first(nums: Sequence[int], target: int) -> TwoSumResult | None:
+    """Return the first pair, as ``two_sum_fast`` would, or None."""
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    # ``while`` instead of ``range``: no iterator objects on these tiny inputs
+    i = 0
+    for num in nums:
+        complement = target - num
+        j = i - 1
+        while j >= 0:
+            if nums[j] == complement:
+                return TwoSumResult((j, i), (complement, num))
+            j -= 1
+        i += 1
+    return None
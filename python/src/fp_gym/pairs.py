@@ -0,0 +1,121 @@
+"""
+Exhaustive two sum enumeration.
+
+``two_sum_generator`` pairs each element with the *latest* earlier index of its
+complement, so when values repeat it reports one pair per element rather than
+every pair. This module keeps every earlier index per value instead:
+
+* ``all_pairs_generator`` yields one TwoSumResult per pair ``j < i``.
+* ``pair_chunks`` streams the same pairs as ``array('q')`` buffers, which is
+  far cheaper than one object per pair when the output is quadratic.
+* ``count_all_pairs`` counts them from value frequencies without building any.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Generator, Iterable, Iterator
+from itertools import repeat
+
+from .buffers import int_sequence
+from .solver import TwoSumResult
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def all_pairs_generator(nums: Iterable[int], target: int) -> Generator[TwoSumResult]:
+    """
+    Yield every pair of indices ``j < i`` whose values sum to ``target``.
+
+    Pairs are ordered by ``i`` and then by ``j``.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+
+    Yields:
+        TwoSumResult: One result per matching pair
+
+    Example:
+        >>> [r.indices for r in all_pairs_generator([1, 1, 1], 2)]
+        [(0, 1), (0, 2), (1, 2)]
+    """
+    positions: dict[int, list[int]] = {}
+
+    for i, num in enumerate(int_sequence(nums)):
+        complement = target - num
+        for j in positions.get(complement, ()):
+            yield TwoSumResult(indices=(j, i), values=(complement, num))
+        positions.setdefault(num, []).append(i)
+
+
+def pair_chunks(
+    nums: Iterable[int], target: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[tuple["array[int]", "array[int]"]]:
+    """
+    Stream every pair as chunks of parallel index buffers.
+
+    Each chunk is ``(left, right)`` where ``left[k] < right[k]`` are the indices
+    of the k-th pair, in the same order as ``all_pairs_generator``. Every chunk
+    holds exactly ``chunk_size`` pairs except possibly the last one.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+        chunk_size: Number of pairs per chunk
+
+    Yields:
+        Pairs of ``array('q')`` buffers
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+
+    positions: dict[int, array[int]] = {}
+    left: array[int] = array("q")
+    right: array[int] = array("q")
+
+    for i, num in enumerate(int_sequence(nums)):
+        earlier = positions.get(target - num)
+        if earlier:
+            start = 0
+            while start < len(earlier):
+                take = min(len(earlier) - start, chunk_size - len(left))
+                left.extend(earlier[start : start + take])
+                right.extend(repeat(i, take))
+                start += take
+                if len(left) == chunk_size:
+                    yield left, right
+                    left, right = array("q"), array("q")
+        bucket = positions.get(num)
+        if bucket is None:
+            positions[num] = array("q", (i,))
+        else:
+            bucket.append(i)
+
+    if left:
+        yield left, right
+
+
+def count_all_pairs(nums: Iterable[int], target: int) -> int:
+    """
+    Count every pair of indices whose values sum to ``target``.
+
+    Computed from value frequencies: ``freq[v] * freq[target - v]`` for each
+    pair of distinct values and ``C(freq[v], 2)`` when ``2 * v == target``.
+    No pair is materialized.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+
+    Returns:
+        Number of pairs ``j < i`` with ``nums[j] + nums[i] == target``
+    """
+    frequencies = Counter(int_sequence(nums))
+    total = 0
+    for value, count in frequencies.items():
+        complement = target - value
+        if complement > value:
+            total += count * frequencies.get(complement, 0)
+        elif complement == value:
+            total += count * (count - 1) // 2
+    return total
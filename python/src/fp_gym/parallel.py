@@ -0,0 +1,211 @@
+"""
+Process-parallel two sum over value-sharded inputs.
+
+A pair ``a + b == target`` always has ``min(a, target - a) == min(b, target - b)``,
+so hashing that canonical value sends every element and all of its complements
+to the same shard. Each shard can then be solved independently with the
+vectorized engine and the results merged by right index, reproducing exactly
+the pairs of ``two_sum_generator``.
+
+The input is copied once into ``multiprocessing.shared_memory`` and never
+pickled. Work runs in three parallel rounds on a ``ProcessPoolExecutor``:
+
+1. Chunks of the input compute their shard ids (stored in shared memory) and
+   per-shard counts.
+2. Chunks scatter their indices into one shared array grouped by shard, at
+   offsets given by a prefix sum of the counts (a parallel counting sort).
+3. Each shard reads its contiguous, ascending index range and solves it.
+
+Requires NumPy.
+"""
+
+import os
+import sys
+from collections.abc import Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import suppress
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from .vectorized import (
+    INT64_MAX,
+    INT64_MIN,
+    IntArray,
+    IntegerArray,
+    TwoSumArrays,
+    as_int64_array,
+    two_sum_arrays,
+)
+
+# Fibonacci hashing multiplier, spreads clustered values evenly over shards
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _attach(name: str) -> SharedMemory:
+    """Attach to an existing block without registering it for cleanup here."""
+    # ``track`` is new in 3.13; older interpreters share the parent's tracker
+    options: dict[str, Any] = {"track": False} if sys.version_info >= (3, 13) else {}
+    return SharedMemory(name=name, **options)
+
+
+def _release(*blocks: SharedMemory) -> None:
+    """Close attached blocks; views kept alive by a traceback are left to GC."""
+    for block in blocks:
+        with suppress(BufferError):
+            block.close()
+
+
+def _shard_ids(values: IntArray, target: int, shards: int) -> Any:
+    canonical = np.minimum(values, np.int64(target) - values).view(np.uint64)
+    return (canonical * _HASH_MULTIPLIER >> np.uint64(32)) % np.uint64(shards)
+
+
+def _count_chunk(
+    values_name: str, ids_name: str, n: int, start: int, stop: int, target: int, shards: int
+) -> IntArray:
+    """Round 1: compute shard ids of ``[start, stop)`` and count them."""
+    values_shm, ids_shm = _attach(values_name), _attach(ids_name)
+    try:
+        values = np.ndarray((n,), dtype=np.int64, buffer=values_shm.buf)
+        ids = np.ndarray((n,), dtype=np.uint16, buffer=ids_shm.buf)
+        ids[start:stop] = _shard_ids(values[start:stop], target, shards)
+        counts = np.bincount(ids[start:stop], minlength=shards).astype(np.int64)
+        del values, ids
+        return counts
+    finally:
+        _release(values_shm, ids_shm)
+
+
+def _scatter_chunk(
+    ids_name: str, grouped_name: str, n: int, start: int, stop: int, offsets: IntArray
+) -> None:
+    """Round 2: write the indices of ``[start, stop)`` into their shard's slots."""
+    ids_shm, grouped_shm = _attach(ids_name), _attach(grouped_name)
+    try:
+        ids = np.ndarray((n,), dtype=np.uint16, buffer=ids_shm.buf)
+        grouped = np.ndarray((n,), dtype=np.int64, buffer=grouped_shm.buf)
+        order = np.argsort(ids[start:stop], kind="stable")
+        sorted_ids = ids[start:stop][order]
+        # Rank of each element within its shard, for this chunk
+        first = np.searchsorted(sorted_ids, sorted_ids, side="left")
+        grouped[offsets[sorted_ids] + np.arange(order.size) - first] = order + start
+        del ids, grouped
+    finally:
+        _release(ids_shm, grouped_shm)
+
+
+def _solve_shard(
+    values_name: str, grouped_name: str, n: int, start: int, stop: int, target: int
+) -> tuple[IntArray, IntArray]:
+    """Round 3: solve one shard and map its pairs back to global indices."""
+    values_shm, grouped_shm = _attach(values_name), _attach(grouped_name)
+    try:
+        values = np.ndarray((n,), dtype=np.int64, buffer=values_shm.buf)
+        grouped = np.ndarray((n,), dtype=np.int64, buffer=grouped_shm.buf)
+        members = grouped[start:stop].copy()
+        pairs = two_sum_arrays(values[members], target)
+        del values, grouped
+        return members[pairs.left_indices], members[pairs.right_indices]
+    finally:
+        _release(values_shm, grouped_shm)
+
+
+def _bounds(n: int, parts: int) -> list[tuple[int, int]]:
+    step = -(-n // parts)
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+def two_sum_parallel(
+    nums: Sequence[int] | IntegerArray,
+    target: int,
+    workers: int | None = None,
+    shards: int | None = None,
+    executor: Executor | None = None,
+) -> TwoSumArrays:
+    """
+    Process-parallel equivalent of ``two_sum_arrays``.
+
+    Args:
+        nums: Integers to search (a list or any integer NumPy array)
+        target: Target sum value
+        workers: Worker processes (defaults to ``os.cpu_count()``)
+        shards: Number of value shards (defaults to four per worker so that a
+            skewed shard does not hold up the others, at most 65535)
+        executor: Existing process pool to reuse instead of starting one
+
+    Returns:
+        TwoSumArrays with the same pairs, in the same order, as the generator
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = shards or min(4 * workers, 0xFFFF)
+    if not 1 <= shards <= 0xFFFF:
+        raise ValueError("shards must be between 1 and 65535")
+
+    arr = as_int64_array(nums)
+    if arr is None or arr.size < 2:
+        return two_sum_arrays(nums, target)
+    lo, hi = int(arr.min()), int(arr.max())
+    in_range = INT64_MIN <= target - hi and target - lo <= INT64_MAX
+    if not (in_range and INT64_MIN <= target <= INT64_MAX):
+        return two_sum_arrays(arr, target)
+
+    n = int(arr.size)
+    blocks = [SharedMemory(create=True, size=max(1, n * size)) for size in (8, 2, 8)]
+    values_shm, ids_shm, grouped_shm = blocks
+    own_pool = executor is None
+    pool = ProcessPoolExecutor(max_workers=workers) if executor is None else executor
+    try:
+        np.ndarray((n,), dtype=np.int64, buffer=values_shm.buf)[:] = arr
+        chunks = _bounds(n, workers)
+
+        counts = [
+            future.result()
+            for future in [
+                pool.submit(_count_chunk, values_shm.name, ids_shm.name, n, a, b, target, shards)
+                for a, b in chunks
+            ]
+        ]
+        per_chunk = np.stack(counts)
+        shard_sizes = per_chunk.sum(axis=0)
+        shard_starts = np.concatenate(([0], np.cumsum(shard_sizes)[:-1]))
+        chunk_offsets = shard_starts + np.cumsum(per_chunk, axis=0) - per_chunk
+
+        for future in [
+            pool.submit(_scatter_chunk, ids_shm.name, grouped_shm.name, n, a, b, offsets)
+            for (a, b), offsets in zip(chunks, chunk_offsets, strict=True)
+        ]:
+            future.result()
+
+        solved = [
+            future.result()
+            for future in [
+                pool.submit(
+                    _solve_shard,
+                    values_shm.name,
+                    grouped_shm.name,
+                    n,
+                    int(a),
+                    int(a + size),
+                    target,
+                )
+                for a, size in zip(shard_starts, shard_sizes, strict=True)
+                if size >= 2
+            ]
+        ]
+    finally:
+        if own_pool:
+            pool.shutdown()
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    if not solved:
+        empty = np.empty(0, dtype=np.int64)
+        return TwoSumArrays(empty, empty, empty, empty)
+    left = np.concatenate([pair[0] for pair in solved])
+    right = np.concatenate([pair[1] for pair in solved])
+    order = np.argsort(right)
+    left, right = left[order], right[order]
+    return TwoSumArrays(left, right, arr[left], arr[right])
@@ -0,0 +1,275 @@
+"""
+Probabilistic prefilter for two sum queries that usually find nothing.
+
+``PairSumFilter`` is built once per ``nums`` and answers "definitely no pair
+sums to ``target``" in O(1), so only the targets it cannot rule out pay for
+the exact O(n) search. It never rejects a target that has a pair.
+
+A filter over the values alone cannot do this: ruling out a pair would
+still probe the complement of every element. The filter instead summarizes
+the *sumset*, the set of sums of two elements at distinct positions, in
+layers:
+
+1. Exact bounds: no target outside ``[two smallest, two largest]`` has a pair.
+2. When the input has few enough distinct values (``max_sums`` distinct-value
+   pairs, about 2,900 distinct values by default), a Bloom filter holding
+   every pair sum, sized for the requested false positive rate. Building it
+   is O(d^2) for ``d`` distinct values, vectorized with NumPy when installed.
+3. Otherwise residue masks: for a few small moduli ``M``, the residues
+   ``(a + b) mod M`` that pairs can reach. Cheap and exact about what they
+   reject, but they only reject targets on structured inputs (all even
+   values, say).
+
+``stats`` counts how many queries the filter answered alone and how many
+of the exact searches it let through came back empty.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from .buffers import int_sequence
+from .dispatch import INT64_MAX, INT64_MIN, _have_numpy
+from .solver import TwoSumResult, _maybe, two_sum_fast
+
+if TYPE_CHECKING:
+    from returns.maybe import Maybe
+
+# Largest number of distinct-value pairs hashed into the Bloom filter
+DEFAULT_MAX_SUMS = 1 << 22
+
+# Moduli of the residue masks, pairwise coprime apart from 63 = 7 * 9
+RESIDUE_MODULI = (64, 63, 61, 59)
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+# Sums hashed per vectorized block
+_BLOCK_SUMS = 1 << 20
+
+FilterKind = Literal["bloom", "residues"]
+ExactSearch = Callable[[Sequence[int], int], TwoSumResult | None]
+
+
+@dataclass
+class FilterStats:
+    """How often the exact search was avoided."""
+
+    queries: int = 0
+    rejected: int = 0
+    exact: int = 0
+    false_positives: int = 0
+
+    @property
+    def avoided_rate(self) -> float:
+        """Fraction of queries answered by the filter alone."""
+        return self.rejected / self.queries if self.queries else 0.0
+
+
+def _mix(value: int) -> int:
+    """splitmix64 finalizer of ``value`` modulo 2**64."""
+    z = (value + _GOLDEN) & _MASK64
+    z = ((z ^ (z >> 30)) * _MIX1) & _MASK64
+    z = ((z ^ (z >> 27)) * _MIX2) & _MASK64
+    return z ^ (z >> 31)
+
+
+class _Bloom:
+    """Bloom filter over int64 sums with double hashing of one 64-bit mix."""
+
+    def __init__(self, items: int, false_positive_rate: float) -> None:
+        items = max(items, 1)
+        self.size = max(64, math.ceil(-items * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / items * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value: int) -> list[int]:
+        mixed = _mix(value & _MASK64)
+        step = (mixed >> 32) | 1
+        size = self.size
+        return [((mixed + k * step) & _MASK64) % size for k in range(self.hashes)]
+
+    def add(self, value: int) -> None:
+        bits = self.bits
+        for position in self._positions(value):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def mark(self, sums: Any, marks: Any) -> None:
+        """Set the positions of an int64 NumPy array in a bool array of ``size`` slots."""
+        import numpy as np
+
+        z = sums.view(np.uint64) + np.uint64(_GOLDEN)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(_MIX1)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(_MIX2)
+        mixed = z ^ (z >> np.uint64(31))
+        step = (mixed >> np.uint64(32)) | np.uint64(1)
+        size = np.uint64(self.size)
+        for k in range(self.hashes):
+            marks[((mixed + np.uint64(k) * step) % size).astype(np.intp)] = True
+
+    def pack(self, marks: Any) -> None:
+        """Adopt the bits set by ``mark``; same layout as repeated ``add``."""
+        import numpy as np
+
+        self.bits[:] = np.packbits(marks, bitorder="little").tobytes()
+
+    def __contains__(self, value: int) -> bool:
+        bits = self.bits
+        return all(bits[p >> 3] >> (p & 7) & 1 for p in self._positions(value))
+
+
+class PairSumFilter:
+    """
+    Sumset prefilter in front of an exact two sum search over fixed ``nums``.
+
+    ``kind`` says which layer backs the filter: ``"bloom"`` up to ``max_sums``
+    distinct-value pairs, ``"residues"`` beyond. Residue masks reject almost
+    no targets on unstructured inputs, so a ``"residues"`` filter mostly adds
+    its own overhead to the exact search.
+
+    Example:
+        >>> f = PairSumFilter([2, 7, 11, 15])
+        >>> f.might_have_pair(10)
+        False
+        >>> f.first_pair(9).indices
+        (0, 1)
+    """
+
+    def __init__(
+        self,
+        nums: Sequence[int],
+        false_positive_rate: float = 0.01,
+        *,
+        max_sums: int = DEFAULT_MAX_SUMS,
+        exact: ExactSearch | None = None,
+    ) -> None:
+        """
+        Build the filter.
+
+        Args:
+            nums: Integers to search; must not change while the filter is used
+            false_positive_rate: Target false positive rate of the Bloom layer
+            max_sums: Largest number of distinct-value pairs hashed into the
+                Bloom filter; more distinct values use residue masks
+            exact: Exact first-pair search run when the filter cannot rule a
+                target out (``two_sum_fast`` by default)
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        self.nums = int_sequence(nums)
+        self.false_positive_rate = false_positive_rate
+        self._exact: ExactSearch = exact or two_sum_fast
+        self.stats = FilterStats()
+        self._bloom: _Bloom | None = None
+        self._residues: list[int] = []
+
+        counts = Counter(self.nums)
+        distinct = sorted(counts)
+        # Smallest and largest pair sums, repeated values counted twice
+        low = [v for v in distinct[:2] for _ in range(min(counts[v], 2))][:2]
+        high = [v for v in distinct[-2:] for _ in range(min(counts[v], 2))][-2:]
+        self.bounds = (sum(low), sum(high)) if len(low) == 2 else (1, 0)
+
+        pairs = len(distinct) * (len(distinct) - 1) // 2
+        if pairs <= max_sums:
+            self.kind: FilterKind = "bloom"
+            self._build_bloom(distinct, counts, pairs)
+        else:
+            self.kind = "residues"
+            self._build_residues(distinct, counts)
+
+    def _build_bloom(self, distinct: list[int], counts: Counter[int], pairs: int) -> None:
+        doubled = [2 * v for v in distinct if counts[v] > 1]
+        bloom = self._bloom = _Bloom(pairs + len(doubled), self.false_positive_rate)
+        fits = not distinct or (INT64_MIN <= 2 * distinct[0] and 2 * distinct[-1] <= INT64_MAX)
+        if fits and _have_numpy():
+            import numpy as np
+
+            # One byte per bit while building: fancy assignment beats bitwise_or.at
+            marks = np.zeros(bloom.size, dtype=bool)
+            values = np.asarray(distinct, dtype=np.int64)
+            block = [np.asarray(doubled, dtype=np.int64)]
+            pending = len(doubled)
+            for i in range(len(distinct) - 1):
+                block.append(values[i] + values[i + 1 :])
+                pending += len(distinct) - 1 - i
+                if pending >= _BLOCK_SUMS:
+                    bloom.mark(np.concatenate(block), marks)
+                    block, pending = [], 0
+            bloom.mark(np.concatenate(block), marks)
+            bloom.pack(marks)
+            return
+        for value in doubled:
+            bloom.add(value)
+        for i, a in enumerate(distinct):
+            for b in distinct[i + 1 :]:
+                bloom.add(a + b)
+
+    def _build_residues(self, distinct: list[int], counts: Counter[int]) -> None:
+        for modulus in RESIDUE_MODULI:
+            present: dict[int, int] = {}
+            for value in distinct:
+                residue = value % modulus
+                present[residue] = present.get(residue, 0) + counts[value]
+            reachable = 0
+            for a, count in present.items():
+                for b in present:
+                    if a != b or count > 1:
+                        reachable |= 1 << ((a + b) % modulus)
+            self._residues.append(reachable)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the Bloom bits (0 for residue masks)."""
+        return 0 if self._bloom is None else len(self._bloom.bits)
+
+    def might_have_pair(self, target: int) -> bool:
+        """
+        Whether some pair may sum to ``target``; False is always correct.
+
+        Does not touch ``stats``.
+        """
+        low, high = self.bounds
+        if not low <= target <= high:
+            return False
+        if self._bloom is not None:
+            return target in self._bloom
+        return all(
+            mask >> (target % modulus) & 1
+            for modulus, mask in zip(RESIDUE_MODULI, self._residues, strict=True)
+        )
+
+    def first_pair(self, target: int) -> TwoSumResult | None:
+        """
+        ``two_sum_fast(nums, target)``, skipping the search when the filter says no.
+
+        Args:
+            target: Target sum value
+
+        Returns:
+            The first TwoSumResult, or None if there is no pair
+        """
+        stats = self.stats
+        stats.queries += 1
+        if not self.might_have_pair(target):
+            stats.rejected += 1
+            return None
+        stats.exact += 1
+        result = self._exact(self.nums, target)
+        if result is None:
+            stats.false_positives += 1
+        return result
+
+    def has_pair(self, target: int) -> bool:
+        """Whether any pair sums to ``target``; exact."""
+        return self.first_pair(target) is not None
+
+    def two_sum(self, target: int) -> Maybe[TwoSumResult]:
+        """``first_pair`` wrapped in ``Maybe``, as ``two_sum`` returns it."""
+        return _maybe(self.first_pair(target))
@@ -0,0 +1,104 @@
+"""
+Two sum over input already sorted in ascending order.
+
+On sorted input no hash table is needed. For element ``i`` the complement
+``c = target - nums[i]`` can only occur earlier if ``c <= nums[i]``, so pairs
+start at the first ``i`` with ``2 * nums[i] >= target``. From there ``c``
+only decreases, and a single pointer ``p`` (the last index holding a value
+``<= c``) walks left as ``i`` walks right. The latest earlier complement is
+then ``min(p, i - 1)`` when that slot holds ``c``. This reproduces the pairs
+of ``two_sum_generator`` exactly, in O(n) time and O(1) extra memory.
+
+For a first-pair search the pointer can gallop (exponential then binary
+search) instead of stepping, which costs O(log n) per step when the answer
+sits near the middle or the ends rather than O(n) for the walk.
+
+The functions trust the caller that ``nums`` is sorted; ``is_sorted``
+verifies it at C speed for callers that cannot promise it.
+"""
+
+import operator
+from bisect import bisect_left, bisect_right
+from collections.abc import Generator, Sequence
+from itertools import islice
+
+from .buffers import int_sequence
+from .solver import TwoSumResult
+
+
+def is_sorted(nums: Sequence[int]) -> bool:
+    """Whether ``nums`` is non-decreasing (NumPy arrays are checked vectorized)."""
+    if getattr(nums, "dtype", None) is not None:
+        return bool((nums[1:] >= nums[:-1]).all())  # type: ignore[operator]
+    return all(map(operator.le, nums, islice(nums, 1, None)))
+
+
+def _last_at_most(nums: Sequence[int], value: int, hi: int) -> int:
+    """Largest ``p <= hi`` with ``nums[p] <= value`` (or -1), galloping left from ``hi``."""
+    if hi < 0 or nums[hi] <= value:
+        return hi
+    step = 1
+    lo = hi - 1
+    while lo >= 0 and nums[lo] > value:
+        hi = lo
+        step *= 2
+        lo = hi - step
+    return bisect_right(nums, value, max(lo, 0), hi) - 1
+
+
+def sorted_pairs(nums: Sequence[int], target: int) -> Generator[TwoSumResult]:
+    """
+    Two-pointer equivalent of ``two_sum_generator`` for ascending input.
+
+    Args:
+        nums: Integers sorted in ascending order
+        target: Target sum value
+
+    Yields:
+        TwoSumResult: One pair per element whose complement appears earlier
+    """
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    n = len(nums)
+    p = n - 1
+    for i in range(bisect_left(nums, -(-target // 2)), n):
+        num = nums[i]
+        complement = target - num
+        while p >= 0 and nums[p] > complement:
+            p -= 1
+        if p < 0:
+            return
+        j = p if p < i else i - 1
+        if j >= 0 and nums[j] == complement:
+            yield TwoSumResult((j, i), (complement, num))
+
+
+def sorted_first(nums: Sequence[int], target: int, *, gallop: bool = True) -> TwoSumResult | None:
+    """
+    First pair, as ``two_sum_fast`` would return it, for ascending input.
+
+    Args:
+        nums: Integers sorted in ascending order
+        target: Target sum value
+        gallop: Move the complement pointer by exponential search rather
+            than one step at a time
+
+    Returns:
+        The first TwoSumResult, or None if there is no pair
+    """
+    if not gallop:
+        return next(sorted_pairs(nums, target), None)
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    n = len(nums)
+    p = n - 1
+    for i in range(bisect_left(nums, -(-target // 2)), n):
+        num = nums[i]
+        complement = target - num
+        p = _last_at_most(nums, complement, p)
+        if p < 0:
+            return None
+        j = p if p < i else i - 1
+        if j >= 0 and nums[j] == complement:
+            return TwoSumResult((j, i), (complement, num))
+    return None
@@ -0,0 +1,205 @@
+"""
+Opt-in instrumentation for the two sum and missing/repeating engines.
+
+Pass a ``SolveStats`` to ``two_sum_generator(..., stats=...)`` or to a
+``find_missing_repeating*`` function, or give ``TwoSumSolver`` an
+``on_stats`` callback, and the call runs an instrumented copy of its loop
+that records:
+
+* ``elements_scanned``: input elements consumed
+* ``table_size`` / ``table_high_water`` / ``table_bytes``: entries in the
+  lookup table at the end, the most it ever held, and its memory footprint
+* ``pairs_emitted`` and ``first_pair_ns``: output and time to the first pair
+* ``total_ns``: wall time from the first step to completion
+* ``consumer_ns``: time a generator spent suspended at ``yield``, i.e. in
+  the consumer; ``busy_ns`` is the rest
+
+Without a stats object the plain loops run unchanged: the choice is made
+once per call, never per element.
+"""
+
+import sys
+import time
+from collections.abc import Callable, Generator, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .buffers import int_sequence
+from .solver import TwoSumResult
+
+
+@dataclass
+class SolveStats:
+    """Counters and timings of one instrumented call."""
+
+    operation: str = ""
+    engine: str | None = None
+    elements_scanned: int = 0
+    table_size: int = 0
+    table_high_water: int = 0
+    table_bytes: int = 0
+    pairs_emitted: int = 0
+    first_pair_ns: int | None = None
+    total_ns: int = 0
+    consumer_ns: int = 0
+
+    @property
+    def busy_ns(self) -> int:
+        """Time spent in the engine itself, excluding the consumer."""
+        return self.total_ns - self.consumer_ns
+
+    def summary(self) -> str:
+        first = "-" if self.first_pair_ns is None else f"{self.first_pair_ns / 1e6:.3f}ms"
+        return (
+            f"{self.operation}[{self.engine or '-'}]: {self.elements_scanned} scanned, "
+            f"table {self.table_size} (peak {self.table_high_water}, {self.table_bytes} B), "
+            f"{self.pairs_emitted} pairs, first {first}, total {self.total_ns / 1e6:.3f}ms, "
+            f"consumer {self.consumer_ns / 1e6:.3f}ms"
+        )
+
+
+StatsCallback = Callable[[SolveStats], None]
+
+
+def _record_table(stats: SolveStats, table: Any) -> None:
+    size = len(table)
+    stats.table_size = size
+    stats.table_high_water = max(stats.table_high_water, size)
+    stats.table_bytes = max(stats.table_bytes, sys.getsizeof(table))
+
+
+def two_sum_scan(
+    nums: Sequence[int],
+    target: int,
+    stats: SolveStats,
+    *,
+    lazy_values: bool = False,
+    on_finish: StatsCallback | None = None,
+) -> Generator[TwoSumResult]:
+    """
+    Instrumented ``two_sum_generator``; same pairs, same order.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+        stats: Filled in as the scan runs and finalized when it ends
+        lazy_values: As in ``two_sum_generator``
+        on_finish: Called with ``stats`` once the generator is exhausted or closed
+
+    Yields:
+        TwoSumResult: One pair per element whose complement appears earlier
+    """
+    nums = int_sequence(nums)
+    clock = time.perf_counter_ns
+    seen: dict[int, int] = {}
+    scanned = 0
+    suspended: int | None = None
+    start = clock()
+    try:
+        for i, num in enumerate(nums):
+            scanned = i + 1
+            j = seen.get(target - num)
+            if j is not None:
+                suspended = clock()
+                if stats.first_pair_ns is None:
+                    stats.first_pair_ns = suspended - start
+                stats.pairs_emitted += 1
+                if lazy_values:
+                    yield TwoSumResult((j, i), None, nums)
+                else:
+                    yield TwoSumResult((j, i), (target - num, num))
+                stats.consumer_ns += clock() - suspended
+                suspended = None
+            seen[num] = i
+    finally:
+        end = clock()
+        if suspended is not None:
+            # Closed while the consumer held a result
+            stats.consumer_ns += end - suspended
+        stats.elements_scanned += scanned
+        stats.total_ns += end - start
+        _record_table(stats, seen)
+        if on_finish is not None:
+            on_finish(stats)
+
+
+def observe(
+    items: Iterable[Any],
+    stats: SolveStats,
+    *,
+    scanned: int = 0,
+    on_finish: StatsCallback | None = None,
+) -> Generator[Any]:
+    """
+    Count and time the output of any engine without looking inside it.
+
+    Args:
+        items: Pairs produced by an engine
+        stats: Filled in as items flow and finalized when the generator ends
+        scanned: Input length to record as scanned
+        on_finish: Called with ``stats`` once the generator is exhausted or closed
+
+    Yields:
+        The items, unchanged
+    """
+    clock = time.perf_counter_ns
+    suspended: int | None = None
+    start = clock()
+    try:
+        for item in items:
+            suspended = clock()
+            if stats.first_pair_ns is None:
+                stats.first_pair_ns = suspended - start
+            stats.pairs_emitted += 1
+            yield item
+            stats.consumer_ns += clock() - suspended
+            suspended = None
+    finally:
+        end = clock()
+        if suspended is not None:
+            stats.consumer_ns += end - suspended
+        stats.elements_scanned += scanned
+        stats.total_ns += end - start
+        if on_finish is not None:
+            on_finish(stats)
+
+
+def timed(
+    stats: SolveStats,
+    run: Callable[[], Any],
+    scanned: int = 0,
+    *,
+    table: int = 0,
+    on_finish: StatsCallback | None = None,
+) -> Any:
+    """
+    Time a call that does not expose its loop (vectorized or in-place engines).
+
+    Args:
+        stats: Receives the total time and the given sizes
+        run: The call to time
+        scanned: Elements the call consumes
+        table: Entries in the table it builds (0 for table-free engines)
+        on_finish: Called with ``stats`` afterwards
+
+    Returns:
+        Whatever ``run`` returns
+    """
+    start = time.perf_counter_ns()
+    try:
+        return run()
+    finally:
+        stats.total_ns += time.perf_counter_ns() - start
+        stats.elements_scanned += scanned
+        stats.table_size = table
+        stats.table_high_water = max(stats.table_high_water, table)
+        if on_finish is not None:
+            on_finish(stats)
+
+
+def counted(chunks: Iterable[Sequence[int]], stats: SolveStats) -> Generator[Sequence[int]]:
+    """Pass chunks through, adding their lengths to ``elements_scanned``."""
+    for chunk in chunks:
+        size = getattr(chunk, "size", None)
+        stats.elements_scanned += len(chunk) if size is None else int(size)
+        yield chunk
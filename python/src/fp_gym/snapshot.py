@@ -0,0 +1,284 @@
+"""
+On-disk snapshots of a ``TwoSumIndex`` that are queried straight from the page cache.
+
+``TwoSumIndex.save`` writes the index once; ``MappedTwoSumIndex`` maps the
+file read-only and answers queries immediately, without rebuilding anything.
+Processes mapping the same file share its pages. Like ``fp_gym.mapped``,
+only the standard library is needed to map and query a snapshot; NumPy is
+used for ``query_many`` when installed, over zero-copy views of the file.
+
+Format (version 1), all integers native-endian:
+
+* A 64-byte header: the magic ``b"FPGYMIDX"``, the format version and a byte
+  order mark (uint32 each), then the input length ``n``, the number of
+  distinct values ``d`` and the hash table size ``m`` (int64 each).
+* Eight int64 sections, back to back:
+
+  - ``values[d]``: distinct values in order of first occurrence
+  - ``firsts[d]`` / ``seconds[d]``: first and second index of each value
+    (-1 when it occurs once)
+  - ``sorted_values[d]`` / ``sorted_firsts[d]``: the same values ascending,
+    with their first index
+  - ``starts[d + 1]`` / ``indices[n]``: the ascending indices of value ``k``
+    are ``indices[starts[k]:starts[k + 1]]``
+  - ``table[m]``: open-addressing hash table, linear probing, holding
+    ``k + 1`` for value ``k`` (0 marks an empty slot); ``m`` is a power of two
+    at least twice ``d``
+
+Snapshots are written to a temporary file and renamed into place, so
+processes that already map an older snapshot keep a consistent view.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import secrets
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Self
+
+from .index import TwoSumIndex
+from .solver import TwoSumResult
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+MAGIC = b"FPGYMIDX"
+VERSION = 1
+
+_HEADER = struct.Struct("=8sIIqqq")
+_HEADER_SIZE = 64
+_BYTE_ORDER_MARK = 0x01020304
+
+# Fibonacci hashing: multiply by 2**64 / phi and keep the top bits
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def _table_bits(distinct: int) -> int:
+    """Bits of the table size: at most half full, at least two slots."""
+    return max(1, (2 * distinct - 1).bit_length())
+
+
+def _slot(value: int, shift: int) -> int:
+    return ((value * _GOLDEN) & _MASK64) >> shift
+
+
+def write_snapshot(index: TwoSumIndex, path: str | Path) -> None:
+    """
+    Serialize ``index`` to ``path`` (see the module docstring for the format).
+
+    Args:
+        index: Any index, including a mapped one
+        path: Destination; replaced atomically
+
+    Raises:
+        OverflowError: If a value does not fit in int64
+    """
+    values: array[int] = array("q")
+    firsts: array[int] = array("q")
+    seconds: array[int] = array("q")
+    starts: array[int] = array("q", (0,))
+    indices: array[int] = array("q")
+    for value, positions in index._groups():
+        values.append(value)
+        firsts.append(positions[0])
+        seconds.append(positions[1] if len(positions) > 1 else -1)
+        indices.extend(positions)
+        starts.append(len(indices))
+
+    distinct = len(values)
+    order = sorted(range(distinct), key=values.__getitem__)
+    sorted_values = array("q", [values[k] for k in order])
+    sorted_firsts = array("q", [firsts[k] for k in order])
+
+    bits = _table_bits(distinct)
+    shift, mask = 64 - bits, (1 << bits) - 1
+    table = array("q", bytes(8 << bits))
+    for k, value in enumerate(values):
+        slot = _slot(value, shift)
+        while table[slot]:
+            slot = (slot + 1) & mask
+        table[slot] = k + 1
+
+    target = Path(path)
+    # Not mkstemp: its files are private (0600), "x" mode honours the umask
+    temporary = target.with_name(f".{target.name}.{secrets.token_hex(8)}")
+    try:
+        with temporary.open("xb") as out:
+            header = _HEADER.pack(
+                MAGIC, VERSION, _BYTE_ORDER_MARK, len(index), distinct, len(table)
+            )
+            out.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for section in (
+                values,
+                firsts,
+                seconds,
+                sorted_values,
+                sorted_firsts,
+                starts,
+                indices,
+                table,
+            ):
+                section.tofile(out)
+        os.replace(temporary, target)
+    except BaseException:
+        temporary.unlink(missing_ok=True)
+        raise
+
+
+class MappedTwoSumIndex(TwoSumIndex):
+    """
+    Read-only ``TwoSumIndex`` backed by a memory-mapped snapshot.
+
+    Opening costs O(1): the header is validated and the sections are viewed
+    in place. Queries give exactly the answers of the index that was saved.
+    Use as a context manager so the mapping is closed deterministically.
+
+    Example:
+        >>> TwoSumIndex(nums).save("nums.idx")
+        >>> with MappedTwoSumIndex("nums.idx") as index:
+        ...     index.query_fast(9)
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """
+        Map ``path``.
+
+        Args:
+            path: A file written by ``TwoSumIndex.save``
+
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version
+                written with this machine's byte order, or is truncated
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            size = self.path.stat().st_size
+            if size < _HEADER_SIZE:
+                raise ValueError(f"{self.path}: not a two sum index snapshot")
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, mark, length, distinct, slots = _HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{self.path}: not a two sum index snapshot")
+            if version != VERSION:
+                raise ValueError(f"{self.path}: unsupported snapshot version {version}")
+            if mark != _BYTE_ORDER_MARK:
+                raise ValueError(f"{self.path}: written with a different byte order")
+            if slots != 1 << _table_bits(distinct):
+                raise ValueError(f"{self.path}: corrupt hash table size {slots}")
+            words = 5 * distinct + (distinct + 1) + length + slots
+            if size != _HEADER_SIZE + 8 * words:
+                raise ValueError(f"{self.path}: truncated or corrupt snapshot")
+        except BaseException:
+            self._mmap.close()
+            raise
+
+        self._size = length
+        self._arrays = None
+        self._shift = 64 - _table_bits(distinct)
+        self._mask = slots - 1
+        data = memoryview(self._mmap)[_HEADER_SIZE:].cast("q")
+        bounds = [0]
+        for count in (distinct,) * 5 + (distinct + 1, length, slots):
+            bounds.append(bounds[-1] + count)
+        self._views = [data[a:b] for a, b in zip(bounds, bounds[1:], strict=False)]
+        data.release()
+        self._values, self._firsts, self._seconds = self._views[:3]
+        self._starts, self._indices, self._table = self._views[5:]
+
+    @property
+    def distinct(self) -> int:
+        return len(self._values)
+
+    def _ordinal(self, value: int) -> int:
+        """Position of ``value`` in ``values``, or -1 when it does not occur."""
+        table, values, mask = self._table, self._values, self._mask
+        slot = _slot(value, self._shift)
+        while True:
+            entry = table[slot]
+            if entry == 0:
+                return -1
+            if values[entry - 1] == value:
+                return int(entry) - 1
+            slot = (slot + 1) & mask
+
+    def positions(self, value: int) -> tuple[int, ...]:
+        k = self._ordinal(value)
+        if k < 0:
+            return ()
+        return tuple(self._indices[self._starts[k] : self._starts[k + 1]].tolist())
+
+    def _groups(self) -> Iterator[tuple[int, Sequence[int]]]:
+        starts, indices = self._starts, self._indices
+        for k, value in enumerate(self._values):
+            yield value, indices[starts[k] : starts[k + 1]]
+
+    def _first_completion(self, target: int) -> tuple[int, int]:
+        values, firsts, seconds = self._values, self._firsts, self._seconds
+        ordinal = self._ordinal
+        best, finishing = -1, 0
+        for k in range(len(values)):
+            first = firsts[k]
+            if best != -1 and first >= best:
+                break
+            value = values[k]
+            complement = target - value
+            if complement == value:
+                candidate = seconds[k]
+                if candidate < 0:
+                    continue
+                candidate_value = value
+            else:
+                other = ordinal(complement)
+                if other < 0:
+                    continue
+                other_first = firsts[other]
+                if other_first > first:
+                    candidate, candidate_value = other_first, complement
+                else:
+                    candidate, candidate_value = first, value
+            if best == -1 or candidate < best:
+                best, finishing = candidate, candidate_value
+        return best, finishing
+
+    def _result_at(self, right: int, target: int, value: int) -> TwoSumResult:
+        complement = target - value
+        k = self._ordinal(complement)
+        indices = self._indices
+        left = indices[bisect_left(indices, right, self._starts[k], self._starts[k + 1]) - 1]
+        return TwoSumResult(indices=(left, right), values=(complement, value))
+
+    def _numpy_arrays(self) -> tuple[npt.NDArray[np.int64], ...]:
+        """Zero-copy NumPy views of the five query sections."""
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = tuple(np.frombuffer(view, dtype=np.int64) for view in self._views[:5])
+        return self._arrays
+
+    def close(self) -> None:
+        """Release the mapping; arrays from earlier queries must be dropped first."""
+        self._arrays = None
+        for view in self._views:
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -3,19 +3,87 @@ Two Sum implementation using generators for stack safety and memory efficiency.
 
 This module provides a stack-safe implementation of the two sum problem using
 generators to avoid stack overflow on large datasets and enable lazy evaluation.
+
+``returns`` is imported lazily, on the first call that builds a ``Maybe``, so
+code that only uses ``two_sum_fast`` or the generators never pays for it.
+
+Every function and solver method accepts a list or any other integer
+sequence or buffer (``array('q')``, ``memoryview``, ``bytes``, ``mmap``, NumPy
+arrays). Buffers are iterated in place through ``fp_gym.buffers.int_sequence``,
+never copied into a list.
 """
 
-from collections.abc import Generator
+from __future__ import annotations
+
+from collections.abc import Generator, Iterator, Sequence
+from functools import cache, partial
+from types import ModuleType
+from typing import TYPE_CHECKING, Literal
+
+from .buffers import int_sequence
 
-from returns.maybe import Maybe, Nothing, Some
+if TYPE_CHECKING:
+    from array import array
+
+    from returns.maybe import Maybe
+
+    from .cache import ResultCache
+    from .dense import DenseTable, DenseTablePool
+    from .dispatch import Choice, Dispatcher, Operation
+    from .index import TwoSumIndex
+    from .ksum import KSumResult
+    from .prefilter import PairSumFilter
+    from .profiling import SolveStats, StatsCallback
+    from .vectorized import TwoSumArrays
+
+Engine = Literal["python", "numpy", "process", "thread", "nested", "dense", "sorted"]
+Backend = Literal["auto"] | Engine
+BACKENDS: tuple[Backend, ...] = (
+    "python",
+    "numpy",
+    "process",
+    "thread",
+    "nested",
+    "dense",
+    "sorted",
+    "auto",
+)
 
 
 class TwoSumResult:
-    """Container for two sum results with lazy evaluation."""
+    """
+    Container for two sum results with lazy evaluation.
 
-    def __init__(self, indices: tuple[int, int], values: tuple[int, int]) -> None:
+    Instances are slotted (no per-instance ``__dict__``). When built with a
+    ``source`` sequence instead of ``values``, the values tuple is only read
+    from ``source`` on first access, so results whose values are never looked
+    at cost a single ``indices`` tuple.
+    """
+
+    __slots__ = ("indices", "_values", "_source")
+
+    def __init__(
+        self,
+        indices: tuple[int, int],
+        values: tuple[int, int] | None = None,
+        source: Sequence[int] | None = None,
+    ) -> None:
         self.indices = indices
-        self.values = values
+        self._values = values
+        self._source = source
+
+    @property
+    def values(self) -> tuple[int, int]:
+        """Values at ``indices``, read from the source sequence on first access."""
+        values = self._values
+        if values is None:
+            source = self._source
+            if source is None:
+                raise TypeError("TwoSumResult was built without values or a source sequence")
+            j, i = self.indices
+            values = self._values = (source[j], source[i])
+            self._source = None
+        return values
 
     def __repr__(self) -> str:
         return f"TwoSumResult(indices={self.indices}, values={self.values})"
@@ -26,16 +94,28 @@ class TwoSumResult:
         return self.indices == other.indices and self.values == other.values
 
 
-def two_sum_generator(nums: list[int], target: int) -> Generator[TwoSumResult]:
+def two_sum_generator(
+    nums: Sequence[int], target: int, *, lazy_values: bool = False, stats: SolveStats | None = None
+) -> Generator[TwoSumResult]:
     """
     Generator-based two sum implementation for stack safety.
 
     Yields all possible pairs that sum to the target value.
     Uses generators to maintain stack safety even with large datasets.
 
+    With ``lazy_values=True`` results keep a reference to ``nums`` and only
+    build their ``values`` tuple when it is accessed, which halves the
+    allocations per result on pair-dense inputs. ``nums`` must then not be
+    mutated while results are still in use.
+
+    With ``stats`` an instrumented copy of the loop fills it in (see
+    ``fp_gym.profiling``); the plain loop below never pays for it.
+
     Args:
-        nums: List of integers to search
+        nums: Integers to search
         target: Target sum value
+        lazy_values: Defer building each result's values tuple
+        stats: Record scan counters and timings here
 
     Yields:
         TwoSumResult: Contains indices and values of pairs that sum to target
@@ -47,26 +127,71 @@ def two_sum_generator(nums: list[int], target: int) -> Generator[TwoSumResult]:
         >>> print(results[0].indices)  # (0, 1)
         >>> print(results[0].values)   # (2, 7)
     """
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    if stats is not None:
+        from .profiling import two_sum_scan
+
+        yield from two_sum_scan(nums, target, stats, lazy_values=lazy_values)
+        return
+
     seen: dict[int, int] = {}
 
+    if lazy_values:
+        for i, num in enumerate(nums):
+            j = seen.get(target - num)
+            if j is not None:
+                yield TwoSumResult((j, i), None, nums)
+            seen[num] = i
+        return
+
     for i, num in enumerate(nums):
         complement = target - num
 
         if complement in seen:
             # Found a pair - yield the result
             j = seen[complement]
-            result = TwoSumResult(indices=(j, i), values=(complement, num))
-            yield result
+            yield TwoSumResult((j, i), (complement, num))
 
         seen[num] = i
 
 
-def two_sum(nums: list[int], target: int) -> Maybe[TwoSumResult]:
+def two_sum_fast(nums: Sequence[int], target: int) -> TwoSumResult | None:
+    """
+    Find the first pair of numbers that sum to target, without the Maybe wrapper.
+
+    A plain loop with an early return: no generator, no exception handling and
+    no ``returns`` import. Use it on hot paths that call two sum many times on
+    short inputs.
+
+    Args:
+        nums: Integers to search
+        target: Target sum value
+
+    Returns:
+        The first TwoSumResult, or None if there is no pair
+
+    Example:
+        >>> two_sum_fast([2, 7, 11, 15], 9).indices
+        (0, 1)
+    """
+    if type(nums) is not list:
+        nums = int_sequence(nums)
+    seen: dict[int, int] = {}
+    for i, num in enumerate(nums):
+        j = seen.get(target - num)
+        if j is not None:
+            return TwoSumResult((j, i), (target - num, num))
+        seen[num] = i
+    return None
+
+
+def two_sum(nums: Sequence[int], target: int) -> Maybe[TwoSumResult]:
     """
     Find the first pair of numbers that sum to target using Maybe monad.
 
     Args:
-        nums: List of integers to search
+        nums: Integers to search
         target: Target sum value
 
     Returns:
@@ -78,12 +203,21 @@ def two_sum(nums: list[int], target: int) -> Maybe[TwoSumResult]:
         >>> if isinstance(result, Some):
         ...     print(f"Found at indices: {result.unwrap().indices}")
     """
-    try:
-        # Get the first result from the generator
-        first_result = next(two_sum_generator(nums, target))
-        return Some(first_result)
-    except StopIteration:
-        return Nothing
+    return _maybe(two_sum_fast(nums, target))
+
+
+def _maybe(result: TwoSumResult | None) -> Maybe[TwoSumResult]:
+    """Wrap an optional result, importing ``returns`` on first use."""
+    maybe = _returns_maybe()
+    wrapped: Maybe[TwoSumResult] = maybe.Nothing if result is None else maybe.Some(result)
+    return wrapped
+
+
+@cache
+def _returns_maybe() -> ModuleType:
+    import returns.maybe
+
+    return returns.maybe
 
 
 class TwoSumSolver:
@@ -92,73 +226,544 @@ class TwoSumSolver:
 
     This class provides multiple methods for solving the two sum problem,
     all using generator-based approaches for memory efficiency and stack safety.
+
+    The ``numpy`` backend computes all pairs at once with whole-array operations
+    (see ``fp_gym.vectorized``) and returns exactly the same pairs; it trades
+    laziness for throughput on large inputs and requires NumPy. The ``process``
+    backend shards the same computation by value across worker processes
+    (see ``fp_gym.parallel``), and ``thread`` across threads, which only run
+    in parallel on free-threaded builds (see ``fp_gym.threaded``). ``nested``
+    is a quadratic loop that wins only on a handful of elements (see
+    ``fp_gym.nested``), and ``dense`` replaces the ``seen`` dict with a
+    reusable table indexed by value (see ``fp_gym.dense``). ``sorted`` runs a
+    two-pointer sweep with O(1) extra memory on input already in ascending
+    order (see ``fp_gym.presorted``); ``presorted=True`` on a call selects it
+    without verifying the order.
+
+    With ``backend="auto"`` each call picks the engine from cheap input
+    statistics (see ``fp_gym.dispatch``) and records it in ``last_choice``.
+    Most methods also take a ``backend`` keyword to override the engine for
+    one call.
+
+    With a ``cache`` (see ``fp_gym.cache``) the results of ``find_first_pair``,
+    ``find_first_pair_fast``, ``find_all_pairs`` and ``count_pairs`` are
+    memoized by input content and target. Engines return identical results,
+    so the backend is not part of the key.
+
+    With ``on_stats`` every engine run (cache hits excluded) is instrumented
+    and reported as a ``SolveStats`` (see ``fp_gym.profiling``): exact scan
+    and table counters for the ``python`` engine, output counts and timings
+    for the others. Exhaustive enumeration is not instrumented.
     """
 
-    def __init__(self) -> None:
-        """Initialize the solver."""
-        pass
+    def __init__(
+        self,
+        backend: Backend = "python",
+        workers: int | None = None,
+        dispatcher: Dispatcher | None = None,
+        dense_table: DenseTable | None = None,
+        cache: ResultCache | None = None,
+        on_stats: StatsCallback | None = None,
+    ) -> None:
+        """
+        Initialize the solver.
 
-    def find_all_pairs(self, nums: list[int], target: int) -> list[TwoSumResult]:
+        Args:
+            backend: Engine used to find pairs, ``"python"``, ``"numpy"``,
+                ``"process"``, ``"thread"``, ``"nested"``, ``"dense"``,
+                ``"sorted"`` or ``"auto"``
+            workers: Worker processes for the ``process`` backend (defaults to
+                the number of CPUs), or threads for the ``thread`` backend
+                (defaults to the number of CPUs when the GIL is disabled, one
+                thread otherwise)
+            dispatcher: Engine selection for ``"auto"``, e.g. a calibrated one
+            dense_table: Table the ``dense`` engine lends out first; calls
+                that overlap it (from other threads or live generators)
+                get tables of their own from ``dense_tables``
+            cache: Shared result cache; safe to share between threads
+            on_stats: Called with the SolveStats of each engine run
+        """
+        _check_backend(backend)
+        self.backend = backend
+        self.workers = workers
+        self._dispatcher = dispatcher
+        self._dense_table = dense_table
+        self._dense_tables: DenseTablePool | None = None
+        if dense_table is not None:
+            # Created up front so the table can never end up in two pools
+            self._dense_tables = self.dense_tables
+        self.cache = cache
+        self.on_stats = on_stats
+        self.last_choice: Choice | None = None
+
+    @property
+    def dispatcher(self) -> Dispatcher:
+        """The dispatcher used by the ``auto`` backend, created on first use."""
+        if self._dispatcher is None:
+            from .dispatch import Dispatcher
+
+            self._dispatcher = Dispatcher()
+        return self._dispatcher
+
+    @property
+    def dense_tables(self) -> DenseTablePool:
+        """The tables lent to ``dense`` engine calls, one per call in progress."""
+        if self._dense_tables is None:
+            from .dense import DEFAULT_CAPACITY, DenseTablePool
+
+            table = self._dense_table
+            capacity = DEFAULT_CAPACITY if table is None else table.capacity
+            tables = () if table is None else (table,)
+            self._dense_tables = DenseTablePool(capacity, tables)
+        return self._dense_tables
+
+    def _engine(
+        self,
+        nums: Sequence[int],
+        operation: Operation,
+        backend: Backend | None,
+        presorted: bool = False,
+    ) -> Engine:
+        """Resolve the engine for one call, dispatching when ``auto``."""
+        if presorted:
+            return "sorted"
+        if backend is None:
+            backend = self.backend
+        else:
+            _check_backend(backend)
+        if backend != "auto":
+            return backend
+        choice = self.last_choice = self.dispatcher.choose(nums, operation)
+        return choice.engine
+
+    def _pairs(
+        self, nums: Sequence[int], target: int, engine: Engine = "python"
+    ) -> Iterator[TwoSumResult]:
+        if engine == "python":
+            return two_sum_generator(nums, target)
+        if engine == "nested":
+            from .nested import nested_pairs
+
+            return nested_pairs(nums, target)
+        if engine == "dense":
+            return self.dense_tables.pairs(nums, target)
+        if engine == "sorted":
+            from .presorted import sorted_pairs
+
+            return sorted_pairs(nums, target)
+        if engine == "thread":
+            from .threaded import two_sum_threaded
+
+            return iter(two_sum_threaded(nums, target, self.workers))
+        try:
+            arrays = self._arrays(nums, target, engine)
+        except OverflowError:
+            # Pairs with values beyond int64 have no array form
+            return two_sum_generator(nums, target)
+        return _results_from_arrays(arrays)
+
+    def _observed(
+        self, nums: Sequence[int], target: int, engine: Engine, operation: str
+    ) -> Generator[TwoSumResult]:
+        """Pairs of ``engine``, instrumented and reported to ``on_stats`` when done."""
+        from .profiling import SolveStats, observe, two_sum_scan
+
+        stats = SolveStats(operation, engine)
+        if engine == "python":
+            return two_sum_scan(nums, target, stats, on_finish=self.on_stats)
+        pairs = self._pairs(nums, target, engine)
+        return observe(pairs, stats, scanned=len(nums), on_finish=self.on_stats)
+
+    def _arrays(self, nums: Sequence[int], target: int, engine: Engine) -> TwoSumArrays:
+        if engine == "process":
+            from .parallel import two_sum_parallel
+
+            return two_sum_parallel(nums, target, workers=self.workers)
+
+        from .vectorized import two_sum_arrays
+
+        return two_sum_arrays(nums, target)
+
+    def find_all_pairs_arrays(
+        self, nums: Sequence[int], target: int, *, backend: Backend | None = None
+    ) -> TwoSumArrays:
+        """
+        Find all pairs as index/value arrays instead of TwoSumResult objects.
+
+        Accepts lists as well as NumPy integer arrays. Requires NumPy regardless
+        of the configured backend; only the ``process`` backend runs in parallel.
+
+        Args:
+            nums: Integers to search
+            target: Target sum value
+            backend: Override the solver's backend for this call
+
+        Returns:
+            TwoSumArrays holding the same pairs as ``find_all_pairs``
+
+        Raises:
+            OverflowError: If some pair holds a value beyond the int64 range
+        """
+        engine = self._engine(nums, "all", backend)
+        return self._arrays(nums, target, "process" if engine == "process" else "numpy")
+
+    def build_index(self, nums: Sequence[int]) -> TwoSumIndex:
+        """
+        Build a reusable index for querying many targets against ``nums``.
+
+        Args:
+            nums: Integers to index
+
+        Returns:
+            TwoSumIndex whose ``query`` matches ``find_first_pair``
+        """
+        from .index import TwoSumIndex
+
+        return TwoSumIndex(nums)
+
+    def build_filter(self, nums: Sequence[int], false_positive_rate: float = 0.01) -> PairSumFilter:
+        """
+        Build a prefilter that rules out most targets without a pair in O(1).
+
+        Only inputs with at most about 2,900 distinct values get the Bloom layer
+        that does this; larger ones fall back to residue masks, which reject
+        almost nothing unless the values share structure (all even, say).
+        ``PairSumFilter.kind`` tells which one was built, and
+        ``PairSumFilter(nums, max_sums=...)`` moves the limit.
+
+        Args:
+            nums: Integers to search; must not change while the filter is used
+            false_positive_rate: Target false positive rate of the Bloom layer
+
+        Returns:
+            PairSumFilter whose ``first_pair`` matches ``find_first_pair_fast``
+        """
+        from .prefilter import PairSumFilter
+
+        return PairSumFilter(nums, false_positive_rate, exact=self.find_first_pair_fast)
+
+    def find_all_pairs(
+        self,
+        nums: Sequence[int],
+        target: int,
+        *,
+        exhaustive: bool = False,
+        backend: Backend | None = None,
+        presorted: bool = False,
+    ) -> list[TwoSumResult]:
         """
         Find all pairs that sum to the target.
 
+        By default each element is paired only with the latest earlier index
+        of its complement. With ``exhaustive=True`` every pair ``j < i`` is
+        returned (see ``fp_gym.pairs``), which can be quadratic in size.
+
         Args:
-            nums: List of integers to search
+            nums: Integers to search
             target: Target sum value
+            exhaustive: Return every pair instead of one per element
+            backend: Override the solver's backend for this call
+            presorted: Promise that ``nums`` is ascending (two-pointer sweep)
 
         Returns:
             List of all TwoSumResult objects found
         """
-        return list(two_sum_generator(nums, target))
-
-    def find_first_pair(self, nums: list[int], target: int) -> Maybe[TwoSumResult]:
+        if self.cache is not None:
+            # Stored as a tuple so callers mutating the returned list cannot corrupt it
+            cached = self.cache.lookup(
+                ("all", exhaustive),
+                nums,
+                target,
+                lambda: tuple(self._all_pairs(nums, target, exhaustive, backend, presorted)),
+            )
+            return list(cached)
+        return self._all_pairs(nums, target, exhaustive, backend, presorted)
+
+    def _all_pairs(
+        self,
+        nums: Sequence[int],
+        target: int,
+        exhaustive: bool,
+        backend: Backend | None,
+        presorted: bool,
+    ) -> list[TwoSumResult]:
+        if exhaustive:
+            from .pairs import all_pairs_generator
+
+            return list(all_pairs_generator(nums, target))
+        engine = self._engine(nums, "all", backend, presorted)
+        if self.on_stats is not None:
+            return list(self._observed(nums, target, engine, "find_all_pairs"))
+        return list(self._pairs(nums, target, engine))
+
+    def find_first_pair(
+        self,
+        nums: Sequence[int],
+        target: int,
+        *,
+        backend: Backend | None = None,
+        presorted: bool = False,
+    ) -> Maybe[TwoSumResult]:
         """
         Find the first pair that sums to the target.
 
         Args:
-            nums: List of integers to search
+            nums: Integers to search
             target: Target sum value
+            backend: Override the solver's backend for this call
+            presorted: Promise that ``nums`` is ascending (galloping search)
 
         Returns:
             Maybe[TwoSumResult]: Some(result) if found, Nothing if not found
         """
-        return two_sum(nums, target)
+        return _maybe(self.find_first_pair_fast(nums, target, backend=backend, presorted=presorted))
+
+    def find_first_pair_fast(
+        self,
+        nums: Sequence[int],
+        target: int,
+        *,
+        backend: Backend | None = None,
+        presorted: bool = False,
+    ) -> TwoSumResult | None:
+        """
+        Find the first pair that sums to the target, returning None if absent.
 
-    def count_pairs(self, nums: list[int], target: int) -> int:
+        Args:
+            nums: Integers to search
+            target: Target sum value
+            backend: Override the solver's backend for this call
+            presorted: Promise that ``nums`` is ascending (galloping search)
+
+        Returns:
+            The first TwoSumResult, or None if not found
+        """
+        if self.cache is not None:
+            return self.cache.lookup(
+                "first",
+                nums,
+                target,
+                lambda: self._first_pair(nums, target, backend, presorted),
+            )
+        return self._first_pair(nums, target, backend, presorted)
+
+    def _first_pair(
+        self, nums: Sequence[int], target: int, backend: Backend | None, presorted: bool
+    ) -> TwoSumResult | None:
+        engine = self._engine(nums, "first", backend, presorted)
+        if self.on_stats is not None:
+            pairs = self._observed(nums, target, engine, "find_first_pair")
+            try:
+                return next(pairs, None)
+            finally:
+                pairs.close()
+        if engine == "python":
+            return two_sum_fast(nums, target)
+        if engine == "nested":
+            from .nested import nested_first
+
+            return nested_first(nums, target)
+        if engine == "dense":
+            return self.dense_tables.first(nums, target)
+        if engine == "sorted":
+            from .presorted import sorted_first
+
+            return sorted_first(nums, target)
+        return next(self._pairs(nums, target, engine), None)
+
+    def count_pairs(
+        self,
+        nums: Sequence[int],
+        target: int,
+        *,
+        exhaustive: bool = False,
+        backend: Backend | None = None,
+        presorted: bool = False,
+    ) -> int:
         """
         Count the number of pairs that sum to the target.
 
-        Uses generator to avoid loading all results into memory.
+        Uses generator to avoid loading all results into memory. With
+        ``exhaustive=True`` every pair ``j < i`` is counted, computed from value
+        frequencies without enumerating any pair.
 
         Args:
-            nums: List of integers to search
+            nums: Integers to search
             target: Target sum value
+            exhaustive: Count every pair instead of one per element
+            backend: Override the solver's backend for this call
+            presorted: Promise that ``nums`` is ascending (two-pointer sweep)
 
         Returns:
             Number of pairs found
         """
+        if self.cache is not None:
+            return self.cache.lookup(
+                ("count", exhaustive),
+                nums,
+                target,
+                lambda: self._count(nums, target, exhaustive, backend, presorted),
+            )
+        return self._count(nums, target, exhaustive, backend, presorted)
+
+    def _count(
+        self,
+        nums: Sequence[int],
+        target: int,
+        exhaustive: bool,
+        backend: Backend | None,
+        presorted: bool,
+    ) -> int:
+        if exhaustive:
+            from .pairs import count_all_pairs
+
+            return count_all_pairs(nums, target)
+        engine = self._engine(nums, "all", backend, presorted)
+        if self.on_stats is not None:
+            return self._observed_count(nums, target, engine)
+        if engine in ("numpy", "process"):
+            try:
+                return self._arrays(nums, target, engine).size
+            except OverflowError:
+                engine = "python"
+        if engine == "dense":
+            return self.dense_tables.count(nums, target)
+        if engine == "thread":
+            from .threaded import count_pairs_threaded
+
+            return count_pairs_threaded(nums, target, self.workers)
         count = 0
-        for _ in two_sum_generator(nums, target):
+        for _ in self._pairs(nums, target, engine):
             count += 1
         return count
 
+    def _observed_count(self, nums: Sequence[int], target: int, engine: Engine) -> int:
+        """``_count`` with instrumentation; bulk engines are timed as a whole."""
+        from .profiling import SolveStats, timed
+
+        assert self.on_stats is not None
+        count: int = 0
+        if engine not in ("numpy", "process", "thread", "dense"):
+            for _ in self._observed(nums, target, engine, "count_pairs"):
+                count += 1
+            return count
+
+        stats = SolveStats("count_pairs", engine)
+        if engine == "dense":
+            count = timed(stats, partial(self.dense_tables.count, nums, target), len(nums))
+        elif engine == "thread":
+            from .threaded import count_pairs_threaded
+
+            run = partial(count_pairs_threaded, nums, target, self.workers)
+            count = timed(stats, run, len(nums))
+        else:
+            try:
+                count = timed(stats, partial(self._arrays, nums, target, engine), len(nums)).size
+            except OverflowError:
+                return self._observed_count(nums, target, "python")
+        stats.pairs_emitted = count
+        self.on_stats(stats)
+        return count
+
+    def iter_pair_chunks(
+        self, nums: Sequence[int], target: int, chunk_size: int = 65536
+    ) -> Iterator[tuple[array[int], array[int]]]:
+        """
+        Stream every pair ``j < i`` as chunks of ``array('q')`` index buffers.
+
+        Args:
+            nums: Integers to search
+            target: Target sum value
+            chunk_size: Number of pairs per chunk
+
+        Yields:
+            ``(left, right)`` index buffers of the pairs, ordered by ``right``
+        """
+        from .pairs import pair_chunks
+
+        return pair_chunks(nums, target, chunk_size)
+
+    def find_k_sums(self, nums: Sequence[int], target: int, k: int = 3) -> Iterator[KSumResult]:
+        """
+        Lazily find every distinct combination of ``k`` elements summing to target.
+
+        See ``fp_gym.ksum``: a pruned sort-based search, with meet-in-the-middle
+        for ``k == 4``. The backend does not apply.
+
+        Args:
+            nums: Integers to search
+            target: Target sum value
+            k: Number of elements per combination (at least 2)
+
+        Yields:
+            KSumResult: Combinations in lexicographic order of their values
+        """
+        from .ksum import k_sum_generator
+
+        return k_sum_generator(nums, target, k)
+
+    def closest_k_sum(self, nums: Sequence[int], target: int, k: int = 3) -> KSumResult | None:
+        """
+        Find the combination of ``k`` elements whose sum is closest to target.
+
+        Args:
+            nums: Integers to search
+            target: Target sum value
+            k: Number of elements per combination (at least 2)
+
+        Returns:
+            The closest KSumResult (ties go to the smaller sum), or None if
+            ``nums`` has fewer than ``k`` elements
+        """
+        from .ksum import closest_k_sum
+
+        return closest_k_sum(nums, target, k)
+
     def solve_with_stack_safety(
-        self, nums: list[int], target: int, max_results: int | None = None
+        self, nums: Sequence[int], target: int, max_results: int | None = None
     ) -> Generator[TwoSumResult]:
         """
         Stack-safe solver that yields results lazily.
 
         Args:
-            nums: List of integers to search
+            nums: Integers to search
             target: Target sum value
             max_results: Maximum number of results to return (optional)
 
         Yields:
             TwoSumResult: Results as they are found
         """
+        # Lazy consumers may stop early, so ``auto`` dispatches as a first-pair search
+        engine = self._engine(nums, "first", None)
+        if max_results is not None and max_results <= 0:
+            # Nothing runs, but the call is still reported
+            if self.on_stats is not None:
+                from .profiling import SolveStats
+
+                self.on_stats(SolveStats("solve_with_stack_safety", engine))
+            return
+        if self.on_stats is not None:
+            pairs: Iterator[TwoSumResult] = self._observed(
+                nums, target, engine, "solve_with_stack_safety"
+            )
+        else:
+            pairs = self._pairs(nums, target, engine)
         count = 0
-        for result in two_sum_generator(nums, target):
-            if max_results is not None and count >= max_results:
-                break
+        for result in pairs:
             yield result
             count += 1
+            # Stop before pulling another pair from the engine
+            if count == max_results:
+                break
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown backend {backend!r}, expected one of {BACKENDS}")
+
+
+def _results_from_arrays(pairs: TwoSumArrays) -> Iterator[TwoSumResult]:
+    """Adapt struct-of-arrays output back to TwoSumResult objects."""
+    columns = (pairs.left_indices, pairs.right_indices, pairs.left_values, pairs.right_values)
+    for j, i, a, b in zip(*(c.tolist() for c in columns), strict=True):
+        yield TwoSumResult(indices=(j, i), values=(a, b))
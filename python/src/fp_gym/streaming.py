@@ -0,0 +1,183 @@
+"""
+Streaming two sum over unbounded iterables.
+
+``two_sum_stream`` consumes any iterable (and ``two_sum_stream_async`` any
+async iterable) and yields each pair as soon as its second element arrives,
+with the same pairing rule as ``two_sum_generator``: an element is paired with
+the latest earlier index of its complement.
+
+On endless streams the ``seen`` table would grow forever, so it can be bounded
+by any combination of:
+
+* ``window``: only the last ``window`` elements can be complements
+* ``max_age``: entries older than ``max_age`` seconds (per ``clock``) expire
+* ``max_entries``: at most this many distinct values are remembered; the
+  value seen least recently is dropped first
+
+Evictions are counted in an optional ``StreamStats``.
+"""
+
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Generator, Iterable
+from dataclasses import dataclass
+
+from .solver import TwoSumResult
+
+
+@dataclass
+class StreamStats:
+    """Counters updated while a stream is consumed."""
+
+    scanned: int = 0
+    pairs: int = 0
+    evicted: int = 0
+    table_size: int = 0
+    peak_table_size: int = 0
+
+
+class _SeenTable:
+    """
+    Value to ``(latest index, arrival time)`` table with optional eviction.
+
+    When a policy is active, a value is re-inserted on every occurrence so the
+    dict stays ordered by latest index; expiring entries are then always at
+    the front.
+    """
+
+    def __init__(
+        self,
+        target: int,
+        window: int | None,
+        max_age: float | None,
+        max_entries: int | None,
+        clock: Callable[[], float],
+        stats: StreamStats,
+    ) -> None:
+        for name, bound in (("window", window), ("max_entries", max_entries)):
+            if bound is not None and bound < 1:
+                raise ValueError(f"{name} must be positive")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("max_age must be positive")
+        self.target = target
+        self.window = window
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = stats
+        self.bounded = window is not None or max_age is not None or max_entries is not None
+        self.seen: dict[int, tuple[int, float]] = {}
+        self.index = 0
+
+    def _expire(self, index: int, now: float) -> None:
+        seen = self.seen
+        oldest_index = index - self.window if self.window is not None else None
+        oldest_time = now - self.max_age if self.max_age is not None else None
+        while seen:
+            value = next(iter(seen))
+            seen_index, seen_time = seen[value]
+            if (oldest_index is not None and seen_index < oldest_index) or (
+                oldest_time is not None and seen_time < oldest_time
+            ):
+                del seen[value]
+                self.stats.evicted += 1
+            else:
+                break
+
+    def push(self, num: int) -> TwoSumResult | None:
+        """Record ``num`` and return the pair it completes, if any."""
+        index = self.index
+        self.index = index + 1
+        stats = self.stats
+        stats.scanned += 1
+        seen = self.seen
+
+        now = 0.0
+        if self.bounded:
+            now = self.clock() if self.max_age is not None else 0.0
+            self._expire(index, now)
+
+        complement = self.target - num
+        entry = seen.get(complement)
+        result = None
+        if entry is not None:
+            stats.pairs += 1
+            result = TwoSumResult((entry[0], index), (complement, num))
+
+        if self.bounded:
+            seen.pop(num, None)
+        seen[num] = (index, now)
+        if self.max_entries is not None and len(seen) > self.max_entries:
+            del seen[next(iter(seen))]
+            stats.evicted += 1
+
+        stats.table_size = len(seen)
+        if stats.table_size > stats.peak_table_size:
+            stats.peak_table_size = stats.table_size
+        return result
+
+
+def two_sum_stream(
+    source: Iterable[int],
+    target: int,
+    *,
+    window: int | None = None,
+    max_age: float | None = None,
+    max_entries: int | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    stats: StreamStats | None = None,
+) -> Generator[TwoSumResult]:
+    """
+    Yield pairs from an iterable as soon as they close.
+
+    Without any bound this yields exactly what ``two_sum_generator`` yields.
+
+    Args:
+        source: Any iterable of integers, possibly endless
+        target: Target sum value
+        window: Keep only the last ``window`` elements as complements
+        max_age: Forget elements older than this many seconds
+        max_entries: Remember at most this many distinct values
+        clock: Time source for ``max_age``
+        stats: Counters to update, including evictions
+
+    Yields:
+        TwoSumResult: Each pair when its second element is consumed
+    """
+    table = _SeenTable(target, window, max_age, max_entries, clock, stats or StreamStats())
+    push = table.push
+    for num in source:
+        result = push(num)
+        if result is not None:
+            yield result
+
+
+async def two_sum_stream_async(
+    source: AsyncIterable[int],
+    target: int,
+    *,
+    window: int | None = None,
+    max_age: float | None = None,
+    max_entries: int | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    stats: StreamStats | None = None,
+) -> AsyncIterator[TwoSumResult]:
+    """
+    Async counterpart of ``two_sum_stream`` for async iterables.
+
+    Args:
+        source: Any async iterable of integers, e.g. parsed socket lines
+        target: Target sum value
+        window: Keep only the last ``window`` elements as complements
+        max_age: Forget elements older than this many seconds
+        max_entries: Remember at most this many distinct values
+        clock: Time source for ``max_age``
+        stats: Counters to update, including evictions
+
+    Yields:
+        TwoSumResult: Each pair when its second element is received
+    """
+    table = _SeenTable(target, window, max_age, max_entries, clock, stats or StreamStats())
+    async for num in source:
+        result = table.push(num)
+        if result is not None:
+            yield result
@@ -0,0 +1,197 @@
+"""
+Thread-parallel two sum for free-threaded CPython builds.
+
+On a free-threaded interpreter (``python3.13t``) pure-Python loops run on
+several cores at once, so work can be split across a ``ThreadPoolExecutor``
+with none of the copying of ``fp_gym.parallel``: every thread reads the
+caller's sequence in place. The split follows the process engine. An
+element and all of its complements share the canonical value
+``min(x, target - x)``, so hashing it sends them to the same shard, and each
+shard runs the ordinary dict scan over its own indices:
+
+1. Chunks of the input bucket their indices by shard.
+2. Each shard scans its buckets in chunk order, i.e. in ascending index order.
+3. The pairs of all shards are merged by right index (counts are added).
+
+The pairs, and their order, are exactly those of ``two_sum_generator``.
+
+With the GIL enabled the threads would only take turns, so unless
+``workers`` is given the work stays on the calling thread (see
+``default_workers``). Pure Python, no NumPy needed.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any
+
+from .buffers import int_sequence
+from .solver import TwoSumResult, two_sum_generator
+
+# Smaller inputs are solved on the calling thread; a pool round costs more
+MIN_PARALLEL = 1 << 14
+
+# Fibonacci hashing multiplier, spreads clustered values evenly over shards
+_GOLDEN = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+
+
+def gil_enabled() -> bool:
+    """Whether the GIL is enabled; always True on the default (non free-threaded) build."""
+    is_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return True if is_enabled is None else is_enabled()
+
+
+def default_workers() -> int:
+    """Threads worth starting: one per CPU without the GIL, otherwise 1."""
+    return 1 if gil_enabled() else os.cpu_count() or 1
+
+
+def resolve_workers(workers: int | None) -> int:
+    """``workers`` itself, or ``default_workers()`` when None."""
+    if workers is None:
+        return default_workers()
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+    return workers
+
+
+def chunk_bounds(n: int, parts: int) -> list[tuple[int, int]]:
+    """``[start, stop)`` ranges splitting ``range(n)`` into at most ``parts`` chunks."""
+    step = max(1, -(-n // parts))
+    return [(start, min(start + step, n)) for start in range(0, n, step)]
+
+
+@contextmanager
+def thread_pool(workers: int, executor: Executor | None = None) -> Iterator[Executor]:
+    """``executor`` itself, or a new pool of ``workers`` threads shut down on exit."""
+    if executor is not None:
+        yield executor
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fp_gym") as pool:
+        yield pool
+
+
+def _bucket(
+    nums: Sequence[int], target: int, shards: int, start: int, stop: int
+) -> list[list[int]]:
+    """Round 1: indices of ``[start, stop)`` grouped by the shard of their value."""
+    buckets: list[list[int]] = [[] for _ in range(shards)]
+    appends = [bucket.append for bucket in buckets]
+    # Indexed, so no thread walks the elements before its own chunk
+    for i in range(start, stop):
+        num = nums[i]
+        canonical = target - num
+        if num < canonical:
+            canonical = num
+        appends[((hash(canonical) * _GOLDEN & _MASK64) >> 32) % shards](i)
+    return buckets
+
+
+def _shard_pairs(
+    nums: Sequence[int], target: int, parts: Iterable[Iterable[int]]
+) -> list[tuple[int, int, int]]:
+    """Round 2: ``(i, j, nums[i])`` for each pair of one shard."""
+    seen: dict[int, int] = {}
+    pairs = []
+    for i in chain.from_iterable(parts):
+        num = nums[i]
+        j = seen.get(target - num)
+        if j is not None:
+            pairs.append((i, j, num))
+        seen[num] = i
+    return pairs
+
+
+def _shard_count(nums: Sequence[int], target: int, parts: Iterable[Iterable[int]]) -> int:
+    """Round 2, counting only."""
+    seen: set[int] = set()
+    count = 0
+    for i in chain.from_iterable(parts):
+        num = nums[i]
+        if target - num in seen:
+            count += 1
+        seen.add(num)
+    return count
+
+
+def _sharded(
+    nums: Sequence[int],
+    target: int,
+    workers: int,
+    executor: Executor | None,
+    solve: Callable[[Sequence[int], int, Iterable[Iterable[int]]], Any],
+) -> list[Any]:
+    """Run both rounds on the pool; the result of ``solve`` for every shard."""
+    # Several shards per thread, so that a skewed shard does not hold up the others
+    shards = 4 * workers
+    with thread_pool(workers, executor) as pool:
+        buckets = list(
+            pool.map(
+                lambda bounds: _bucket(nums, target, shards, *bounds),
+                chunk_bounds(len(nums), workers),
+            )
+        )
+        return list(
+            pool.map(
+                lambda shard: solve(nums, target, [bucket[shard] for bucket in buckets]),
+                range(shards),
+            )
+        )
+
+
+def two_sum_threaded(
+    nums: Sequence[int],
+    target: int,
+    workers: int | None = None,
+    *,
+    executor: Executor | None = None,
+) -> list[TwoSumResult]:
+    """
+    Thread-parallel equivalent of ``list(two_sum_generator(nums, target))``.
+
+    Args:
+        nums: Integers to search; must not change during the call
+        target: Target sum value
+        workers: Threads to use, at least 1 (defaults to ``default_workers()``)
+        executor: Existing thread pool to reuse instead of starting one
+
+    Returns:
+        The same pairs, in the same order, as the generator
+
+    Raises:
+        ValueError: If ``workers`` is below 1
+    """
+    nums = int_sequence(nums)
+    workers = resolve_workers(workers)
+    if workers < 2 or len(nums) < MIN_PARALLEL:
+        return list(two_sum_generator(nums, target))
+    pairs = _sharded(nums, target, workers, executor, _shard_pairs)
+    return [
+        TwoSumResult((j, i), (target - num, num))
+        for i, j, num in sorted(chain.from_iterable(pairs))
+    ]
+
+
+def count_pairs_threaded(
+    nums: Sequence[int],
+    target: int,
+    workers: int | None = None,
+    *,
+    executor: Executor | None = None,
+) -> int:
+    """
+    Thread-parallel count of the pairs of ``two_sum_generator``.
+
+    Arguments are those of ``two_sum_threaded``; no pair is materialized.
+    """
+    nums = int_sequence(nums)
+    workers = resolve_workers(workers)
+    if workers < 2 or len(nums) < MIN_PARALLEL:
+        return _shard_count(nums, target, [range(len(nums))])
+    return sum(_sharded(nums, target, workers, executor, _shard_count))
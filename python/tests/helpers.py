@@ -0,0 +1,46 @@
+"""Helpers shared by the test modules."""
+
+import random
+from collections.abc import Iterable, Sequence
+
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, two_sum_generator
+from src.fp_gym.solver import TwoSumResult
+
+Pair = tuple[tuple[int, int], tuple[int, int]]
+
+
+def random_ints(rng: random.Random, size: int, low: int, high: int) -> list[int]:
+    """``size`` integers drawn uniformly from ``[low, high]``."""
+    return [rng.randint(low, high) for _ in range(size)]
+
+
+@st.composite
+def missing_repeating_input(draw: st.DrawFn) -> tuple[list[int], int, int]:
+    """A shuffled permutation of 1..n with one value replaced by another."""
+    n = draw(st.integers(min_value=2, max_value=200))
+    missing = draw(st.integers(min_value=1, max_value=n))
+    repeating = draw(st.integers(min_value=1, max_value=n).filter(lambda v: v != missing))
+    values = [repeating if v == missing else v for v in range(1, n + 1)]
+    return draw(st.permutations(values)), missing, repeating
+
+
+def pairs(results: Iterable[TwoSumResult]) -> list[Pair]:
+    """The indices and values of each result, for comparing engines."""
+    return [(r.indices, r.values) for r in results]
+
+
+def reference_pairs(nums: Sequence[int], target: int) -> list[Pair]:
+    """The pairs every engine must produce: those of ``two_sum_generator``."""
+    return pairs(two_sum_generator(nums, target))
+
+
+def matches_generator(solver: TwoSumSolver, nums: list[int], target: int) -> bool:
+    """Whether the solver's pairs, count and first pair all agree with the generator."""
+    expected = list(two_sum_generator(nums, target))
+    return (
+        solver.find_all_pairs(nums, target) == expected
+        and solver.count_pairs(nums, target) == len(expected)
+        and solver.find_first_pair_fast(nums, target) == next(iter(expected), None)
+    )
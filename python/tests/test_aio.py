@@ -0,0 +1,141 @@
+"""Tests for the asyncio micro-batching front-end."""
+
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from returns.maybe import Nothing, Some
+
+from src.fp_gym import TwoSumSolver
+from src.fp_gym.aio import AsyncTwoSumSolver
+from src.fp_gym.cache import ResultCache
+from src.fp_gym.dispatch import Dispatcher, Thresholds
+from src.fp_gym.solver import TwoSumResult
+
+
+class GatedSolver(TwoSumSolver):
+    """A solver whose first-pair searches block until ``gate`` is set."""
+
+    def __init__(self, gate: threading.Event) -> None:
+        super().__init__()
+        self.gate = gate
+
+    def find_first_pair_fast(self, nums, target):
+        self.gate.wait()
+        return super().find_first_pair_fast(nums, target)
+
+
+class TestAsyncTwoSumSolver:
+    """Test cases for AsyncTwoSumSolver."""
+
+    def test_solve(self) -> None:
+        """Test that a single request resolves to the same Maybe as the sync API."""
+        async def run():
+            async with AsyncTwoSumSolver() as solver:
+                return await solver.solve([2, 7, 11, 15], 9), await solver.solve([1, 2], 10)
+
+        found, missing = asyncio.run(run())
+        assert found == Some(TwoSumResult((0, 1), (2, 7)))
+        assert missing == Nothing
+
+    def test_solve_many_preserves_order(self) -> None:
+        """Test that results line up with the jobs regardless of batching."""
+        jobs = [([i, 10 - i, 3], 10) for i in range(50)] + [([1, 2], 100)]
+        expected = [TwoSumSolver().find_first_pair(nums, target) for nums, target in jobs]
+
+        async def run():
+            async with AsyncTwoSumSolver(max_batch=8, max_delay=0.01) as solver:
+                return await solver.solve_many(jobs), solver.stats
+
+        results, stats = asyncio.run(run())
+        assert results == expected
+        assert stats.requests == len(jobs)
+        assert stats.largest_batch <= 8
+        assert stats.batches >= len(jobs) // 8
+
+    def test_concurrent_requests_are_batched(self) -> None:
+        """Test that requests arriving together share one executor call."""
+        async def run():
+            async with AsyncTwoSumSolver(max_batch=64, max_delay=0.05) as solver:
+                await asyncio.gather(*(solver.solve([1, 2], 3) for _ in range(10)))
+                return solver.stats
+
+        stats = asyncio.run(run())
+        assert stats.batches == 1
+        assert stats.largest_batch == 10
+
+    def test_backpressure_bounds_queue(self) -> None:
+        """Test that pending requests never exceed max_pending while the executor is blocked."""
+        gate = threading.Event()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                async with AsyncTwoSumSolver(
+                    GatedSolver(gate), executor=pool, max_batch=1, max_pending=3, max_inflight=1
+                ) as solver:
+                    tasks = [asyncio.create_task(solver.solve([1, 2], 3)) for _ in range(10)]
+                    await asyncio.sleep(0.05)
+                    peak = solver.pending
+                    gate.set()
+                    await asyncio.gather(*tasks)
+                    return peak, solver.stats
+
+        peak, stats = asyncio.run(run())
+        assert peak <= 3
+        assert stats.requests == 10
+
+    def test_errors_propagate_to_callers(self) -> None:
+        """Test that an exception in the executor fails every request of its batch."""
+        async def run():
+            async with AsyncTwoSumSolver() as solver:
+                return await solver.solve(None, 3)
+
+        with pytest.raises(TypeError):
+            asyncio.run(run())
+
+    def test_invalid_configuration(self) -> None:
+        """Test that non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            AsyncTwoSumSolver(max_batch=0)
+        with pytest.raises(ValueError):
+            AsyncTwoSumSolver(max_delay=-1)
+
+    def test_close_cancels_batch_waiting_for_slot(self) -> None:
+        """Test that close resolves requests already batched but not yet dispatched."""
+        gate = threading.Event()
+
+        async def run():
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                solver = AsyncTwoSumSolver(
+                    GatedSolver(gate), executor=pool, max_batch=1, max_delay=0, max_inflight=1
+                )
+                tasks = [asyncio.create_task(solver.solve([1, 2], 3)) for _ in range(3)]
+                # One batch in the executor, one holding a request while waiting for a slot
+                await asyncio.sleep(0.05)
+                assert solver.pending == 1
+                asyncio.get_running_loop().call_later(0.05, gate.set)
+                await solver.close()
+                done, pending = await asyncio.wait(tasks, timeout=5)
+                return tasks, pending
+
+        tasks, pending = asyncio.run(run())
+        assert not pending
+        assert tasks[0].result() == Some(TwoSumResult((0, 1), (1, 2)))
+        assert all(task.cancelled() for task in tasks[1:])
+
+    def test_process_pool_with_cached_solver(self) -> None:
+        """Test that process workers rebuild the solver instead of pickling its cache."""
+        solver = TwoSumSolver(
+            "dense", cache=ResultCache(), dispatcher=Dispatcher(Thresholds(nested_max=2))
+        )
+        solver.find_first_pair_fast([1, 2], 3)  # Populate the cache and the dense tables
+        jobs = [([i, 10 - i, 3], 10) for i in range(20)] + [([1, 2], 100)]
+        expected = [TwoSumSolver().find_first_pair(nums, target) for nums, target in jobs]
+
+        async def run():
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                async with AsyncTwoSumSolver(solver, executor=pool, max_batch=8) as front:
+                    return await front.solve_many(jobs)
+
+        assert asyncio.run(run()) == expected
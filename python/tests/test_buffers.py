@@ -0,0 +1,168 @@
+"""Tests for buffer and sequence inputs."""
+
+import mmap
+import tracemalloc
+from array import array
+
+import pytest
+
+from src.fp_gym import TwoSumSolver, two_sum_fast, two_sum_generator
+from src.fp_gym.arrays.find_missing_repeating import (
+    find_missing_repeating,
+    find_missing_repeating_chunked,
+    find_missing_repeating_optimal,
+)
+from src.fp_gym.buffers import int_sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+requires_numpy = pytest.mark.skipif(np is None, reason="NumPy is not installed")
+
+N = 200_000
+# A list copy of N elements needs 8 bytes per element for the pointers alone
+COPY_BYTES = 8 * N
+
+
+def peak_bytes(run):
+    """Peak traced allocation while ``run`` executes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+class TestIntSequence:
+    """Test cases for int_sequence."""
+
+    def test_sequences_pass_through(self) -> None:
+        """Lists, tuples, ranges and arrays are returned as they are."""
+        for nums in ([1, 2], (1, 2), range(3), array("q", [1, 2])):
+            assert int_sequence(nums) is nums
+
+    @requires_numpy
+    def test_numpy_array_is_viewed(self) -> None:
+        """NumPy arrays become memoryviews over the same memory, with int elements."""
+        arr = np.arange(5, dtype=np.int64)
+        view = int_sequence(arr)
+        assert isinstance(view, memoryview)
+        assert type(view[0]) is int
+        arr[0] = 42
+        assert view[0] == 42
+
+    @requires_numpy
+    def test_multidimensional_buffer_is_flattened(self) -> None:
+        """Test a C-contiguous 2-D array is viewed as one flat sequence."""
+        view = int_sequence(np.arange(6, dtype=np.int32).reshape(2, 3))
+        assert list(view) == [0, 1, 2, 3, 4, 5]
+
+    @requires_numpy
+    def test_non_integer_inputs_are_unchanged(self) -> None:
+        """Floats, strided 2-D arrays and plain iterables keep their own access."""
+        floats = np.arange(3.0)
+        strided = np.arange(12).reshape(3, 4)[:, ::2]
+        items = iter([1, 2])
+        for nums in (floats, strided, items):
+            assert int_sequence(nums) is nums
+
+
+class TestBufferInputs:
+    """The solvers give the same answers on buffers as on lists."""
+
+    nums = [3, 8, -2, 5, 5, 0, 7, 1, 3]
+    target = 8
+
+    @pytest.mark.parametrize(
+        "convert",
+        [
+            lambda nums: array("q", nums),
+            lambda nums: memoryview(array("q", nums)),
+            pytest.param(lambda nums: np.array(nums, dtype=np.int64), marks=requires_numpy),
+            pytest.param(lambda nums: np.array(nums, dtype=np.int16), marks=requires_numpy),
+            tuple,
+        ],
+        ids=["array", "memoryview", "int64", "int16", "tuple"],
+    )
+    @pytest.mark.parametrize(
+        "backend",
+        ["python", "nested", "dense", pytest.param("numpy", marks=requires_numpy), "auto"],
+    )
+    def test_backends_match_list(self, convert, backend) -> None:
+        """Test every backend gives the list answers on each kind of buffer."""
+        solver = TwoSumSolver(backend)
+        data = convert(self.nums)
+        expected = TwoSumSolver().find_all_pairs(self.nums, self.target)
+        assert solver.find_all_pairs(data, self.target) == expected
+        assert solver.count_pairs(data, self.target) == len(expected)
+        assert solver.find_first_pair_fast(data, self.target) == expected[0]
+
+    @requires_numpy
+    def test_results_hold_python_ints(self) -> None:
+        """Values read from NumPy arrays are ints, not NumPy scalars."""
+        result = two_sum_fast(np.array(self.nums), self.target)
+        assert all(type(v) is int for v in result.values)
+
+    def test_bytes(self) -> None:
+        """Test a bytes object is searched as a sequence of small ints."""
+        assert two_sum_fast(b"\x01\x02\x07", 9).indices == (1, 2)
+
+    def test_mmap(self, tmp_path) -> None:
+        """Test a memory-mapped file cast to int64 gives the list answers."""
+        path = tmp_path / "nums.i64"
+        path.write_bytes(array("q", self.nums).tobytes())
+        with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            view = memoryview(m).cast("q")
+            expected = list(two_sum_generator(self.nums, self.target))
+            assert list(two_sum_generator(view, self.target)) == expected
+            view.release()
+
+    @requires_numpy
+    def test_missing_repeating(self) -> None:
+        """Test the missing/repeating variants accept arrays, bytes and mixed chunks."""
+        nums = [4, 3, 6, 2, 1, 1]
+        assert find_missing_repeating(array("q", nums)) == (5, 1)
+        assert find_missing_repeating(bytes(nums)) == (5, 1)
+        assert find_missing_repeating_chunked([np.array(nums[:3]), array("q", nums[3:])]) == (5, 1)
+
+    @requires_numpy
+    def test_optimal_marks_the_buffer_in_place(self) -> None:
+        """Test the optimal variant marks a writable buffer by negating entries."""
+        arr = np.array([3, 1, 3], dtype=np.int64)
+        assert find_missing_repeating_optimal(arr) == (2, 3)
+        assert (arr < 0).any()
+
+
+class TestNoCopy:
+    """Large buffers are iterated in place: peak memory stays far below a list copy."""
+
+    def test_two_sum_fast(self) -> None:
+        """Test two_sum_fast scans an int64 array without copying it."""
+        nums = array("q", bytes(8 * N))  # all zeros, no pair for target 1
+        assert peak_bytes(lambda: two_sum_fast(nums, 1)) < COPY_BYTES // 8
+
+    @requires_numpy
+    def test_generator_over_numpy(self) -> None:
+        """Test two_sum_generator scans a NumPy array without copying it."""
+        nums = np.zeros(N, dtype=np.int64)
+        assert peak_bytes(lambda: list(two_sum_generator(nums, 1))) < COPY_BYTES // 8
+
+    @pytest.mark.parametrize("backend", ["python", "dense", "sorted"])
+    def test_solver_count(self, backend) -> None:
+        """Test count_pairs scans a memoryview without copying it."""
+        nums = memoryview(array("q", bytes(8 * N)))
+        solver = TwoSumSolver(backend)
+        solver.count_pairs([1, 2], 3)  # Allocate the dense table outside the measurement
+        assert peak_bytes(lambda: solver.count_pairs(nums, 1)) < COPY_BYTES // 8
+
+    @requires_numpy
+    def test_missing_repeating_chunked(self) -> None:
+        """Test the chunked variant reads NumPy chunks without copying them."""
+        nums = np.arange(1, N + 1, dtype=np.int64)
+        nums[-1] = 1
+        chunks = [nums[k : k + N // 4] for k in range(0, N, N // 4)]
+        assert find_missing_repeating_chunked(chunks) == (N, 1)
+        assert peak_bytes(lambda: find_missing_repeating_chunked(chunks)) < COPY_BYTES // 8
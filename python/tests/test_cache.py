@@ -0,0 +1,169 @@
+"""Tests for content fingerprints and the solver result cache."""
+
+import random
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from src.fp_gym import TwoSumSolver
+from src.fp_gym.cache import ResultCache, fingerprint
+from tests.helpers import matches_generator, random_ints
+
+
+class FakeClock:
+    """A clock that only moves when ``now`` is set."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFingerprint:
+    """Test cases for fingerprint."""
+
+    def test_equal_content(self) -> None:
+        """Test that equal lists fingerprint equally and different ones do not."""
+        assert fingerprint([1, 2, 3]) == fingerprint([1, 2, 3])
+        assert fingerprint([1, 2, 3]) != fingerprint([1, 2, 4])
+        assert fingerprint([]) != fingerprint([0])
+
+    def test_buffers(self) -> None:
+        """Test that int64 buffers match the packed list they equal."""
+        nums = [5, -1, 7]
+        assert fingerprint(np.array(nums, dtype=np.int64)) == fingerprint(nums)
+        assert fingerprint(array("q", nums)) == fingerprint(nums)
+        assert fingerprint(np.arange(10)[::2]) == fingerprint([0, 2, 4, 6, 8])
+
+    def test_big_ints(self) -> None:
+        """Test that values beyond int64 are fingerprinted by content."""
+        assert fingerprint([1 << 70, 1]) == fingerprint([1 << 70, 1])
+        assert fingerprint([1 << 70, 1]) != fingerprint([1 << 70, 2])
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def test_hits_and_misses(self) -> None:
+        """Test that a repeated lookup is served without recomputing."""
+        cache = ResultCache()
+        calls = []
+        for _ in range(3):
+            assert cache.lookup("op", [1, 2], 3, lambda: calls.append(1) or 42) == 42
+        assert len(calls) == 1
+        assert (cache.stats.hits, cache.stats.misses) == (2, 1)
+        assert cache.stats.hit_rate == pytest.approx(2 / 3)
+
+    def test_none_is_cached(self) -> None:
+        """Test that a None result counts as a hit."""
+        cache = ResultCache()
+        cache.lookup("op", [1], 5, lambda: None)
+        assert cache.lookup("op", [1], 5, lambda: 1) is None
+
+    def test_lru_eviction(self) -> None:
+        """Test that the least recently used entry is evicted."""
+        cache = ResultCache(maxsize=2)
+        cache.lookup("op", [1], 0, lambda: "a")
+        cache.lookup("op", [2], 0, lambda: "b")
+        cache.lookup("op", [1], 0, lambda: "stale")
+        cache.lookup("op", [3], 0, lambda: "c")
+        assert len(cache) == 2
+        assert cache.stats.evictions == 1
+        assert cache.lookup("op", [1], 0, lambda: "new") == "a"
+        assert cache.lookup("op", [2], 0, lambda: "new") == "new"
+
+    def test_ttl(self) -> None:
+        """Test that entries expire after ``ttl`` seconds."""
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        cache.lookup("op", [1], 0, lambda: "old")
+        clock.now = 5
+        assert cache.lookup("op", [1], 0, lambda: "new") == "old"
+        clock.now = 20
+        assert cache.lookup("op", [1], 0, lambda: "new") == "new"
+        assert cache.stats.expirations == 1
+
+    def test_trust_identity(self) -> None:
+        """Test that fingerprints are memoized per object only when trusted."""
+        nums = [1, 2, 3]
+        trusting = ResultCache(trust_identity=True)
+        assert trusting.lookup("op", nums, 0, lambda: "a") == "a"
+        nums[0] = 9
+        assert trusting.lookup("op", nums, 0, lambda: "b") == "a"
+
+        careful = ResultCache()
+        careful.lookup("op", nums, 0, lambda: "a")
+        nums[0] = 1
+        assert careful.lookup("op", nums, 0, lambda: "b") == "b"
+
+    def test_invalid_arguments(self) -> None:
+        """Test that non-positive maxsize and ttl are rejected."""
+        with pytest.raises(ValueError):
+            ResultCache(maxsize=0)
+        with pytest.raises(ValueError):
+            ResultCache(ttl=0)
+
+
+class TestSolverCache:
+    """Test cases for TwoSumSolver(cache=...)."""
+
+    def test_results_unchanged(self) -> None:
+        """Test that cached answers equal uncached ones, across calls and copies."""
+        solver = TwoSumSolver(cache=ResultCache())
+        reference = TwoSumSolver()
+        nums = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+        for _ in range(2):
+            nums = list(nums)
+            assert solver.find_first_pair(nums, 10) == reference.find_first_pair(nums, 10)
+            assert solver.find_all_pairs(nums, 10) == reference.find_all_pairs(nums, 10)
+            assert solver.count_pairs(nums, 6) == reference.count_pairs(nums, 6)
+            assert solver.count_pairs(nums, 6, exhaustive=True) == reference.count_pairs(
+                nums, 6, exhaustive=True
+            )
+        assert solver.cache.stats.hits == 4
+
+    def test_returned_list_is_private(self) -> None:
+        """Test that mutating a returned list does not affect the cache."""
+        solver = TwoSumSolver(cache=ResultCache())
+        solver.find_all_pairs([1, 2, 3], 4).clear()
+        assert len(solver.find_all_pairs([1, 2, 3], 4)) == 1
+
+    def test_shared_between_threads(self) -> None:
+        """Test that one cached solver stays correct when used by several threads."""
+        solver = TwoSumSolver(cache=ResultCache(maxsize=8))
+        inputs = [list(range(k, k + 200)) for k in range(16)]
+        expected = [TwoSumSolver().count_pairs(nums, 250) for nums in inputs]
+        errors = []
+
+        def work():
+            for _ in range(20):
+                for nums, count in zip(inputs, expected, strict=True):
+                    if solver.count_pairs(nums, 250) != count:
+                        errors.append(nums[0])
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors
+        assert len(solver.cache) <= 8
+        stats = solver.cache.stats
+        assert stats.hits + stats.misses == 4 * 20 * 16
+
+    def test_auto_solver_shared_between_threads(self) -> None:
+        """Test that an auto solver and its cache stay correct under concurrent dense calls."""
+        solver = TwoSumSolver("auto", cache=ResultCache())
+        rng = random.Random(11)
+        # Small unsorted value ranges, so ``auto`` picks the dense engine
+        jobs = [(random_ints(rng, 2000, 0, 63), rng.randrange(128)) for _ in range(80)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lambda job: matches_generator(solver, *job), jobs * 2))
+        assert solver.dispatcher.choose(jobs[0][0], "all").engine == "dense"
+        # Served from the cache now, so the stored entries are checked too
+        assert all(matches_generator(solver, nums, target) for nums, target in jobs)
@@ -0,0 +1,118 @@
+"""Tests for the fp-gym command line interface."""
+
+import io
+import json
+import sys
+from array import array
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from src.fp_gym.cli import main, parse_binary, parse_text
+
+
+def run(tmp_path: Path, *argv: str) -> list[dict[str, Any]]:
+    """Run the CLI writing JSON lines to a file and return the parsed records."""
+    out = tmp_path / "out.jsonl"
+    assert main([*argv, "-o", str(out)]) == 0
+    return [json.loads(line) for line in out.read_text().splitlines()]
+
+
+class TestParsing:
+    """Test cases for the bulk parsers."""
+
+    def test_text(self) -> None:
+        """Test that newlines, commas and spaces all separate integers."""
+        assert parse_text(b"1,2, 3\n-4\n\n5 ") == [1, 2, 3, -4, 5]
+
+    def test_binary(self) -> None:
+        """Test raw and .npy int64 input."""
+        raw = array("q", [3, -1, 7]).tobytes()
+        assert parse_binary(raw).tolist() == [3, -1, 7]
+        buffer = io.BytesIO()
+        np.save(buffer, np.array([5, 6], dtype=np.int64))
+        assert parse_binary(buffer.getvalue()).tolist() == [5, 6]
+        with pytest.raises(ValueError):
+            parse_binary(b"\x00" * 7)
+
+
+class TestTwoSum:
+    """Test cases for ``fp-gym two-sum``."""
+
+    def test_rows_and_targets(self, tmp_path) -> None:
+        """Test that every row is solved for every target, in order."""
+        path = tmp_path / "in.csv"
+        path.write_text("2,7,11,15\n3,3\n")
+        records = run(tmp_path, "two-sum", "--rows", "-t", "9", "-t", "6", str(path))
+        assert [(r["job"], r["row"], r["target"], r["indices"]) for r in records] == [
+            (0, 0, 9, [0, 1]),
+            (1, 0, 6, None),
+            (2, 1, 9, None),
+            (3, 1, 6, [0, 1]),
+        ]
+
+    def test_target_first_modes(self, tmp_path) -> None:
+        """Test per-row targets with the all and count modes."""
+        path = tmp_path / "in.txt"
+        path.write_text("4 1 3 2 2\n")
+        assert run(tmp_path, "two-sum", "--rows", "--target-first", "-m", "all", str(path))[0][
+            "pairs"
+        ] == [[0, 1], [2, 3]]
+        assert (
+            run(tmp_path, "two-sum", "--rows", "--target-first", "-m", "count", str(path))[0][
+                "count"
+            ]
+            == 2
+        )
+
+    def test_parallel_matches_serial(self, tmp_path) -> None:
+        """Test that --jobs keeps results identical and ordered."""
+        path = tmp_path / "in.txt"
+        path.write_text(
+            "\n".join(" ".join(str((i * k) % 17) for i in range(40)) for k in range(50))
+        )
+        args = ("two-sum", "--rows", "-t", "15", "-m", "count", str(path))
+        assert run(tmp_path, *args, "--jobs", "2") == run(tmp_path, *args)
+
+    def test_binary_output(self, tmp_path) -> None:
+        """Test int64 records for the first-pair mode."""
+        source, out = tmp_path / "in.bin", tmp_path / "out.bin"
+        source.write_bytes(array("q", [2, 7, 11, 15]).tobytes())
+        assert (
+            main(["two-sum", "-t", "9", "-t", "1", str(source), "-O", "binary", "-o", str(out)])
+            == 0
+        )
+        assert array("q", out.read_bytes()).tolist() == [0, 0, 1, 1, -1, -1]
+
+    def test_requires_target(self, tmp_path) -> None:
+        """Test that a target source is mandatory."""
+        with pytest.raises(SystemExit):
+            main(["two-sum", str(tmp_path / "missing.txt")])
+
+
+class TestMissingRepeating:
+    """Test cases for ``fp-gym missing-repeating``."""
+
+    def test_stdin(self, tmp_path, monkeypatch) -> None:
+        """Test text input from stdin."""
+        monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"4\n3\n6\n2\n1\n1\n")))
+        assert run(tmp_path, "missing-repeating") == [
+            {"job": 0, "source": "<stdin>", "missing": 5, "repeating": 1}
+        ]
+
+    def test_invalid_row_reports_error(self, tmp_path) -> None:
+        """Test that a bad array yields an error record instead of aborting."""
+        path = tmp_path / "in.txt"
+        path.write_text("3 1 3\n1 2 3\n")
+        first, second = run(tmp_path, "missing-repeating", "--rows", str(path))
+        assert (first["missing"], first["repeating"]) == (2, 3)
+        assert "error" in second
+
+    def test_missing_file(self, tmp_path, capsys) -> None:
+        """Test that unreadable input is reported with a non-zero status."""
+        assert (
+            main(["missing-repeating", str(tmp_path / "nope.txt"), "-o", str(tmp_path / "o")]) == 1
+        )
+        assert "nope.txt" in capsys.readouterr().err
@@ -0,0 +1,107 @@
+"""Tests for the timing and comparison helpers."""
+
+import gc
+
+import pytest
+
+from src.fp_gym.arrays.find_missing_repeating import (
+    find_missing_repeating,
+    find_missing_repeating_optimal,
+)
+from src.fp_gym.common import (
+    SolutionComparer,
+    Timing,
+    compare_algorithms,
+    measure,
+    scaling_report,
+    time_it,
+)
+
+
+def missing_repeating_input(n):
+    return list(range(1, n)) + [1]
+
+
+class TestTimer:
+    """Test cases for time_it and measure."""
+
+    def test_time_it(self):
+        """Test that the result is returned with a non-negative duration."""
+        result, elapsed = time_it(lambda: sum(range(100)))
+        assert result == 4950
+        assert elapsed >= 0
+
+    def test_measure_trials_and_setup(self):
+        """Test that setup hands each call a fresh copy of the input."""
+        data = [3, 1, 2]
+
+        def mutate(values):
+            values.append(0)
+            return len(values)
+
+        result, timing = measure(mutate, data, name="mutate", setup=list, warmup=2, trials=5)
+        assert result == 4
+        assert data == [3, 1, 2]
+        assert timing.name == "mutate"
+        assert len(timing.samples_ns) == 5
+        assert timing.peak_bytes is not None
+
+    def test_measure_restores_gc(self):
+        """Test that the collector is re-enabled after timing."""
+        measure(len, [1], trials=2, trace_memory=False)
+        assert gc.isenabled()
+
+    def test_statistics(self):
+        """Test median and nearest-rank p95."""
+        timing = Timing("t", tuple(range(1, 21)))
+        assert timing.median_ns == 10.5
+        assert timing.p95_ns == 19
+        assert timing.min_ns == 1
+
+    def test_rejects_zero_trials(self):
+        with pytest.raises(ValueError):
+            measure(len, [], trials=0)
+
+
+class TestSolutionComparer:
+    """Test cases for SolutionComparer."""
+
+    def test_agreeing_implementations(self):
+        """Test that agreeing implementations are reported as matching."""
+        comparer = SolutionComparer(
+            {"set": find_missing_repeating, "optimal": find_missing_repeating_optimal},
+            setup=list,
+            trials=3,
+        )
+        comparison = comparer.compare(missing_repeating_input(100))
+        assert comparison.agree
+        assert comparison.size == 100
+        assert comparison.fastest in {"set", "optimal"}
+        assert "✓ Results match" in comparison.report()
+
+    def test_mismatch_is_reported(self):
+        """Test that a wrong implementation is flagged."""
+        comparison = SolutionComparer({"len": len, "wrong": lambda xs: -1}, trials=1).compare([1])
+        assert comparison.mismatches == ["wrong"]
+        assert "Results differ" in comparison.report()
+
+    def test_scaling(self):
+        """Test one comparison per size and the scaling table."""
+        comparer = SolutionComparer(
+            {"sorted": sorted, "min": min}, trials=2, trace_memory=False, equal=lambda a, b: True
+        )
+        comparisons = comparer.scaling(lambda n: list(range(n, 0, -1)), [10, 100])
+        assert [c.size for c in comparisons] == [10, 100]
+        table = scaling_report(comparisons).splitlines()
+        assert len(table) == 3
+        assert "sorted" in table[0] and "min" in table[0]
+
+    def test_compare_algorithms_prints(self, capsys):
+        """Test the two-implementation helper mirroring the Scala API."""
+        compare_algorithms([3, 1, 2], sorted, lambda xs: sorted(xs), "builtin", "lambda")
+        out = capsys.readouterr().out
+        assert "builtin" in out and "lambda" in out and "✓ Results match" in out
+
+    def test_requires_implementations(self):
+        with pytest.raises(ValueError):
+            SolutionComparer({})
@@ -0,0 +1,147 @@
+"""Tests for the direct-address (dense) engines."""
+
+import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, two_sum_fast, two_sum_generator
+from src.fp_gym.dense import (
+    DenseTable,
+    DenseTablePool,
+    dense_pairs,
+    find_missing_repeating_dense,
+)
+from src.fp_gym.solver import TwoSumResult
+from tests.helpers import matches_generator, missing_repeating_input, random_ints
+
+lists = st.lists(st.integers(min_value=-30, max_value=30), max_size=60)
+targets = st.integers(min_value=-60, max_value=60)
+
+
+class TestDenseTwoSum:
+    """Test cases for dense two sum."""
+
+    def setup_method(self):
+        """One table shared by every call, as in production use."""
+        self.table = DenseTable(capacity=64)
+
+    @given(lists, targets)
+    def test_matches_generator(self, nums, target):
+        """Property: pairs, first pair and count match the hashing engines."""
+        expected = list(two_sum_generator(nums, target))
+        assert list(self.table.pairs(nums, target)) == expected
+        assert self.table.first(nums, target) == two_sum_fast(nums, target)
+        assert self.table.count(nums, target) == len(expected)
+
+    def test_reuse_ignores_previous_calls(self):
+        """Test that stale entries from an earlier call are never matched."""
+        assert self.table.count([1, 2, 3, 4], 5) == 2
+        assert self.table.first([4], 5) is None
+        assert self.table.first([9, 4], 5) is None
+
+    def test_range_too_large_falls_back(self):
+        """Test that inputs wider than the table use the dict engine."""
+        nums = [0, 1000, 5, -1000]
+        assert not self.table.fits(min(nums), max(nums))
+        assert list(self.table.pairs(nums, 0)) == list(two_sum_generator(nums, 0))
+        assert self.table.count(nums, 0) == 1
+
+    def test_buffers_and_arrays(self):
+        """Test array('q') and NumPy inputs."""
+        assert self.table.count(array("q", [1, 2, 3, 4]), 5) == 2
+        assert self.table.first(np.array([2, 7, 11, 15]), 9).indices == (0, 1)
+
+    def test_default_table(self):
+        """Test the one-shot helper sizes its own table."""
+        assert [r.indices for r in dense_pairs([2, 7, 11, 15], 9)] == [(0, 1)]
+        assert list(dense_pairs([], 9)) == []
+
+    def test_rejects_empty_capacity(self):
+        with pytest.raises(ValueError):
+            DenseTable(0)
+
+
+class TestDenseMissingRepeating:
+    """Test cases for dense missing/repeating."""
+
+    def setup_method(self):
+        self.table = DenseTable(capacity=256)
+
+    @given(missing_repeating_input())
+    def test_finds_planted_pair(self, data):
+        """Property: the dense variant finds the planted pair, with a reused table."""
+        arr, missing, repeating = data
+        assert find_missing_repeating_dense(arr, self.table) == (missing, repeating)
+        assert find_missing_repeating_dense(arr) == (missing, repeating)
+
+    def test_does_not_mutate(self):
+        """Test that the input is left untouched."""
+        arr = [4, 3, 6, 2, 1, 1]
+        assert find_missing_repeating_dense(arr) == (5, 1)
+        assert arr == [4, 3, 6, 2, 1, 1]
+
+    def test_invalid_inputs(self):
+        """Test out-of-range values and inputs without a duplicate."""
+        with pytest.raises(ValueError):
+            find_missing_repeating_dense([0, 1, 2])
+        with pytest.raises(ValueError):
+            find_missing_repeating_dense([2, 1, 3])
+
+    def test_larger_than_table_falls_back(self):
+        """Test that arrays longer than the table use the sums variant."""
+        assert DenseTable(capacity=2).find_missing_repeating([3, 1, 3]) == (2, 3)
+
+
+class TestDenseBackend:
+    """Test cases for TwoSumSolver(backend="dense")."""
+
+    def test_solver_reuses_table(self) -> None:
+        """Test that sequential calls keep reusing the table passed in."""
+        table = DenseTable(capacity=128)
+        solver = TwoSumSolver(backend="dense", dense_table=table)
+        assert solver.count_pairs([1, 2, 3, 4], 5) == 2
+        assert solver.find_first_pair_fast([2, 7, 11, 15], 9).indices == (0, 1)
+        assert solver.find_all_pairs([3, 3], 6)[0].indices == (0, 1)
+        assert solver.dense_tables.acquire() is table
+
+    def test_interleaved_generators(self) -> None:
+        """Test that live generators on one solver each keep their own table."""
+        solver = TwoSumSolver(backend="dense")
+        first_nums, second_nums = [3] * 8, [3, 2, 3, 4] * 4
+        first = solver.solve_with_stack_safety(first_nums, 6)
+        second = solver.solve_with_stack_safety(second_nums, 6)
+        first_results: list[TwoSumResult] = []
+        second_results: list[TwoSumResult] = []
+        for a, b in zip(first, second, strict=False):
+            first_results.append(a)
+            second_results.append(b)
+        first_results += first
+        second_results += second
+        assert first_results == list(two_sum_generator(first_nums, 6))
+        assert second_results == list(two_sum_generator(second_nums, 6))
+
+    def test_abandoned_generator_returns_its_table(self) -> None:
+        """Test that closing a generator early hands its table back."""
+        table = DenseTable(capacity=64)
+        pool = DenseTablePool(64, [table])
+        pairs = pool.pairs([1, 1, 1], 2)
+        next(pairs)
+        other = pool.acquire()
+        assert other is not table
+        pool.release(other)
+        pairs.close()
+        assert table in (pool.acquire(), pool.acquire())
+
+    def test_threads_share_a_solver(self) -> None:
+        """Test that threads sharing one solver get correct pairs."""
+        solver = TwoSumSolver(backend="dense")
+        rng = random.Random(3)
+        jobs = [(random_ints(rng, 400, 0, 63), rng.randrange(128)) for _ in range(160)]
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(pool.map(lambda job: matches_generator(solver, *job), jobs))
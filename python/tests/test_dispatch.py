@@ -0,0 +1,122 @@
+"""Tests for the adaptive backend dispatcher and the nested-loop engine."""
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, two_sum_fast, two_sum_generator
+from src.fp_gym.dispatch import Dispatcher, InputStats, Thresholds
+from src.fp_gym.nested import nested_first, nested_pairs
+
+small_lists = st.lists(st.integers(min_value=-10, max_value=10), max_size=30)
+targets = st.integers(min_value=-20, max_value=20)
+
+
+class TestNested:
+    """Test cases for the nested-loop engine."""
+
+    @given(small_lists, targets)
+    def test_matches_generator(self, nums, target) -> None:
+        """Test that the nested loop yields exactly the generator's pairs."""
+        assert list(nested_pairs(nums, target)) == list(two_sum_generator(nums, target))
+        assert nested_first(nums, target) == two_sum_fast(nums, target)
+
+
+class TestInputStats:
+    """Test cases for InputStats."""
+
+    def test_lazy_range(self) -> None:
+        """Test that min/max are only computed on access."""
+        stats = InputStats([5, 1, 9])
+        assert "low" not in repr(stats)
+        assert (stats.low, stats.high, stats.value_range) == (1, 9, 9)
+        assert "low=1" in repr(stats)
+
+    def test_sorted_sample(self) -> None:
+        """Test the sampled sortedness check."""
+        assert InputStats(list(range(1000))).sorted_sample
+        assert not InputStats(list(range(1000, 0, -1))).sorted_sample
+
+    def test_dtype_and_int64(self) -> None:
+        """Test dtype detection and int64 fit."""
+        assert InputStats(np.arange(3)).dtype == "int64"
+        assert InputStats(np.arange(3)).fits_int64
+        assert not InputStats(np.arange(3, dtype=np.uint64)).fits_int64
+        assert not InputStats([0, 1 << 64]).fits_int64
+
+
+class TestDispatcher:
+    """Test cases for engine selection."""
+
+    def setup_method(self) -> None:
+        """Set up a dispatcher with small thresholds."""
+        self.dispatcher = Dispatcher(Thresholds(nested_max=4, numpy_min=100, process_min=1000))
+
+    @pytest.mark.parametrize(
+        "nums, operation, engine",
+        [
+            ([1, 2, 3], "all", "nested"),
+            (list(range(50, 0, -1)), "first", "python"),
+            (list(range(50)), "first", "sorted"),
+            (list(range(50, 0, -1)), "all", "dense"),
+            (list(range(50)), "all", "sorted"),
+            ([1000 * i for i in range(50, 0, -1)], "all", "python"),
+            (list(range(500)), "all", "numpy"),
+            ([(1 << 70) + i % 7 for i in range(500)], "all", "dense"),
+            ([(1 << 70) * i for i in range(500, 0, -1)], "all", "python"),
+            (list(range(5000, 0, -1)), "all", "process"),
+        ],
+    )
+    def test_choose(self, nums, operation, engine) -> None:
+        """Test the engine picked for each size class."""
+        choice = self.dispatcher.choose(nums, operation)
+        assert choice.engine == engine
+        assert choice.reason
+
+    def test_calibrate(self) -> None:
+        """Test that calibration produces and stores thresholds."""
+        thresholds = self.dispatcher.calibrate(
+            nested_sizes=(2, 8), numpy_sizes=(256, 4096), trials=1
+        )
+        assert self.dispatcher.thresholds is thresholds
+        assert thresholds.nested_max >= 1
+        assert thresholds.numpy_min in (256, 4096) or thresholds.numpy_min > 4096
+        assert thresholds.process_min == 1000
+
+
+class TestAutoBackend:
+    """Test cases for TwoSumSolver(backend="auto")."""
+
+    def setup_method(self) -> None:
+        """Set up an auto solver with small thresholds and a python reference."""
+        self.solver = TwoSumSolver(
+            backend="auto", dispatcher=Dispatcher(Thresholds(nested_max=4, numpy_min=20))
+        )
+        self.reference = TwoSumSolver(backend="python")
+
+    @given(small_lists, targets)
+    def test_matches_python_backend(self, nums, target) -> None:
+        """Test that results are unchanged whichever engine is picked."""
+        assert self.solver.find_all_pairs(nums, target) == self.reference.find_all_pairs(
+            nums, target
+        )
+        assert self.solver.count_pairs(nums, target) == self.reference.count_pairs(nums, target)
+        assert self.solver.find_first_pair(nums, target) == self.reference.find_first_pair(
+            nums, target
+        )
+
+    def test_last_choice_is_recorded(self) -> None:
+        """Test that the engine picked for the last call is exposed."""
+        self.solver.count_pairs([1, 2], 3)
+        assert self.solver.last_choice.engine == "nested"
+        self.solver.count_pairs(list(range(100, 0, -1)), 3)
+        assert self.solver.last_choice.engine == "numpy"
+        assert self.solver.last_choice.operation == "all"
+
+    def test_per_call_override(self) -> None:
+        """Test that a call can force an engine without touching last_choice."""
+        assert self.solver.count_pairs(list(range(100)), 3, backend="python") == 2
+        assert self.solver.last_choice is None
+        with pytest.raises(ValueError):
+            self.solver.count_pairs([1], 1, backend="cobol")
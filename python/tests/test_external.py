@@ -0,0 +1,117 @@
+"""Tests for the external-sort two sum engine."""
+
+import os
+import random
+from array import array
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.fp_gym import external
+from src.fp_gym.external import ExternalStats, two_sum_external
+from src.fp_gym.mapped import MappedInt64
+from tests.helpers import pairs, random_ints, reference_pairs
+
+# Smallest budget: blocks of 16 elements, so most inputs spill many runs
+TINY = 1
+
+
+class TestTwoSumExternal:
+    """Test cases for two_sum_external."""
+
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(st.integers(min_value=-20, max_value=20), max_size=200),
+           st.integers(min_value=-40, max_value=40))
+    def test_matches_generator(self, nums, target) -> None:
+        """Test that spilled runs give the generator's pairs in its order."""
+        expected = reference_pairs(nums, target)
+        assert pairs(two_sum_external(nums, target, memory=TINY)) == expected
+
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(st.integers(min_value=-20, max_value=20), max_size=200),
+           st.integers(min_value=-40, max_value=40))
+    def test_unordered_is_a_permutation(self, nums, target) -> None:
+        """Test that without reordering the same pairs come out grouped by value."""
+        expected = sorted(reference_pairs(nums, target))
+        results = pairs(two_sum_external(nums, target, memory=TINY, ordered=False))
+        assert sorted(results) == expected
+
+    def test_small_input_stays_in_memory(self, tmp_path) -> None:
+        """Test that an input fitting in one block never creates runs."""
+        stats = ExternalStats()
+        results = list(two_sum_external([2, 7, 11, 15], 9, temp_dir=tmp_path, stats=stats))
+        assert pairs(results) == [((0, 1), (2, 7))]
+        assert stats.runs == 0
+        assert stats.elements == 4
+
+    def test_spills_and_cleans_up(self, tmp_path) -> None:
+        """Test that runs are written under temp_dir and removed afterwards."""
+        rng = random.Random(7)
+        nums = random_ints(rng, 2000, -500, 500)
+        stats = ExternalStats()
+        results = pairs(two_sum_external(nums, 3, memory=TINY, temp_dir=tmp_path, stats=stats))
+        assert results == reference_pairs(nums, 3)
+        # Two sorted runs per block plus the reordered pairs
+        assert stats.runs >= 2 * (2000 // 16)
+        assert stats.merge_passes >= 2
+        assert stats.bytes_spilled >= 2 * 16 * 2000
+        assert stats.pairs == len(results)
+        assert os.listdir(tmp_path) == []
+
+    def test_closing_early_cleans_up(self, tmp_path) -> None:
+        """Test that abandoning the generator still deletes its runs."""
+        nums = [1] * 500
+        results = two_sum_external(nums, 2, memory=TINY, temp_dir=tmp_path)
+        assert next(results).indices == (0, 1)
+        assert os.listdir(tmp_path)
+        results.close()
+        assert os.listdir(tmp_path) == []
+
+    def test_many_runs_merge_in_passes(self, monkeypatch) -> None:
+        """Test that more runs than MAX_FAN_IN are merged in intermediate passes."""
+        monkeypatch.setattr(external, "MAX_FAN_IN", 4)
+        nums = [i % 37 for i in range(1000)]
+        stats = ExternalStats()
+        results = pairs(two_sum_external(nums, 36, memory=TINY, stats=stats))
+        assert results == reference_pairs(nums, 36)
+        assert stats.merge_passes > 3
+
+    def test_pure_python_sort(self, monkeypatch) -> None:
+        """Test that blocks are sorted without NumPy when it is not installed."""
+        monkeypatch.setattr(external, "_have_numpy", lambda: False)
+        nums = [5, -3, 8, 0, 5, 3, -5, 10] * 10
+        expected = reference_pairs(nums, 5)
+        assert pairs(two_sum_external(nums, 5, memory=TINY)) == expected
+
+    @pytest.mark.parametrize("source", ["iterator", "array", "memoryview"])
+    def test_input_kinds(self, source) -> None:
+        """Test that iterators are read in blocks and sequences and buffers are sliced."""
+        nums = [(i * 7919) % 101 - 50 for i in range(300)]
+        data = {
+            "iterator": iter(nums),
+            "array": array("q", nums),
+            "memoryview": memoryview(array("q", nums)),
+        }[source]
+        expected = reference_pairs(nums, 0)
+        assert pairs(two_sum_external(data, 0, memory=TINY)) == expected
+
+    def test_mapped_input(self, tmp_path) -> None:
+        """Test that a memory-mapped file is read chunk by chunk."""
+        nums = [(i * 31) % 97 for i in range(500)]
+        path = tmp_path / "nums.i64"
+        with path.open("wb") as out:
+            array("q", nums).tofile(out)
+        with MappedInt64(path) as mapped:
+            results = pairs(two_sum_external(mapped, 96, memory=TINY))
+        assert results == reference_pairs(nums, 96)
+
+    def test_complement_overflow(self) -> None:
+        """Test that complements outside int64 are rejected."""
+        with pytest.raises(OverflowError):
+            list(two_sum_external([-(2**62)] * 40, 2**62, memory=TINY))
+
+    def test_invalid_memory(self) -> None:
+        """Test that a non-positive memory budget is rejected."""
+        with pytest.raises(ValueError, match="memory"):
+            list(two_sum_external([1, 2], 3, memory=0))
@@ -0,0 +1,80 @@
+"""Tests for the missing and repeating element solvers."""
+
+from array import array
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym.arrays.find_missing_repeating import (
+    find_missing_repeating,
+    find_missing_repeating_chunked,
+    find_missing_repeating_optimal,
+    find_missing_repeating_vectorized,
+    find_missing_repeating_vectorized_chunked,
+)
+from tests.helpers import missing_repeating_input
+
+
+def chunked(arr, size):
+    """Split a list into consecutive chunks."""
+    return [arr[i : i + size] for i in range(0, len(arr), size)]
+
+
+class TestFindMissingRepeating:
+    """Test cases for the missing/repeating solvers."""
+
+    @pytest.mark.parametrize(
+        "arr, expected", [([3, 1, 3], (2, 3)), ([4, 3, 6, 2, 1, 1], (5, 1))]
+    )
+    def test_examples(self, arr, expected) -> None:
+        """Test the examples from the module docstring."""
+        assert find_missing_repeating(arr) == expected
+        assert find_missing_repeating_chunked([arr]) == expected
+        assert find_missing_repeating_optimal(list(arr)) == expected
+        assert find_missing_repeating_vectorized(arr) == expected
+
+    def test_chunked_rejects_permutation(self) -> None:
+        """Test that an input without a duplicate is rejected."""
+        with pytest.raises(ValueError):
+            find_missing_repeating_chunked([[2, 1, 3]])
+        with pytest.raises(ValueError):
+            find_missing_repeating_vectorized(np.array([2, 1, 3]))
+
+    def test_vectorized_does_not_copy_or_mutate(self) -> None:
+        """Test that int64 buffers are read in place and left untouched."""
+        data = np.array([4, 3, 6, 2, 1, 1], dtype=np.int64)
+        data.flags.writeable = False
+        assert find_missing_repeating_vectorized(data) == (5, 1)
+        assert find_missing_repeating_vectorized(memoryview(array("q", [3, 1, 3]))) == (2, 3)
+        assert find_missing_repeating_vectorized(np.array([3, 1, 3], dtype=np.uint8)) == (2, 3)
+
+    def test_vectorized_rejects_floats(self) -> None:
+        """Test that non-integer chunks are rejected."""
+        with pytest.raises(TypeError):
+            find_missing_repeating_vectorized(np.array([3.0, 1.0, 3.0]))
+
+    def test_vectorized_large_values_wrap_exactly(self) -> None:
+        """Test values whose squares overflow a single uint64 accumulator."""
+        n = 4_000_000
+        data = np.arange(1, n + 1, dtype=np.int64)
+        data[n - 2] = 7  # n - 1 missing, 7 repeated
+        chunks = [data[i : i + 65536] for i in range(0, n, 65536)]
+        assert find_missing_repeating_vectorized_chunked(chunks) == (n - 1, 7)
+
+    @given(missing_repeating_input(), st.integers(min_value=1, max_value=50))
+    def test_all_variants_agree(self, data, chunk_size):
+        """Property: every variant finds the planted pair."""
+        arr, missing, repeating = data
+
+        assert find_missing_repeating(arr) == (missing, repeating)
+        assert find_missing_repeating_chunked(chunked(arr, chunk_size)) == (missing, repeating)
+        assert find_missing_repeating_optimal(list(arr)) == (missing, repeating)
+        assert find_missing_repeating_vectorized_chunked(
+            np.array(c) for c in chunked(arr, chunk_size)
+        ) == (missing, repeating)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
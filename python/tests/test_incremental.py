@@ -0,0 +1,75 @@
+"""Tests for the incremental two sum index."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import IncrementalTwoSumIndex, two_sum_generator
+from src.fp_gym.pairs import count_all_pairs
+
+# Positive entries add that value minus 10; negative entries remove a live element
+updates = st.lists(st.integers(min_value=-20, max_value=20), max_size=60)
+targets = st.integers(min_value=-20, max_value=20)
+
+
+def replay(index, ops):
+    """Apply ``ops`` to ``index`` and return the live (index, value) pairs."""
+    live = {}
+    for op in ops:
+        if op >= 0 or not live:
+            live[index.add(op % 21 - 10)] = op % 21 - 10
+        else:
+            handle = sorted(live)[-op % len(live)]
+            assert index.remove(handle) == live.pop(handle)
+    return live
+
+
+class TestIncrementalTwoSumIndex:
+    """Test cases for IncrementalTwoSumIndex."""
+
+    def test_add_remove(self):
+        """Test the basic update and query cycle."""
+        index = IncrementalTwoSumIndex([2, 7, 11])
+        assert index.has_pair(9)
+        index.remove(0)
+        assert not index.has_pair(9)
+        assert index.add(2) == 3
+        assert [r.indices for r in index.pairs(9)] == [(1, 3)]
+        assert len(index) == 3 and index[3] == 2 and 11 in index
+        with pytest.raises(KeyError):
+            index.remove(0)
+
+    def test_equal_halves(self):
+        """Test that a value pairs with itself only when it occurs twice."""
+        index = IncrementalTwoSumIndex([5])
+        assert not index.has_pair(10)
+        index.add(5)
+        assert index.has_pair(10)
+        assert index.count(5) == 2
+
+    @given(updates, targets)
+    def test_matches_rebuild(self, ops, target):
+        """Property: after any updates, queries equal a rebuild from scratch."""
+        index = IncrementalTwoSumIndex(watch=[target])
+        live = replay(index, ops)
+        handles, values = list(live), list(live.values())
+        expected = [
+            ((handles[j], handles[i]), r.values)
+            for r in two_sum_generator(values, target)
+            for j, i in [r.indices]
+        ]
+        assert [(r.indices, r.values) for r in index.pairs(target)] == expected
+        assert index.has_pair(target) == bool(expected)
+        assert index.pair_count(target) == count_all_pairs(values, target)
+        index.unwatch(target)
+        assert index.pair_count(target) == count_all_pairs(values, target)
+        assert index.distinct == len(set(values))
+
+    def test_watch_after_updates(self):
+        """Test that watching a target later starts from the current count."""
+        index = IncrementalTwoSumIndex([1, 2, 3, 4])
+        index.watch(5)
+        assert index.pair_count(5) == 2
+        index.remove(index.add(1))
+        index.add(4)
+        assert index.pair_count(5) == 3
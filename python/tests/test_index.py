@@ -0,0 +1,91 @@
+"""Tests for the prebuilt multi-target two sum index."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from returns.maybe import Nothing, Some
+
+from src.fp_gym import TwoSumIndex, TwoSumSolver, two_sum
+
+
+def assert_same(expected, actual) -> None:
+    """Compare two Maybe[TwoSumResult] values."""
+    if expected is Nothing:
+        assert actual is Nothing
+    else:
+        assert isinstance(actual, Some)
+        assert actual.unwrap() == expected.unwrap()
+
+
+class TestTwoSumIndex:
+    """Test cases for TwoSumIndex."""
+
+    def test_basic_query(self) -> None:
+        """Test single queries against a small index."""
+        index = TwoSumIndex([2, 7, 11, 15])
+
+        assert index.query(9).unwrap().indices == (0, 1)
+        assert index.query(26).unwrap().values == (11, 15)
+        assert index.query(100) is Nothing
+
+    def test_positions_and_sizes(self) -> None:
+        """Test the value to indices mapping."""
+        index = TwoSumIndex([3, 1, 3, 2, 3])
+
+        assert len(index) == 5
+        assert index.distinct == 3
+        assert index.positions(3) == (0, 2, 4)
+        assert index.positions(9) == ()
+
+    def test_repeated_values(self) -> None:
+        """Test that a value can pair with itself and uses the latest index."""
+        nums = [5, 1, 5, 5]
+        index = TwoSumIndex(nums)
+
+        assert_same(two_sum(nums, 10), index.query(10))
+        assert index.query(10).unwrap().indices == (0, 2)
+
+    def test_empty_index(self) -> None:
+        """Test that an empty index never finds a pair."""
+        index = TwoSumIndex([])
+
+        assert index.query(0) is Nothing
+        assert index.query_many([0, 1]) == [Nothing, Nothing]
+
+    def test_query_many_preserves_order(self) -> None:
+        """Test batch results line up with the targets."""
+        nums = [2, 7, 11, 15]
+        index = TwoSumIndex(nums)
+        targets = [9, 100, 26, 18, 9]
+
+        for target, result in zip(targets, index.query_many(targets)):
+            assert_same(two_sum(nums, target), result)
+
+    def test_query_many_huge_targets(self) -> None:
+        """Test targets outside the int64 range are still answered."""
+        nums = [2**62, 2**62, 1]
+        index = TwoSumIndex(nums)
+
+        assert_same(two_sum(nums, 2**63), index.query_many([2**63])[0])
+
+    def test_solver_builds_index(self) -> None:
+        """Test TwoSumSolver.build_index."""
+        index = TwoSumSolver().build_index([1, 2, 3])
+
+        assert index.query(5).unwrap().indices == (1, 2)
+
+    @given(st.lists(st.integers(min_value=-30, max_value=30), max_size=60),
+           st.lists(st.integers(min_value=-60, max_value=60), max_size=20))
+    def test_matches_two_sum(self, nums, targets):
+        """Property: query and query_many agree with two_sum for every target."""
+        index = TwoSumIndex(nums)
+        batch = index.query_many(targets)
+
+        for target, result in zip(targets, batch):
+            expected = two_sum(nums, target)
+            assert_same(expected, index.query(target))
+            assert_same(expected, result)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,93 @@
+"""Tests for the k-sum and closest k-sum engines."""
+
+import random
+from itertools import combinations
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, ksum
+from src.fp_gym.ksum import closest_k_sum, k_sum_generator
+
+small_lists = st.lists(st.integers(min_value=-8, max_value=8), max_size=12)
+targets = st.integers(min_value=-20, max_value=20)
+ks = st.integers(min_value=2, max_value=5)
+
+
+def brute_force(nums, target, k):
+    """Distinct ascending value tuples of ``k`` positions summing to ``target``."""
+    return sorted({tuple(sorted(c)) for c in combinations(nums, k) if sum(c) == target})
+
+
+class TestKSum:
+    """Test cases for k_sum_generator."""
+
+    def test_three_sum(self):
+        """Test the classic 3-sum example."""
+        results = list(k_sum_generator([-1, 0, 1, 2, -1, -4], 0))
+        assert [r.values for r in results] == [(-1, -1, 2), (-1, 0, 1)]
+        assert results[0].indices == (0, 4, 3)
+        assert results[0].total == 0
+
+    @settings(max_examples=300)
+    @given(small_lists, targets, ks)
+    def test_matches_brute_force(self, nums, target, k):
+        """Property: the pruned search (and k=4 meet-in-the-middle) finds every combination."""
+        results = list(k_sum_generator(nums, target, k))
+        assert [r.values for r in results] == brute_force(nums, target, k)
+        for r in results:
+            assert len(set(r.indices)) == k
+            assert tuple(nums[i] for i in r.indices) == r.values
+
+    def test_four_sum_without_meet_in_the_middle(self, monkeypatch):
+        """Test that the sort-based fallback for k=4 agrees."""
+        nums = [1, 0, -1, 0, -2, 2, 2, 2]
+        expected = [r.values for r in k_sum_generator(nums, 2, 4)]
+        monkeypatch.setattr("src.fp_gym.ksum.MITM_MAX_PAIRS", 0)
+        assert [r.values for r in k_sum_generator(nums, 2, 4)] == expected
+        assert expected == brute_force(nums, 2, 4)
+
+    @pytest.mark.parametrize("k", [2, 3, 4])
+    def test_vectorized_inner_level(self, monkeypatch, k):
+        """Test that the NumPy two sum level agrees with the pure-Python one."""
+        pytest.importorskip("numpy")
+        rng = random.Random(k)
+        nums = [rng.randint(-300, 300) for _ in range(400)] + [0, 0, 0, 5, 5, -10]
+        monkeypatch.setattr(ksum, "MITM_MAX_PAIRS", 0)
+        vectorized = list(k_sum_generator(nums, 0, k))
+        assert ksum._Prepared(nums, k).array is not None
+        monkeypatch.setattr(ksum, "_have_numpy", lambda: False)
+        assert list(k_sum_generator(nums, 0, k)) == vectorized
+        assert all(r.total == 0 for r in vectorized)
+
+    def test_invalid_k(self):
+        """Test that k below 2 is rejected."""
+        with pytest.raises(ValueError):
+            list(k_sum_generator([1, 2], 3, k=1))
+
+
+class TestClosestKSum:
+    """Test cases for closest_k_sum."""
+
+    @settings(max_examples=300)
+    @given(small_lists, targets, ks)
+    def test_matches_brute_force(self, nums, target, k):
+        """Property: the distance (and tie-break to the smaller sum) is optimal."""
+        result = closest_k_sum(nums, target, k)
+        if len(nums) < k:
+            assert result is None
+            return
+        best = min((abs(sum(c) - target), sum(c)) for c in combinations(nums, k))
+        assert (abs(result.total - target), result.total) == best
+        assert tuple(nums[i] for i in result.indices) == result.values
+
+    def test_solver_methods(self):
+        """Test the TwoSumSolver entry points."""
+        solver = TwoSumSolver()
+        assert [r.values for r in solver.find_k_sums([1, 0, -1, 0, -2, 2], 0, k=4)] == [
+            (-2, -1, 1, 2),
+            (-2, 0, 0, 2),
+            (-1, 0, 0, 1),
+        ]
+        assert solver.closest_k_sum([-1, 2, 1, -4], 1).total == 2
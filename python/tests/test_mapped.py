@@ -0,0 +1,126 @@
+"""Tests for memory-mapped int64 inputs."""
+
+import mmap
+from array import array
+
+import pytest
+
+from src.fp_gym import mapped, two_sum_generator
+from src.fp_gym.mapped import NPY_MAGIC, MappedInt64, find_missing_repeating_file, two_sum_file
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    """A raw int64 dump."""
+    path = tmp_path / "nums.bin"
+    array("q", [4, 3, 6, 2, 1, 1]).tofile(path.open("wb"))
+    return path
+
+
+class TestMappedInt64:
+    """Test cases for MappedInt64."""
+
+    def test_raw_file(self, raw_file) -> None:
+        """Test mapping a raw dump."""
+        with MappedInt64(raw_file) as nums:
+            assert len(nums) == 6
+            assert nums[0] == 4
+            assert list(nums) == [4, 3, 6, 2, 1, 1]
+            assert nums.view.format == "q"
+
+    def test_chunks(self, raw_file) -> None:
+        """Test zero-copy chunking."""
+        with MappedInt64(raw_file) as nums:
+            sizes = [len(chunk) for chunk in nums.chunks(4)]
+            with pytest.raises(ValueError):
+                next(nums.chunks(0))
+
+        assert sizes == [4, 2]
+
+    def test_empty_file(self, tmp_path) -> None:
+        """Test that an empty file maps to no elements."""
+        path = tmp_path / "empty.bin"
+        path.write_bytes(b"")
+
+        with MappedInt64(path) as nums:
+            assert len(nums) == 0
+
+    def test_truncated_file(self, tmp_path) -> None:
+        """Test that a partial int64 word is rejected."""
+        path = tmp_path / "bad.bin"
+        path.write_bytes(b"\x00" * 12)
+
+        with pytest.raises(ValueError):
+            MappedInt64(path)
+
+    @pytest.mark.parametrize(
+        "data",
+        [b"\x00" * 12, NPY_MAGIC + b"\x01", NPY_MAGIC + b"\x01\x00\x08\x00{'descr'" + b"\x00" * 8],
+        ids=["partial-word", "short-npy-header", "corrupt-npy-header"],
+    )
+    def test_rejected_file_is_unmapped(self, tmp_path, monkeypatch, data) -> None:
+        """Test that a file failing validation does not leave its mapping open."""
+        maps, real_mmap = [], mmap.mmap
+
+        def tracked(*args, **kwargs):
+            maps.append(real_mmap(*args, **kwargs))
+            return maps[-1]
+
+        monkeypatch.setattr(mapped.mmap, "mmap", tracked)
+        path = tmp_path / "bad.bin"
+        path.write_bytes(data)
+
+        with pytest.raises(ValueError):
+            MappedInt64(path)
+        assert len(maps) == 1 and maps[0].closed
+
+    def test_two_sum_generator_over_mapping(self, raw_file) -> None:
+        """Test that the generator runs directly over the mapped buffer."""
+        with MappedInt64(raw_file) as nums:
+            results = list(two_sum_generator(nums.view, 9))
+
+        assert [r.indices for r in results] == [(1, 2)]
+
+    def test_find_missing_repeating_file(self, raw_file) -> None:
+        """Test the chunked missing/repeating solver over a file."""
+        assert find_missing_repeating_file(raw_file, chunk_size=4) == (5, 1)
+
+
+class TestNpyFiles:
+    """Test cases for .npy inputs."""
+
+    np = pytest.importorskip("numpy")
+
+    def test_npy_file(self, tmp_path) -> None:
+        """Test the header is skipped and data mapped without copying."""
+        path = tmp_path / "nums.npy"
+        self.np.save(path, self.np.array([2, 7, 11, 15], dtype=self.np.int64))
+
+        with MappedInt64(path) as nums:
+            assert list(nums) == [2, 7, 11, 15]
+            data = nums.array()
+            assert not data.flags.owndata
+            del data
+
+    def test_rejects_other_dtypes(self, tmp_path) -> None:
+        """Test non-int64 .npy files are rejected."""
+        path = tmp_path / "floats.npy"
+        self.np.save(path, self.np.array([1.0, 2.0]))
+
+        with pytest.raises(ValueError):
+            MappedInt64(path)
+
+    def test_two_sum_file(self, tmp_path) -> None:
+        """Test the vectorized engine over a mapped file."""
+        path = tmp_path / "nums.npy"
+        nums = [1, 2, 3, 2, 1, 4]
+        self.np.save(path, self.np.array(nums, dtype=self.np.int64))
+
+        pairs = two_sum_file(path, 4)
+
+        expected = [r.indices for r in two_sum_generator(nums, 4)]
+        assert list(zip(pairs.left_indices.tolist(), pairs.right_indices.tolist())) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
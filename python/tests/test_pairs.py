@@ -0,0 +1,80 @@
+"""Tests for exhaustive two sum enumeration."""
+
+from itertools import combinations
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver
+from src.fp_gym.pairs import all_pairs_generator, count_all_pairs, pair_chunks
+
+
+def brute_force(nums, target):
+    """Every pair j < i ordered by i then j."""
+    pairs = [(j, i) for j, i in combinations(range(len(nums)), 2) if nums[j] + nums[i] == target]
+    return sorted(pairs, key=lambda p: (p[1], p[0]))
+
+
+class TestAllPairs:
+    """Test cases for all-pairs enumeration."""
+
+    def test_repeated_values_are_not_missed(self) -> None:
+        """Test every pair is found when values repeat."""
+        nums = [1, 3, 1, 3]
+        results = list(all_pairs_generator(nums, 4))
+
+        assert [r.indices for r in results] == [(0, 1), (1, 2), (0, 3), (2, 3)]
+        assert all(sum(r.values) == 4 for r in results)
+
+    def test_self_pairs(self) -> None:
+        """Test a value pairing with each earlier copy of itself."""
+        assert [r.indices for r in all_pairs_generator([2, 2, 2], 4)] == [(0, 1), (0, 2), (1, 2)]
+
+    def test_count_all_pairs(self) -> None:
+        """Test combinatorial counting."""
+        assert count_all_pairs([1, 3, 1, 3], 4) == 4
+        assert count_all_pairs([0] * 1000, 0) == 1000 * 999 // 2
+        assert count_all_pairs([], 0) == 0
+
+    def test_chunks_are_bounded(self) -> None:
+        """Test chunk sizes and contents."""
+        nums = [0] * 10
+        chunks = list(pair_chunks(nums, 0, chunk_size=7))
+
+        assert [len(left) for left, _ in chunks] == [7] * 6 + [3]
+        assert all(left.typecode == "q" and right.typecode == "q" for left, right in chunks)
+        flat = [p for left, right in chunks for p in zip(left, right)]
+        assert flat == brute_force(nums, 0)
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test chunk_size validation."""
+        with pytest.raises(ValueError):
+            list(pair_chunks([1, 2], 3, chunk_size=0))
+
+    def test_solver_exhaustive_mode(self) -> None:
+        """Test exhaustive flags on TwoSumSolver."""
+        solver = TwoSumSolver()
+        nums = [1, 2, 3, 2, 1]
+
+        assert len(solver.find_all_pairs(nums, 3)) == 3
+        assert len(solver.find_all_pairs(nums, 3, exhaustive=True)) == 4
+        assert solver.count_pairs(nums, 3) == 3
+        assert solver.count_pairs(nums, 3, exhaustive=True) == 4
+        assert sum(len(left) for left, _ in solver.iter_pair_chunks(nums, 3, 3)) == 4
+
+    @given(st.lists(st.integers(min_value=-10, max_value=10), max_size=40),
+           st.integers(min_value=-20, max_value=20),
+           st.integers(min_value=1, max_value=8))
+    def test_matches_brute_force(self, nums, target, chunk_size):
+        """Property: all three views agree with brute force enumeration."""
+        expected = brute_force(nums, target)
+
+        assert [r.indices for r in all_pairs_generator(nums, target)] == expected
+        chunks = pair_chunks(nums, target, chunk_size)
+        assert [p for left, right in chunks for p in zip(left, right)] == expected
+        assert count_all_pairs(nums, target) == len(expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
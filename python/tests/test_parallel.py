@@ -0,0 +1,78 @@
+"""Tests for the process-parallel two sum engine."""
+
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.fp_gym import TwoSumSolver  # noqa: E402
+from src.fp_gym.parallel import two_sum_parallel  # noqa: E402
+from src.fp_gym.vectorized import two_sum_arrays  # noqa: E402
+
+
+def assert_same_pairs(expected, actual) -> None:
+    """Compare two TwoSumArrays column by column."""
+    for left, right in zip(expected, actual):
+        assert left.tolist() == right.tolist()
+
+
+class TestTwoSumParallel:
+    """Test cases for two_sum_parallel."""
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """Share one small pool across the tests."""
+        cls.pool = ProcessPoolExecutor(max_workers=2)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """Shut the shared pool down."""
+        cls.pool.shutdown()
+
+    @pytest.mark.parametrize("shards", [1, 2, 3, 7])
+    @pytest.mark.parametrize("spread", [3, 100, 2**62])
+    def test_matches_vectorized(self, shards, spread) -> None:
+        """Test sharded results equal the single-process engine for any shard count."""
+        rng = random.Random(shards * 31 + spread)
+        nums = [rng.randint(-spread, spread) for _ in range(500)]
+        target = nums[3] + nums[400]
+
+        actual = two_sum_parallel(nums, target, workers=2, shards=shards, executor=self.pool)
+
+        assert_same_pairs(two_sum_arrays(nums, target), actual)
+
+    def test_skewed_values(self) -> None:
+        """Test a single hot value landing in one shard."""
+        nums = [5] * 300 + [1, 9, 5]
+
+        actual = two_sum_parallel(nums, 10, workers=2, executor=self.pool)
+
+        assert_same_pairs(two_sum_arrays(nums, 10), actual)
+
+    def test_small_and_overflowing_inputs(self) -> None:
+        """Test inputs handled without starting any shard work."""
+        assert two_sum_parallel([], 0, executor=self.pool).size == 0
+        assert two_sum_parallel([1], 1, executor=self.pool).size == 0
+        nums = [2**63 - 1, 1, -(2**63)]
+        assert_same_pairs(
+            two_sum_arrays(nums, -1), two_sum_parallel(nums, -1, executor=self.pool)
+        )
+
+    def test_invalid_shards(self) -> None:
+        """Test shard count validation."""
+        with pytest.raises(ValueError):
+            two_sum_parallel([1, 2], 3, shards=70000)
+
+    def test_process_backend(self) -> None:
+        """Test TwoSumSolver with the process backend owns its pool."""
+        nums = [1, 2, 3, 2, 1, 4, 0]
+        solver = TwoSumSolver(backend="process", workers=2)
+
+        assert solver.find_all_pairs(nums, 3) == TwoSumSolver().find_all_pairs(nums, 3)
+        assert solver.count_pairs(nums, 3) == TwoSumSolver().count_pairs(nums, 3)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,107 @@
+"""Tests for the pair-sum prefilter."""
+
+import random
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, prefilter, two_sum_fast
+from src.fp_gym.prefilter import PairSumFilter
+
+
+def pair_sums(nums):
+    return {a + b for i, a in enumerate(nums) for b in nums[i + 1 :]}
+
+
+class TestPairSumFilter:
+    """Test cases for PairSumFilter."""
+
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(st.integers(min_value=-50, max_value=50), max_size=40))
+    def test_no_false_negatives(self, nums):
+        """Property: every pair sum passes both the Bloom and the residue layer."""
+        for f in (PairSumFilter(nums), PairSumFilter(nums, max_sums=0)):
+            for target in range(-101, 102):
+                assert f.first_pair(target) == two_sum_fast(nums, target)
+            assert all(f.might_have_pair(target) for target in pair_sums(nums))
+
+    def test_kinds(self):
+        assert PairSumFilter([1, 2, 3]).kind == "bloom"
+        assert PairSumFilter([1, 2, 3], max_sums=2).kind == "residues"
+
+    def test_example(self):
+        f = PairSumFilter([2, 7, 11, 15])
+        assert not f.might_have_pair(10)
+        assert f.first_pair(9).indices == (0, 1)
+        assert f.two_sum(26).unwrap().values == (11, 15)
+        assert not f.has_pair(100)
+
+    def test_bounds(self):
+        """Bounds count a repeated value twice and exclude everything else."""
+        assert PairSumFilter([5, 5, 9]).bounds == (10, 14)
+        assert PairSumFilter([1, 9, 9]).bounds == (10, 18)
+        for nums in ([], [3]):
+            f = PairSumFilter(nums)
+            assert not any(f.might_have_pair(target) for target in range(-10, 10))
+
+    def test_residues_reject_structured_inputs(self):
+        """Sums of even values are even, so odd targets are ruled out."""
+        f = PairSumFilter(range(0, 200, 2), max_sums=0)
+        assert not f.might_have_pair(101)
+        assert f.might_have_pair(102)
+
+    def test_repeated_value_residue(self):
+        """A residue met once cannot pair with itself."""
+        f = PairSumFilter([0, 1], max_sums=0)
+        assert f.might_have_pair(1)
+        assert not f.might_have_pair(64)
+
+    def test_stats(self):
+        f = PairSumFilter([1, 2, 3, 4])
+        f.first_pair(100)
+        f.first_pair(5)
+        assert f.stats.queries == 2
+        assert f.stats.rejected == 1
+        assert f.stats.exact == 1
+        assert f.stats.avoided_rate == 0.5
+        f.might_have_pair(100)
+        assert f.stats.queries == 2
+
+    def test_false_positive_rate(self):
+        """The empirical rate on random targets stays near the requested one."""
+        rng = random.Random(7)
+        nums = [rng.randrange(-(10**9), 10**9) for _ in range(300)]
+        f = PairSumFilter(nums, 0.01)
+        sums = pair_sums(nums)
+        low, high = f.bounds
+        targets = [t for t in (rng.randrange(low, high) for _ in range(20_000)) if t not in sums]
+        passed = sum(f.might_have_pair(target) for target in targets)
+        assert passed / len(targets) < 0.02
+
+    def test_numpy_build_matches_python(self, monkeypatch):
+        rng = random.Random(3)
+        nums = [rng.randrange(-(10**6), 10**6) for _ in range(200)] + [4, 4, -(2**62)]
+        vectorized = PairSumFilter(nums)
+        monkeypatch.setattr(prefilter, "_have_numpy", lambda: False)
+        assert PairSumFilter(nums)._bloom.bits == vectorized._bloom.bits
+
+    def test_sums_beyond_int64(self):
+        """Values whose sums overflow int64 are hashed in Python."""
+        nums = [2**63 - 1, 2**63 - 2, -(2**63)]
+        f = PairSumFilter(nums)
+        assert f.first_pair(2**64 - 3).indices == (0, 1)
+        assert f.first_pair(-1).indices == (0, 2)
+
+    @pytest.mark.parametrize("rate", [0, 1, -0.5, 2])
+    def test_rejects_bad_rate(self, rate):
+        with pytest.raises(ValueError, match="false_positive_rate"):
+            PairSumFilter([1, 2], rate)
+
+    def test_solver_build_filter(self):
+        """The solver's filter searches with the solver's own backend."""
+        solver = TwoSumSolver("dense")
+        nums = [3, 8, -2, 5, 5, 0, 7, 1, 3]
+        f = solver.build_filter(nums)
+        for target in range(-10, 20):
+            assert f.first_pair(target) == solver.find_first_pair_fast(nums, target)
@@ -0,0 +1,76 @@
+"""Tests for the sorted-input two-pointer and galloping engines."""
+
+import numpy as np
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, two_sum_fast, two_sum_generator
+from src.fp_gym.presorted import is_sorted, sorted_first, sorted_pairs
+
+sorted_lists = st.lists(st.integers(min_value=-30, max_value=30), max_size=80).map(sorted)
+targets = st.integers(min_value=-60, max_value=60)
+
+
+class TestSortedEngines:
+    """Test cases for the sorted-input engines."""
+
+    @given(sorted_lists, targets)
+    def test_pairs_match_generator(self, nums, target):
+        """Property: the two-pointer sweep yields exactly the generator's pairs."""
+        assert list(sorted_pairs(nums, target)) == list(two_sum_generator(nums, target))
+
+    @given(sorted_lists, targets)
+    def test_first_matches_two_sum_fast(self, nums, target):
+        """Property: galloping and walking both find the same first pair."""
+        expected = two_sum_fast(nums, target)
+        assert sorted_first(nums, target) == expected
+        assert sorted_first(nums, target, gallop=False) == expected
+
+    def test_duplicates_of_half_target(self):
+        """Test that equal halves pair with the latest earlier copy."""
+        pairs = [r.indices for r in sorted_pairs([1, 3, 3, 3, 5], 6)]
+        assert pairs == [(1, 2), (2, 3), (0, 4)]
+
+    def test_numpy_input(self):
+        """Test that sorted NumPy arrays are accepted."""
+        nums = np.arange(0, 100, 3)
+        assert is_sorted(nums)
+        assert sorted_first(nums, 99).indices == two_sum_fast(nums.tolist(), 99).indices
+
+    def test_is_sorted(self):
+        """Test the full sortedness check."""
+        assert is_sorted([]) and is_sorted([1]) and is_sorted([1, 1, 2])
+        assert not is_sorted([1, 3, 2])
+        assert not is_sorted(np.array([2, 1]))
+
+
+class TestPresortedSolver:
+    """Test cases for presorted mode on TwoSumSolver."""
+
+    def setup_method(self):
+        self.solver = TwoSumSolver()
+
+    @given(sorted_lists, targets)
+    def test_presorted_flag(self, nums, target):
+        """Property: declaring the input sorted does not change results."""
+        reference = TwoSumSolver()
+        assert self.solver.find_all_pairs(nums, target, presorted=True) == (
+            reference.find_all_pairs(nums, target)
+        )
+        assert self.solver.count_pairs(nums, target, presorted=True) == (
+            reference.count_pairs(nums, target)
+        )
+        assert self.solver.find_first_pair(nums, target, presorted=True) == (
+            reference.find_first_pair(nums, target)
+        )
+
+    def test_auto_detects_sorted_input(self):
+        """Test that auto picks the sorted engine only after verifying order."""
+        solver = TwoSumSolver(backend="auto")
+        nums = list(range(0, 3000, 3))
+        assert solver.find_first_pair_fast(nums, 2997).indices == (499, 500)
+        assert solver.last_choice.engine == "sorted"
+
+        nums[-1] = -1
+        solver.find_first_pair_fast(nums, 2997)
+        assert solver.last_choice.engine == "python"
@@ -0,0 +1,122 @@
+"""Tests for the opt-in solver instrumentation."""
+
+import numpy as np
+import pytest
+
+from src.fp_gym import TwoSumSolver, two_sum_generator
+from src.fp_gym.arrays.find_missing_repeating import (
+    find_missing_repeating,
+    find_missing_repeating_chunked,
+    find_missing_repeating_optimal,
+    find_missing_repeating_vectorized,
+)
+from src.fp_gym.profiling import SolveStats
+
+
+class TestTwoSumGeneratorStats:
+    """Test cases for two_sum_generator(stats=...)."""
+
+    def test_counters(self):
+        """Test that the instrumented scan reports what it did, with the same pairs."""
+        nums = [1, 2, 1, 2, 7]
+        stats = SolveStats()
+        results = list(two_sum_generator(nums, 3, stats=stats))
+        assert results == list(two_sum_generator(nums, 3))
+        assert stats.elements_scanned == 5
+        assert stats.table_size == stats.table_high_water == 3
+        assert stats.table_bytes > 0
+        assert stats.pairs_emitted == 3
+        assert 0 <= stats.first_pair_ns <= stats.total_ns
+        assert "3 pairs" in stats.summary()
+
+    def test_early_close_and_consumer_time(self):
+        """Test that closing early stops the counters where the consumer left."""
+        stats = SolveStats()
+        pairs = two_sum_generator([1, 2, 1, 2, 7], 3, lazy_values=True, stats=stats)
+        assert next(pairs).values == (1, 2)
+        pairs.close()
+        assert stats.elements_scanned == 2
+        assert stats.pairs_emitted == 1
+        assert 0 <= stats.busy_ns <= stats.total_ns
+        assert stats.consumer_ns > 0
+
+    def test_no_pair(self):
+        """Test that first_pair_ns stays unset without output."""
+        stats = SolveStats()
+        assert list(two_sum_generator([2, 4, 6], 1, stats=stats)) == []
+        assert stats.first_pair_ns is None
+        assert stats.elements_scanned == 3
+
+
+class TestSolverStats:
+    """Test cases for TwoSumSolver(on_stats=...)."""
+
+    def setup_method(self):
+        self.reports = []
+
+    @pytest.mark.parametrize("backend", ["python", "nested", "sorted", "dense", "numpy"])
+    def test_each_engine_reports(self, backend):
+        """Test that every method reports once per engine run, with unchanged results."""
+        nums, target = [1, 2, 3, 4, 5, 6], 7
+        solver = TwoSumSolver(backend, on_stats=self.reports.append)
+        plain = TwoSumSolver(backend)
+        assert solver.find_all_pairs(nums, target) == plain.find_all_pairs(nums, target)
+        assert solver.count_pairs(nums, target) == plain.count_pairs(nums, target)
+        assert solver.find_first_pair_fast(nums, target) == plain.find_first_pair_fast(
+            nums, target
+        )
+        assert list(solver.solve_with_stack_safety(nums, target, 1)) == list(
+            plain.solve_with_stack_safety(nums, target, 1)
+        )
+        assert [r.operation for r in self.reports] == [
+            "find_all_pairs",
+            "count_pairs",
+            "find_first_pair",
+            "solve_with_stack_safety",
+        ]
+        assert all(r.engine == backend for r in self.reports)
+        assert [r.pairs_emitted for r in self.reports] == [3, 3, 1, 1]
+        assert self.reports[0].elements_scanned == 6
+
+    @pytest.mark.parametrize("backend", ["python", "numpy"])
+    def test_no_results_requested(self, backend) -> None:
+        """Test that max_results=0 still reports one empty run."""
+        solver = TwoSumSolver(backend, on_stats=self.reports.append)
+        assert list(solver.solve_with_stack_safety([1, 2, 3, 4], 5, 0)) == []
+        assert [(r.operation, r.engine) for r in self.reports] == [
+            ("solve_with_stack_safety", backend)
+        ]
+        assert self.reports[0].pairs_emitted == self.reports[0].elements_scanned == 0
+
+    def test_first_pair_scans_prefix(self):
+        """Test that a first-pair search on the python engine reports an early exit."""
+        solver = TwoSumSolver(on_stats=self.reports.append)
+        solver.find_first_pair([3, 4, 1, 1, 1, 1], 7)
+        assert self.reports[0].elements_scanned == 2
+
+    def test_disabled_by_default(self):
+        """Test that nothing is recorded without a callback."""
+        assert TwoSumSolver().on_stats is None
+
+
+class TestMissingRepeatingStats:
+    """Test cases for find_missing_repeating*(stats=...)."""
+
+    @pytest.mark.parametrize(
+        "solve, table",
+        [
+            (find_missing_repeating, 5),
+            (lambda arr, stats: find_missing_repeating_optimal(list(arr), stats=stats), 0),
+            (lambda arr, stats: find_missing_repeating_chunked([arr[:3], arr[3:]], stats=stats), 0),
+            (lambda arr, stats: find_missing_repeating_vectorized(np.array(arr), stats=stats), 0),
+        ],
+    )
+    def test_variants(self, solve, table):
+        """Test that each variant records its scan and keeps its answer."""
+        arr = [4, 3, 6, 2, 1, 1]
+        stats = SolveStats()
+        assert solve(arr, stats=stats) == (5, 1)
+        assert stats.elements_scanned == 6
+        assert stats.table_size == table
+        assert stats.total_ns > 0
+        assert stats.operation.startswith("find_missing_repeating")
@@ -0,0 +1,120 @@
+"""Tests for memory-mapped two sum index snapshots."""
+
+import stat
+import struct
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.fp_gym import MappedTwoSumIndex, TwoSumIndex
+from src.fp_gym.snapshot import MAGIC
+
+
+def answers(index, targets):
+    return [index.query_fast(target) for target in targets]
+
+
+class TestMappedTwoSumIndex:
+    """Test cases for saving and mapping a TwoSumIndex."""
+
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(st.integers(min_value=-30, max_value=30), max_size=80))
+    def test_matches_built_index(self, tmp_path_factory, nums):
+        """Property: a mapped snapshot answers every query like the index it came from."""
+        path = tmp_path_factory.mktemp("snapshot") / "nums.idx"
+        index = TwoSumIndex(nums)
+        index.save(path)
+        targets = list(range(-62, 63))
+        with MappedTwoSumIndex(path) as mapped:
+            assert len(mapped) == len(index)
+            assert mapped.distinct == index.distinct
+            assert answers(mapped, targets) == answers(index, targets)
+            assert mapped.query_many(targets) == index.query_many(targets)
+            for value in range(-31, 32):
+                assert mapped.positions(value) == index.positions(value)
+
+    def test_query(self, tmp_path):
+        path = tmp_path / "nums.idx"
+        TwoSumIndex([2, 7, 11, 15]).save(path)
+        with MappedTwoSumIndex(path) as index:
+            assert index.query(9).unwrap().indices == (0, 1)
+            assert index.query(26).unwrap().values == (11, 15)
+            assert index.query_fast(100) is None
+
+    def test_empty(self, tmp_path):
+        path = tmp_path / "empty.idx"
+        TwoSumIndex([]).save(path)
+        with MappedTwoSumIndex(path) as index:
+            assert len(index) == 0
+            assert index.query_fast(0) is None
+            assert index.query_many([0, 1]) == TwoSumIndex([]).query_many([0, 1])
+
+    def test_extreme_values(self, tmp_path):
+        """Complements beyond int64 simply miss."""
+        nums = [2**63 - 1, -(2**63), 0, 1]
+        path = tmp_path / "extreme.idx"
+        TwoSumIndex(nums).save(path)
+        with MappedTwoSumIndex(path) as index:
+            assert index.query_fast(-1).indices == (0, 1)
+            assert index.query_fast(2**64) is None
+
+    def test_resave_is_identical(self, tmp_path):
+        """A mapped index saves back to the same bytes."""
+        first, second = tmp_path / "a.idx", tmp_path / "b.idx"
+        TwoSumIndex([5, 1, 5, 5, -3, 8]).save(first)
+        with MappedTwoSumIndex(first) as index:
+            index.save(second)
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_replacing_keeps_open_mappings(self, tmp_path):
+        """Saving over a mapped file renames a new file into place."""
+        path = tmp_path / "nums.idx"
+        TwoSumIndex([1, 2, 3]).save(path)
+        with MappedTwoSumIndex(path) as old:
+            TwoSumIndex([10, 20]).save(path)
+            assert old.query_fast(3).indices == (0, 1)
+            with MappedTwoSumIndex(path) as new:
+                assert new.query_fast(30).indices == (0, 1)
+                assert new.query_fast(3) is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["nums.idx"]
+
+    def test_file_mode_follows_umask(self, tmp_path):
+        """A snapshot gets the permissions of any other newly created file."""
+        reference = tmp_path / "reference"
+        reference.touch()
+        path = tmp_path / "nums.idx"
+        TwoSumIndex([1, 2, 3]).save(path)
+        assert stat.S_IMODE(path.stat().st_mode) == stat.S_IMODE(reference.stat().st_mode)
+
+    def test_close_after_vectorized_queries(self, tmp_path):
+        path = tmp_path / "nums.idx"
+        TwoSumIndex(list(range(100))).save(path)
+        index = MappedTwoSumIndex(path)
+        index.query_many([3, 50, 197])
+        index.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "bad.idx"
+        path.write_bytes(b"\0" * 128)
+        with pytest.raises(ValueError, match="not a two sum index"):
+            MappedTwoSumIndex(path)
+        path.write_bytes(b"short")
+        with pytest.raises(ValueError, match="not a two sum index"):
+            MappedTwoSumIndex(path)
+
+    def test_rejects_other_versions(self, tmp_path):
+        path = tmp_path / "nums.idx"
+        TwoSumIndex([1, 2]).save(path)
+        data = bytearray(path.read_bytes())
+        struct.pack_into("=I", data, len(MAGIC), 99)
+        path.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="version 99"):
+            MappedTwoSumIndex(path)
+
+    def test_rejects_truncated(self, tmp_path):
+        path = tmp_path / "nums.idx"
+        TwoSumIndex([1, 2, 3]).save(path)
+        path.write_bytes(path.read_bytes()[:-8])
+        with pytest.raises(ValueError, match="truncated"):
+            MappedTwoSumIndex(path)
@@ -0,0 +1,107 @@
+"""Tests for streaming two sum with bounded memory."""
+
+import asyncio
+import itertools
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.fp_gym import two_sum_generator
+from src.fp_gym.streaming import StreamStats, two_sum_stream, two_sum_stream_async
+
+
+def windowed_reference(nums, target, window):
+    """Pairs whose left index is within the last ``window`` elements."""
+    pairs = []
+    for i, num in enumerate(nums):
+        for j in range(i - 1, max(-1, i - window - 1), -1):
+            if nums[j] == target - num:
+                pairs.append((j, i))
+                break
+    return pairs
+
+
+class TestTwoSumStream:
+    """Test cases for two_sum_stream."""
+
+    @given(st.lists(st.integers(min_value=-20, max_value=20), max_size=60),
+           st.integers(min_value=-40, max_value=40))
+    def test_unbounded_matches_generator(self, nums, target):
+        """Property: with no bound the stream equals the generator."""
+        assert list(two_sum_stream(iter(nums), target)) == list(two_sum_generator(nums, target))
+
+    @given(st.lists(st.integers(min_value=-5, max_value=5), max_size=60),
+           st.integers(min_value=-10, max_value=10),
+           st.integers(min_value=1, max_value=8))
+    def test_window_matches_reference(self, nums, target, window):
+        """Property: a sliding window limits how far back complements are found."""
+        results = two_sum_stream(nums, target, window=window)
+
+        assert [r.indices for r in results] == windowed_reference(nums, target, window)
+
+    def test_endless_stream_with_window(self) -> None:
+        """Test memory stays bounded on an endless stream and pairs are emitted."""
+        stats = StreamStats()
+        source = itertools.count()
+        pairs = two_sum_stream(source, 2001, window=10, stats=stats)
+
+        first = next(pairs)
+
+        assert first.indices == (1000, 1001)
+        assert stats.peak_table_size <= 11
+        assert stats.evicted == stats.scanned - stats.table_size
+
+    def test_max_entries_drops_least_recent(self) -> None:
+        """Test an LRU cap forgets the value seen least recently."""
+        stats = StreamStats()
+        nums = [1, 2, 1, 3, 9, 8]
+
+        results = list(two_sum_stream(nums, 10, max_entries=2, stats=stats))
+
+        # 1 was seen again after 2, so 2 is dropped when 3 arrives and 1 survives to pair with 9
+        assert [r.indices for r in results] == [(2, 4)]
+        assert stats.table_size == 2
+        assert stats.evicted == 3
+
+    def test_max_age_with_fake_clock(self) -> None:
+        """Test age-based expiry with a controllable clock."""
+        ticks = iter([0.0, 4.0, 5.0, 5.5])
+        stats = StreamStats()
+
+        results = list(
+            two_sum_stream([4, 3, 6, 7], 10, max_age=2.0, clock=lambda: next(ticks), stats=stats)
+        )
+
+        # 4 expired before 6 arrived; 3 is still young enough for 7
+        assert [r.indices for r in results] == [(1, 3)]
+        assert stats.evicted == 1
+
+    def test_invalid_bounds(self) -> None:
+        """Test bound validation."""
+        for kwargs in ({"window": 0}, {"max_entries": 0}, {"max_age": 0}):
+            with pytest.raises(ValueError):
+                list(two_sum_stream([1], 2, **kwargs))
+
+
+class TestTwoSumStreamAsync:
+    """Test cases for two_sum_stream_async."""
+
+    def test_async_source(self) -> None:
+        """Test pairs are yielded from an async iterable."""
+
+        async def numbers():
+            for num in [2, 7, 11, 15, 3, 6]:
+                await asyncio.sleep(0)
+                yield num
+
+        async def collect():
+            return [r async for r in two_sum_stream_async(numbers(), 9, window=3)]
+
+        results = asyncio.run(collect())
+
+        assert [r.indices for r in results] == [(0, 1), (4, 5)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
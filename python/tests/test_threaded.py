@@ -0,0 +1,214 @@
+"""Tests for the thread-parallel engine."""
+
+import random
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.fp_gym import TwoSumSolver, threaded
+from src.fp_gym.arrays import find_missing_repeating as missing_repeating
+from src.fp_gym.arrays.find_missing_repeating import find_missing_repeating_threaded
+from src.fp_gym.dispatch import Dispatcher, Thresholds
+from src.fp_gym.profiling import SolveStats
+from src.fp_gym.threaded import (
+    chunk_bounds,
+    count_pairs_threaded,
+    default_workers,
+    gil_enabled,
+    two_sum_threaded,
+)
+from tests.helpers import missing_repeating_input, pairs, random_ints, reference_pairs
+
+
+class TestTwoSumThreaded:
+    """Test cases for two_sum_threaded and count_pairs_threaded."""
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """Share one small pool across the tests."""
+        cls.pool = ThreadPoolExecutor(max_workers=3)
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """Shut the shared pool down."""
+        cls.pool.shutdown()
+
+    def setup_method(self) -> None:
+        """Shard even the smallest inputs."""
+        self.min_parallel = threaded.MIN_PARALLEL
+        threaded.MIN_PARALLEL = 0
+
+    def teardown_method(self) -> None:
+        """Restore the parallel threshold."""
+        threaded.MIN_PARALLEL = self.min_parallel
+
+    @settings(max_examples=100, deadline=None)
+    @given(
+        st.lists(st.integers(min_value=-30, max_value=30), max_size=120),
+        st.integers(min_value=-60, max_value=60),
+        st.integers(min_value=2, max_value=5),
+    )
+    def test_matches_generator(self, nums, target, workers) -> None:
+        """Test that sharded threads give the generator's pairs in its order."""
+        expected = reference_pairs(nums, target)
+        actual = two_sum_threaded(nums, target, workers, executor=self.pool)
+        assert pairs(actual) == expected
+        assert count_pairs_threaded(nums, target, workers, executor=self.pool) == len(expected)
+
+    def test_skewed_and_unbounded_values(self) -> None:
+        """Test that a hot value and values beyond int64 need no special path."""
+        rng = random.Random(5)
+        for nums, target in (
+            ([5] * 300 + [1, 9, 5], 10),
+            (random_ints(rng, 200, -(2**70), 2**70) + [2**80, -(2**80)], 0),
+        ):
+            expected = reference_pairs(nums, target)
+            assert pairs(two_sum_threaded(nums, target, 4)) == expected
+            assert count_pairs_threaded(nums, target, 4) == len(expected)
+
+    def test_buffers(self) -> None:
+        """Test that buffers give the same pairs as lists."""
+        nums = array("q", [3, 8, -2, 5, 5, 0, 7, 1, 3])
+        expected = reference_pairs(nums, 8)
+        assert pairs(two_sum_threaded(memoryview(nums), 8, 2)) == expected
+
+    def test_single_thread_stays_on_caller(self, monkeypatch) -> None:
+        """Test that no pool is started for one worker."""
+        monkeypatch.setattr(threaded, "ThreadPoolExecutor", None)
+        assert two_sum_threaded([2, 7, 11, 15], 9, 1)[0].indices == (0, 1)
+        assert count_pairs_threaded([1, 1, 1], 2, 1) == 2
+
+    @pytest.mark.parametrize("workers", [0, -1])
+    def test_rejects_bad_workers(self, workers) -> None:
+        """Test that fewer than one worker is rejected rather than read as the default."""
+        with pytest.raises(ValueError, match="workers"):
+            two_sum_threaded([2, 7, 11, 15], 9, workers)
+        with pytest.raises(ValueError, match="workers"):
+            count_pairs_threaded([2, 7, 11, 15], 9, workers)
+
+    def test_default_workers_when_none(self, monkeypatch) -> None:
+        """Test that workers=None picks default_workers()."""
+        monkeypatch.setattr(threaded, "default_workers", lambda: 1)
+        monkeypatch.setattr(threaded, "ThreadPoolExecutor", None)
+        assert two_sum_threaded([2, 7, 11, 15], 9)[0].indices == (0, 1)
+        assert count_pairs_threaded([1, 1, 1], 2) == 2
+
+    def test_chunk_bounds(self) -> None:
+        """Test how inputs are split into chunks."""
+        assert chunk_bounds(10, 3) == [(0, 4), (4, 8), (8, 10)]
+        assert chunk_bounds(2, 5) == [(0, 1), (1, 2)]
+        assert chunk_bounds(0, 4) == []
+
+
+class TestGilDetection:
+    """Test cases for gil_enabled and default_workers."""
+
+    def test_default_build(self, monkeypatch) -> None:
+        """Test that the default build reports the GIL and one worker."""
+        monkeypatch.delattr(sys, "_is_gil_enabled", raising=False)
+        assert gil_enabled()
+        assert default_workers() == 1
+
+    def test_free_threaded_build(self, monkeypatch) -> None:
+        """Test that a free-threaded build gets one worker per CPU."""
+        monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+        monkeypatch.setattr(threaded.os, "cpu_count", lambda: 6)
+        assert not gil_enabled()
+        assert default_workers() == 6
+
+    def test_dispatch_needs_free_threading(self, monkeypatch) -> None:
+        """Test that auto dispatch picks threads for large inputs only when the GIL is off."""
+        dispatcher = Dispatcher(Thresholds(numpy_min=10**9, thread_min=1000))
+        nums = [1000 * i for i in range(2000, 0, -1)]
+        monkeypatch.setattr(threaded, "gil_enabled", lambda: True)
+        assert dispatcher.choose(nums, "all").engine == "python"
+        monkeypatch.setattr(threaded, "gil_enabled", lambda: False)
+        assert dispatcher.choose(nums, "all").engine == "thread"
+        assert dispatcher.choose(nums, "first").engine == "python"
+        assert dispatcher.choose(nums[:500], "all").engine == "python"
+
+
+class TestThreadBackend:
+    """Test cases for TwoSumSolver(backend="thread")."""
+
+    nums = [3, 8, -2, 5, 5, 0, 7, 1, 3] * 50
+    target = 8
+
+    def setup_method(self) -> None:
+        """Shard even the smallest inputs."""
+        self.min_parallel = threaded.MIN_PARALLEL
+        threaded.MIN_PARALLEL = 0
+
+    def teardown_method(self) -> None:
+        """Restore the parallel threshold."""
+        threaded.MIN_PARALLEL = self.min_parallel
+
+    def test_matches_python_backend(self) -> None:
+        """Test that the thread backend gives the python backend's answers."""
+        solver, reference = TwoSumSolver("thread", workers=3), TwoSumSolver()
+        assert solver.find_all_pairs(self.nums, self.target) == reference.find_all_pairs(
+            self.nums, self.target
+        )
+        assert solver.count_pairs(self.nums, self.target) == reference.count_pairs(
+            self.nums, self.target
+        )
+        assert solver.find_first_pair_fast(self.nums, self.target).indices == (0, 3)
+
+    def test_stats(self) -> None:
+        """Test that the thread engine is reported in the solver's stats."""
+        reports = []
+        solver = TwoSumSolver("thread", workers=2, on_stats=reports.append)
+        count = solver.count_pairs(self.nums, self.target)
+        solver.find_all_pairs(self.nums, self.target)
+        assert [(s.operation, s.engine) for s in reports] == [
+            ("count_pairs", "thread"),
+            ("find_all_pairs", "thread"),
+        ]
+        assert reports[0].pairs_emitted == count
+
+
+class TestFindMissingRepeatingThreaded:
+    """Test cases for find_missing_repeating_threaded."""
+
+    def setup_method(self) -> None:
+        """Split even the smallest inputs into many chunks."""
+        self.chunk = missing_repeating._THREAD_CHUNK
+        missing_repeating._THREAD_CHUNK = 7
+
+    def teardown_method(self) -> None:
+        """Restore the chunk size."""
+        missing_repeating._THREAD_CHUNK = self.chunk
+
+    @settings(max_examples=50, deadline=None)
+    @given(missing_repeating_input(), st.integers(min_value=1, max_value=4))
+    def test_matches_sequential(self, case, workers) -> None:
+        """Test that many small chunks across threads give the single-thread answer."""
+        arr, missing, repeating = case
+        assert find_missing_repeating_threaded(arr, workers) == (missing, repeating)
+
+    def test_buffer_and_pool(self) -> None:
+        """Test buffer input and a caller-supplied pool."""
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            arr = array("q", [4, 3, 6, 2, 1, 1])
+            assert find_missing_repeating_threaded(arr, 2, executor=pool) == (5, 1)
+
+    def test_stats(self) -> None:
+        """Test that the threaded solver fills in SolveStats."""
+        stats = SolveStats()
+        assert find_missing_repeating_threaded([3, 1, 3], 2, stats=stats) == (2, 3)
+        assert stats.operation == "find_missing_repeating_threaded"
+        assert stats.elements_scanned == 3
+
+    def test_rejects_bad_workers(self) -> None:
+        """Test that fewer than one worker is rejected."""
+        with pytest.raises(ValueError, match="workers"):
+            find_missing_repeating_threaded([3, 1, 3], 0)
+
+    def test_no_repeating_element(self) -> None:
+        """Test that a permutation without a repeat is rejected."""
+        with pytest.raises(ValueError, match="no repeating"):
+            find_missing_repeating_threaded([1, 2, 3], 2)
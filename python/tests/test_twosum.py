@@ -1,9 +1,13 @@
 """Tests for the two sum implementation."""
 
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from returns.maybe import Nothing, Some
 
-from src.fp_gym import TwoSumSolver, two_sum, two_sum_generator
+from src.fp_gym import TwoSumSolver, two_sum, two_sum_fast, two_sum_generator
 from src.fp_gym.solver import TwoSumResult
 
 
@@ -119,6 +123,47 @@ class TestTwoSumMaybe:
         assert result is Nothing
 
 
+class TestTwoSumFast:
+    """Test cases for the low-overhead two sum entry point."""
+
+    def test_found(self) -> None:
+        """Test that a plain result is returned."""
+        result = two_sum_fast([2, 7, 11, 15], 9)
+
+        assert result is not None
+        assert result.indices == (0, 1)
+        assert result.values == (2, 7)
+
+    def test_not_found(self) -> None:
+        """Test that None is returned when there is no pair."""
+        assert two_sum_fast([1, 2, 3, 4], 10) is None
+        assert two_sum_fast([], 0) is None
+
+    def test_matches_maybe_api(self) -> None:
+        """Test agreement with two_sum and the solver."""
+        nums = [3, 3, 1, 5, 2]
+        solver = TwoSumSolver()
+
+        for target in range(-2, 12):
+            fast = two_sum_fast(nums, target)
+            maybe = two_sum(nums, target)
+            assert solver.find_first_pair_fast(nums, target) == fast
+            if fast is None:
+                assert maybe is Nothing
+            else:
+                assert maybe.unwrap() == fast
+
+    def test_import_does_not_load_returns(self) -> None:
+        """Test that importing the package leaves returns unimported."""
+        code = (
+            "import sys; import src.fp_gym as m; m.two_sum_fast([1, 2], 3); "
+            "sys.exit('returns' in sys.modules)"
+        )
+        root = Path(__file__).resolve().parents[1]
+
+        assert subprocess.run([sys.executable, "-c", code], cwd=root).returncode == 0
+
+
 class TestTwoSumSolver:
     """Test cases for the TwoSumSolver class."""
 
@@ -237,6 +282,35 @@ class TestTwoSumResult:
         assert "(0, 1)" in repr_str
         assert "(2, 7)" in repr_str
 
+    def test_two_sum_result_is_slotted(self) -> None:
+        """Test that results carry no per-instance __dict__."""
+        result = TwoSumResult((0, 1), (2, 7))
+
+        assert not hasattr(result, "__dict__")
+
+    def test_two_sum_result_lazy_values(self) -> None:
+        """Test values read from a source sequence on first access."""
+        nums = [2, 7, 11, 15]
+        result = TwoSumResult((0, 1), source=nums)
+
+        assert result.values == (2, 7)
+        assert result == TwoSumResult((0, 1), (2, 7))
+
+    def test_two_sum_result_without_values(self) -> None:
+        """Test that a result with neither values nor source fails on access."""
+        result = TwoSumResult((0, 1))
+
+        with pytest.raises(TypeError):
+            _ = result.values
+
+    def test_lazy_generator_matches_eager(self) -> None:
+        """Test the lazy-values fast path yields the same results."""
+        nums = [1, 2, 3, 2, 1, 0, 3]
+
+        assert list(two_sum_generator(nums, 3, lazy_values=True)) == list(
+            two_sum_generator(nums, 3)
+        )
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,146 @@
+"""Tests for the NumPy-vectorized two sum engine."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from returns.maybe import Nothing, Some
+
+np = pytest.importorskip("numpy")
+
+from src.fp_gym import TwoSumSolver, two_sum_generator  # noqa: E402
+from src.fp_gym.vectorized import two_sum_arrays  # noqa: E402
+
+
+def as_tuples(pairs):
+    """Flatten TwoSumArrays into (indices, values) tuples for comparison."""
+    return [
+        ((j, i), (a, b))
+        for j, i, a, b in zip(
+            pairs.left_indices.tolist(),
+            pairs.right_indices.tolist(),
+            pairs.left_values.tolist(),
+            pairs.right_values.tolist(),
+        )
+    ]
+
+
+def reference(nums, target):
+    """Pairs produced by the pure-Python generator."""
+    return [(r.indices, r.values) for r in two_sum_generator(list(nums), target)]
+
+
+class TestTwoSumArrays:
+    """Test cases for two_sum_arrays."""
+
+    def test_basic_pair(self) -> None:
+        """Test the classic example."""
+        pairs = two_sum_arrays([2, 7, 11, 15], 9)
+
+        assert as_tuples(pairs) == [((0, 1), (2, 7))]
+        assert pairs.size == 1
+
+    def test_empty_and_single(self) -> None:
+        """Test inputs too short to hold a pair."""
+        assert two_sum_arrays([], 0).size == 0
+        assert two_sum_arrays([5], 10).size == 0
+
+    def test_repeated_values_use_latest_index(self) -> None:
+        """Test that the latest earlier complement is paired, like the generator."""
+        nums = [1, 3, 1, 3, 2, 2]
+
+        assert as_tuples(two_sum_arrays(nums, 4)) == reference(nums, 4)
+
+    def test_accepts_numpy_arrays(self) -> None:
+        """Test int32 and uint8 arrays are accepted directly."""
+        nums = [4, 1, 3, 0, 2]
+        for dtype in (np.int64, np.int32, np.uint8):
+            assert as_tuples(two_sum_arrays(np.array(nums, dtype=dtype), 4)) == reference(nums, 4)
+
+    def test_wide_value_range(self) -> None:
+        """Test values spread over the whole int64 range."""
+        nums = [2**62, -(2**62), 5, 2**62, -5, 0]
+
+        assert as_tuples(two_sum_arrays(nums, 0)) == reference(nums, 0)
+
+    @pytest.mark.parametrize("spread", [2**20, 2**60])
+    def test_partly_paired_values(self, spread) -> None:
+        """Test the presence table keeps every element that has a complement."""
+        rng = np.random.default_rng(4)
+        values = rng.integers(-spread, spread, 3000)
+        nums = rng.permutation(np.concatenate((values, 7 - values[:500], values[:40])))
+
+        assert as_tuples(two_sum_arrays(nums, 7)) == reference(nums.tolist(), 7)
+
+    def test_values_beyond_int64_fall_back(self) -> None:
+        """Test inputs whose complements overflow int64 still match the generator."""
+        nums = [2**63 - 1, -(2**63), 1, 2**63 - 2]
+
+        assert as_tuples(two_sum_arrays(nums, 2**63 - 1)) == reference(nums, 2**63 - 1)
+
+    def test_rejects_float_arrays(self) -> None:
+        """Test non-integer arrays are rejected."""
+        with pytest.raises(TypeError):
+            two_sum_arrays(np.array([1.0, 2.0]), 3)
+
+    @given(st.lists(st.integers(min_value=-50, max_value=50), max_size=60),
+           st.integers(min_value=-100, max_value=100))
+    def test_matches_generator_dense(self, nums, target):
+        """Property: dense inputs give exactly the generator's pairs."""
+        assert as_tuples(two_sum_arrays(nums, target)) == reference(nums, target)
+
+    @given(st.lists(st.integers(min_value=-(2**62), max_value=2**62), max_size=40),
+           st.integers(min_value=-(2**62), max_value=2**62))
+    def test_matches_generator_sparse(self, nums, target):
+        """Property: sparse inputs give exactly the generator's pairs."""
+        nums = nums + [target - v for v in nums[:3]]
+        assert as_tuples(two_sum_arrays(nums, target)) == reference(nums, target)
+
+
+class TestNumpyBackend:
+    """Test cases for TwoSumSolver with the numpy backend."""
+
+    def setup_method(self) -> None:
+        """Set up test fixtures."""
+        self.solver = TwoSumSolver(backend="numpy")
+        self.reference = TwoSumSolver()
+
+    def test_unknown_backend(self) -> None:
+        """Test that an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            TwoSumSolver(backend="fortran")  # type: ignore[arg-type]
+
+    def test_find_first_pair(self) -> None:
+        """Test first pair lookup with and without a solution."""
+        result = self.solver.find_first_pair([2, 7, 11, 15], 9)
+
+        assert isinstance(result, Some)
+        assert result.unwrap().indices == (0, 1)
+        assert self.solver.find_first_pair([1, 2, 3], 10) is Nothing
+
+    def test_values_beyond_int64(self) -> None:
+        """Test pairs of values beyond int64 fall back to the python backend."""
+        nums = [2**70, 3, -(2**70) + 5, 2**70, 2]
+        stats = []
+        observed = TwoSumSolver(backend="numpy", on_stats=stats.append)
+
+        for solver in (self.solver, observed):
+            assert solver.find_all_pairs(nums, 5) == self.reference.find_all_pairs(nums, 5)
+            assert solver.count_pairs(nums, 5) == 3
+            assert solver.find_first_pair(nums, 5) == self.reference.find_first_pair(nums, 5)
+        assert [s.pairs_emitted for s in stats] == [3, 3, 1]
+
+    @given(st.lists(st.integers(min_value=-20, max_value=20), max_size=40),
+           st.integers(min_value=-40, max_value=40))
+    def test_methods_match_python_backend(self, nums, target):
+        """Property: every solver method agrees with the python backend."""
+        assert self.solver.find_all_pairs(nums, target) == self.reference.find_all_pairs(
+            nums, target
+        )
+        assert self.solver.count_pairs(nums, target) == self.reference.count_pairs(nums, target)
+        assert list(self.solver.solve_with_stack_safety(nums, target, 2)) == list(
+            self.reference.solve_with_stack_safety(nums, target, 2)
+        )
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])